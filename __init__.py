@@ -14,7 +14,7 @@ from visualization.insights_formatter import InsightsFormatter
 __version__ = '2.0.0'
 __author__ = 'BRICH 김도준'
 
-def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
+def create_analysis_workflow(file, output_folder='bflow_reports', config=None, keep_data=False, chart_cache=None):
     """
     파일에서 분석, 대시보드 생성까지의 전체 워크플로우를 생성
 
@@ -22,6 +22,8 @@ def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
     - file: 엑셀 파일 경로
     - output_folder: 결과물 저장 폴더
     - config: 설정 객체 (None이면 기본 설정 사용)
+    - keep_data: True이면 분석 후에도 원본 데이터프레임을 분석기에 유지
+    - chart_cache: 여러 워크플로우가 공유할 ChartCache (None이면 설정에 따라 출력 폴더에 생성)
 
     Returns:
     - 분석 워크플로우 구성요소 딕셔너리
@@ -35,12 +37,15 @@ def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
     analyzer = BflowAnalyzer(config)
     analyzer.load_data(file)
     insights = analyzer.analyze_data()
+    if not keep_data:
+        # 이후 단계는 집계 결과만 사용하므로 원본 데이터프레임 해제
+        analyzer.release_data()
 
     # InsightsFormatter 인스턴스 생성 (재사용을 위해)
     formatter = InsightsFormatter(insights)
 
     # 대시보드 생성기에 formatter 전달
-    dashboard_gen = DashboardGenerator(insights, formatter, output_folder, config)
+    dashboard_gen = DashboardGenerator(insights, formatter, output_folder, config, chart_cache)
 
     return {
         'analyzer': analyzer,
@@ -0,0 +1,132 @@
+"""
+차트 렌더링/PDF 변환 경로 벤치마크
+
+1) 차트 마크업 생성: 정적 SVG 렌더러와 Plotly 차트 생성기(그림 객체 + HTML 변환)의
+   대시보드 차트 8개 생성 시간을 비교합니다.
+2) PDF 변환 (--snapshot 지정 시): 같은 분석 결과 스냅샷으로
+   - JavaScript 차트 HTML -> Playwright(브라우저)
+   - 정적 SVG 차트 HTML -> WeasyPrint(브라우저 없음)
+   두 경로의 PDF 생성 시간을 비교합니다. 설치되지 않은 엔진은 건너뜁니다.
+
+사용법:
+    python benchmarks/chart_render_benchmark.py
+    python benchmarks/chart_render_benchmark.py --repeat 200
+    python benchmarks/chart_render_benchmark.py --snapshot bflow_reports/dashboard_x.insights.npz
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from visualization.chart_generator import ChartFactory
+
+CHART_NAMES = ('product', 'color', 'price', 'size', 'material', 'design', 'channel', 'bestseller')
+
+
+def synthetic_charts(items=10, seed=42):
+    """대시보드 차트 8개 분량의 합성 차트 데이터"""
+    rng = np.random.default_rng(seed)
+    return {
+        name: [
+            {'name': f"{name} 항목 {index + 1} / 긴 상품명 예시 텍스트", 'value': int(value)}
+            for index, value in enumerate(sorted(rng.integers(10, 5000, items), reverse=True))
+        ]
+        for name in CHART_NAMES
+    }
+
+
+def measure(label, func, repeat):
+    """함수를 repeat번 실행한 평균 시간 출력"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<44}{elapsed * 1000:>10.2f}ms")
+    return elapsed, result
+
+
+def bench_markup(repeat):
+    """차트 8개 마크업 생성 시간 비교"""
+    charts = synthetic_charts()
+    print(f"[차트 마크업 생성] 차트 {len(charts)}개 x {repeat}회 평균\n")
+
+    svg_renderer = ChartFactory.get_svg_renderer('horizontal_bar')
+    svg_time, svg_markup = measure(
+        'SVG 렌더러 (SvgHorizontalBarChart)',
+        lambda: [svg_renderer.render(data) for data in charts.values()],
+        repeat
+    )
+
+    plotly_generator = ChartFactory.get_chart_generator('horizontal_bar')
+    plotly_repeat = max(repeat // 20, 1)
+    plotly_time, plotly_markup = measure(
+        f'Plotly 그림 + to_html ({plotly_repeat}회)',
+        lambda: [
+            plotly_generator.create_chart(data, name).to_html(full_html=False, include_plotlyjs=False)
+            for name, data in charts.items()
+        ],
+        plotly_repeat
+    )
+
+    svg_bytes = sum(len(markup.encode('utf-8')) for markup in svg_markup)
+    plotly_bytes = sum(len(markup.encode('utf-8')) for markup in plotly_markup)
+    print(f"\n속도: SVG가 {plotly_time / svg_time:,.0f}배 빠름")
+    print(f"크기: SVG {svg_bytes / 1024:,.1f}KB, Plotly {plotly_bytes / 1024:,.1f}KB (+ plotly.js 약 3.5MB 별도)")
+
+
+def bench_pdf(snapshot_path):
+    """스냅샷으로 만든 대시보드의 PDF 변환 시간 비교 (Playwright vs WeasyPrint)"""
+    from main import create_render_workflow
+
+    print(f"\n[PDF 변환] {snapshot_path}\n")
+    with tempfile.TemporaryDirectory() as output_folder:
+        timings = {}
+        for label, static_charts, engine in (
+            ('JS 차트 + Playwright', False, '_generate_pdf_with_playwright'),
+            ('SVG 차트 + WeasyPrint', True, '_generate_pdf_with_weasyprint'),
+        ):
+            folder = Path(output_folder) / ('static' if static_charts else 'js')
+            workflow = create_render_workflow(snapshot_path, str(folder))
+            if workflow is None:
+                raise SystemExit(f"스냅샷을 불러오지 못했습니다: {snapshot_path}")
+            generator = workflow['dashboard_generator']
+            result = generator.generate_dashboard(
+                open_browser=False, save_pdf=False, save_insights=False, static_charts=static_charts
+            )
+            html_path = Path(result['html'])
+
+            start = time.perf_counter()
+            pdf_path = getattr(generator, engine)(html_path, html_path.with_suffix('.pdf'))
+            elapsed = time.perf_counter() - start
+            if pdf_path:
+                timings[label] = elapsed
+
+        print()
+        for label, elapsed in timings.items():
+            print(f"{label:<44}{elapsed:>10.2f}초")
+        if len(timings) == 2:
+            js_time, static_time = timings.values()
+            print(f"\n속도: SVG + WeasyPrint 경로가 {js_time / static_time:,.1f}배 빠름")
+        elif not timings:
+            print("설치된 PDF 엔진이 없어 PDF 변환 비교를 건너뜁니다 (playwright, weasyprint).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='차트 렌더링/PDF 변환 경로 벤치마크')
+    parser.add_argument('--repeat', type=int, default=100, help='차트 마크업 생성 반복 횟수')
+    parser.add_argument('--snapshot', help='PDF 변환 비교에 사용할 분석 결과 스냅샷 (.insights.npz)')
+    args = parser.parse_args()
+
+    bench_markup(args.repeat)
+    if args.snapshot:
+        bench_pdf(args.snapshot)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/cluster_benchmark.py
+"""
+스타일 키워드 클러스터링 백엔드 벤치마크
+
+전체 주문 행 기준 KMeans(기존 방식)와 고유 상품명 가중 클러스터링,
+MiniBatchKMeans 백엔드의 실행 시간과 키워드 일치도(Jaccard)를 비교합니다.
+
+사용법:
+    python benchmarks/cluster_benchmark.py                 # 합성 데이터 (기본 200,000행)
+    python benchmarks/cluster_benchmark.py --rows 1000000
+    python benchmarks/cluster_benchmark.py --input orders.xlsx
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import clean_text
+from data.keyword_extractor.cluster_extractor import ClusterExtractor
+
+# 비교할 설정 (이름, extract_cluster_keywords 추가 인수)
+CASES = [
+    ('kmeans / 전체 행 (기준)', {'backend': 'kmeans', 'distinct': False}),
+    ('kmeans / 고유 상품명', {'backend': 'kmeans', 'distinct': True}),
+    ('minibatch / 전체 행', {'backend': 'minibatch', 'distinct': False}),
+    ('minibatch / 고유 상품명', {'backend': 'minibatch', 'distinct': True}),
+]
+
+
+def synthetic_names(rows, seed=42):
+    """상품명 분포를 흉내 낸 합성 상품명 생성 (소수 인기 상품 + 긴 꼬리)"""
+    rng = np.random.default_rng(seed)
+    styles = ['오버핏', '슬림핏', '루즈핏', '크롭', '롱', '베이직', '빈티지', '캐주얼', '미니멀', '스트릿']
+    items = ['티셔츠', '셔츠', '블라우스', '니트', '가디건', '원피스', '스커트', '슬랙스', '데님', '팬츠', '자켓', '코트']
+    materials = ['코튼', '린넨', '울', '데님', '시폰', '레더', '니트']
+    colors = ['블랙', '화이트', '아이보리', '네이비', '베이지', '그레이', '차콜']
+
+    n_products = max(rows // 20, 100)
+    catalog = [
+        f"{rng.choice(styles)} {rng.choice(materials)} {rng.choice(items)} {rng.choice(colors)}"
+        for _ in range(n_products)
+    ]
+    popularity = 1.0 / np.arange(1, n_products + 1) ** 1.1
+    popularity /= popularity.sum()
+    return list(rng.choice(catalog, size=rows, p=popularity))
+
+
+def load_names(path):
+    """주문 파일에서 상품명 로드"""
+    from data.data_processor.data_loader import DataLoader
+    df = DataLoader().load_data(path)
+    if df is None or '상품명' not in df.columns:
+        raise SystemExit(f"상품명 컬럼을 읽을 수 없습니다: {path}")
+    return df['상품명'].dropna().astype(str).tolist()
+
+
+def jaccard(a, b):
+    """두 키워드 목록의 Jaccard 유사도"""
+    a, b = set(a), set(b)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='클러스터링 백엔드 벤치마크')
+    parser.add_argument('--input', help='주문 데이터 파일 (없으면 합성 데이터 사용)')
+    parser.add_argument('--rows', type=int, default=200000, help='합성 데이터 행 수')
+    parser.add_argument('--clusters', type=int, default=5, help='클러스터 수')
+    parser.add_argument('--keywords', type=int, default=3, help='클러스터별 키워드 수')
+    args = parser.parse_args()
+
+    names = load_names(args.input) if args.input else synthetic_names(args.rows)
+    texts = [clean_text(name) for name in names]
+    print(f"텍스트 {len(texts):,}건 (고유 {len(set(texts)):,}건), 클러스터 {args.clusters}개\n")
+
+    baseline = None
+    print(f"{'설정':<28}{'시간(초)':>10}{'Jaccard':>10}  키워드")
+    for name, options in CASES:
+        start = time.perf_counter()
+        keywords = ClusterExtractor.extract_cluster_keywords(texts, args.clusters, args.keywords, **options)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = keywords
+        overlap = jaccard(baseline, keywords)
+        print(f"{name:<28}{elapsed:>10.2f}{overlap:>10.2f}  {', '.join(sorted(set(keywords)))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# benchmarks/load_memory_benchmark.py
+"""
+주문 데이터 전처리 메모리/시간 벤치마크
+
+기존 방식(dropna -> drop_duplicates -> 카테고리 필터, 단계마다 데이터프레임 복사)과
+현재 DataLoader의 유지 마스크 + 한 번의 take 방식을 비교합니다.
+방식마다 별도 프로세스에서 실행해 전처리 중 최대 RSS(상주 메모리)를 측정하며,
+두 결과 데이터프레임이 같은지도 확인합니다. (Linux /proc의 VmHWM 기반, psutil 불필요)
+
+사용법:
+    python benchmarks/load_memory_benchmark.py                 # 합성 데이터 (기본 1,000,000행)
+    python benchmarks/load_memory_benchmark.py --rows 3000000
+    python benchmarks/load_memory_benchmark.py --input orders.xlsx
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VARIANTS = ['legacy', 'current']
+LABELS = {'legacy': '기존 (단계별 복사)', 'current': '현재 (마스크 + take 1회)'}
+
+
+def synthetic_orders(rows, seed=42):
+    """
+    주문 데이터 형식의 합성 데이터프레임 생성
+
+    필수 컬럼(결제일, 상품명) 결측 약 2%와 주문번호/상품번호 중복 약 5%를 포함합니다.
+    """
+    from config import Config
+    rng = np.random.default_rng(seed)
+    categories = sorted(Config().snapshot().allowed_categories) or ['50000805']
+    categories = [int(code) for code in categories if str(code).isdigit()] + [99999999]
+
+    order_ids = rng.integers(0, int(rows * 0.7), size=rows)
+    df = pd.DataFrame({
+        '주문번호': pd.Series(order_ids).map('O{:09d}'.format),
+        '상품번호': pd.Series(rng.integers(0, 5000, size=rows)).map('P{:06d}'.format),
+        '결제일': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 180 * 24, size=rows), unit='h'),
+        '상품명': pd.Series(rng.integers(0, 20000, size=rows)).map('상품 {}'.format),
+        '옵션정보': rng.choice(['색상: 블랙 / 사이즈: M', '색상: 화이트 / 사이즈: L', '사이즈: FREE', ''], size=rows),
+        '상품가격': rng.integers(5, 200, size=rows) * 1000,
+        '상품별 총 주문금액': rng.integers(5, 400, size=rows) * 1000,
+        '판매채널': rng.choice(['스마트스토어', '자사몰', '쿠팡', '지그재그'], size=rows),
+        '상품 카테고리': rng.choice(categories, size=rows),
+    })
+    # 중복 행(같은 주문번호/상품번호) 추가
+    dup = rng.choice(rows, size=rows // 20, replace=False)
+    df.loc[dup, '상품번호'] = df['상품번호'].shift(1).fillna('P000000').iloc[dup].to_numpy()
+    df.loc[dup, '주문번호'] = df['주문번호'].shift(1).fillna('O000000000').iloc[dup].to_numpy()
+    # 필수 컬럼 결측
+    df.loc[rng.choice(rows, size=rows // 100, replace=False), '상품명'] = None
+    df['결제일'] = df['결제일'].astype(object)
+    df.loc[rng.choice(rows, size=rows // 100, replace=False), '결제일'] = None
+    return df
+
+
+def legacy_preprocess(loader):
+    """기존 전처리 순서 재현 (변환 -> dropna -> fillna -> drop_duplicates -> 옵션 -> 카테고리 필터)"""
+    df = loader.df
+    df['결제일'] = pd.to_datetime(df['결제일'], errors='coerce')
+    df['상품가격'] = pd.to_numeric(df['상품가격'], errors='coerce')
+    df['상품별 총 주문금액'] = pd.to_numeric(df['상품별 총 주문금액'], errors='coerce')
+    df = df.dropna(subset=['결제일', '상품명'])
+    df['상품가격'] = df['상품가격'].fillna(0)
+    df = df.drop_duplicates(subset=['주문번호', '상품번호'])
+    loader.df = df
+    loader._parse_options()
+    df = loader.df
+    return df[loader.config.snapshot().allowed_category_mask(df['상품 카테고리'])]
+
+
+def current_preprocess(loader):
+    """현재 DataLoader 전처리"""
+    loader._preprocess_data()
+    return loader.df
+
+
+def _status_kb(field):
+    """/proc/self/status 항목 값 (바이트)"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def reset_peak_rss():
+    """
+    최대 RSS(VmHWM)를 현재 RSS로 초기화하고 현재 RSS 반환
+
+    커널이 기록하는 최댓값을 쓰므로 GIL을 잡은 C 연산 중의 순간 최댓값도 놓치지 않습니다.
+    초기화할 수 없는 환경에서는 getrusage의 프로세스 최댓값을 그대로 사용합니다.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+    return _status_kb('VmRSS')
+
+
+def peak_rss():
+    """초기화 이후 최대 RSS (바이트)"""
+    return _status_kb('VmHWM') or resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_worker(variant, data_path, result_path):
+    """하위 프로세스: 데이터를 읽고 전처리 한 번 실행 후 측정 결과 저장"""
+    import contextlib
+    import io
+    from config import Config
+    from data.data_processor.data_loader import DataLoader
+
+    df = pd.read_pickle(data_path)
+    loader = DataLoader(Config(), filter_categories=(variant == 'current'))
+    loader.config.snapshot()
+    loader.df = df
+    del df
+
+    baseline = reset_peak_rss()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = legacy_preprocess(loader) if variant == 'legacy' else current_preprocess(loader)
+    elapsed = time.perf_counter() - start
+    peak = peak_rss()
+
+    result.reset_index(drop=True).to_pickle(result_path + '.frame')
+    with open(result_path, 'w') as f:
+        json.dump({'baseline': baseline, 'peak': peak, 'seconds': elapsed, 'rows': len(result)}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주문 데이터 전처리 메모리 벤치마크')
+    parser.add_argument('--input', help='주문 데이터 파일 (없으면 합성 데이터 사용)')
+    parser.add_argument('--rows', type=int, default=1000000, help='합성 데이터 행 수')
+    parser.add_argument('--worker', choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument('--data', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.data, args.result)
+        return
+
+    df = pd.read_excel(args.input) if args.input else synthetic_orders(args.rows)
+    print(f"입력 {len(df):,}행, {df.memory_usage(deep=True).sum() / 1024 ** 2:,.1f}MB\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, 'orders.pkl')
+        df.to_pickle(data_path)
+        del df
+
+        results = {}
+        for variant in VARIANTS:
+            result_path = os.path.join(tmp, f"{variant}.json")
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', variant,
+                 '--data', data_path, '--result', result_path],
+                check=True
+            )
+            with open(result_path) as f:
+                results[variant] = json.load(f)
+
+        print(f"{'방식':<24}{'결과 행':>12}{'시간(초)':>10}{'최대 증가(MB)':>16}")
+        for variant in VARIANTS:
+            result = results[variant]
+            growth = (result['peak'] - result['baseline']) / 1024 ** 2
+            print(f"{LABELS[variant]:<24}{result['rows']:>12,}{result['seconds']:>10.2f}{growth:>16,.1f}")
+
+        legacy = pd.read_pickle(os.path.join(tmp, 'legacy.json.frame'))
+        current = pd.read_pickle(os.path.join(tmp, 'current.json.frame'))
+        try:
+            pd.testing.assert_frame_equal(legacy, current, check_like=True)
+            print("\n결과 일치: 예")
+        except AssertionError as e:
+            print(f"\n결과 일치: 아니오 ({str(e).splitlines()[0]})")
+
+
+if __name__ == '__main__':
+    main()
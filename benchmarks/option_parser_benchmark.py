@@ -0,0 +1,122 @@
+# benchmarks/option_parser_benchmark.py
+"""
+옵션정보 색상/사이즈 파싱 비교 벤치마크
+
+기존 방식(옵션 문자열마다 색상/사이즈 사전을 부분 문자열로 찾는 방식)과
+OptionParser(고유 옵션 문자열당 한 번 파싱)의 처리 시간과 색상/사이즈 집계를 비교하고,
+여러 옵션 형식의 회귀 사례가 기대한 색상/사이즈로 파싱되는지 확인합니다.
+
+사용법:
+    python benchmarks/option_parser_benchmark.py                # 합성 옵션 1,000,000건
+    python benchmarks/option_parser_benchmark.py --rows 200000
+    python benchmarks/option_parser_benchmark.py --input orders.xlsx
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from data.data_processor.option_parser import OptionParser
+
+# (옵션 문자열, 기대 색상, 기대 사이즈)
+REGRESSION_CASES = [
+    ('색상:블랙 / 사이즈:FREE', '블랙', 'FREE'),
+    ('블랙,M', '블랙', 'M'),
+    ('컬러=아이보리 | size: xl', '아이보리', 'XL'),
+    ('옵션: 베이지/S', '베이지', 'S'),
+    ('옵션1:블랙,옵션2:M', '블랙', 'M'),
+    ('아이보리 M', '아이보리', 'M'),
+    ('[색상]그레이 [사이즈]XL', '그레이', 'XL'),
+    ('화이트 (FREE)', '화이트', 'FREE'),
+    ('사이즈: FREE(44-66)', None, 'FREE(44-66)'),
+    ('라이트블루 / 95', '라이트블루', '95'),
+    ('각인: 없음', None, None),
+]
+
+
+def synthetic_options(rows, config, seed=42):
+    """여러 옵션 형식을 섞은 합성 옵션정보 생성"""
+    rng = np.random.default_rng(seed)
+    colors = config.get_product_attributes('colors')[:20]
+    sizes = ['FREE', 'S', 'M', 'L', 'XL', '55', '66']
+    formats = [
+        '색상:{c} / 사이즈:{s}', '{c},{s}', '옵션: {c}/{s}', '옵션1:{c},옵션2:{s}',
+        '{c} {s}', '[색상]{c} [사이즈]{s}', '{c} ({s})', '컬러={c} | size: {s}',
+    ]
+    picked_colors = rng.choice(colors, size=rows)
+    picked_sizes = rng.choice(sizes, size=rows)
+    picked_formats = rng.choice(formats, size=rows)
+    return [f.format(c=c, s=s) for f, c, s in zip(picked_formats, picked_colors, picked_sizes)]
+
+
+def legacy_extract(options, keywords):
+    """기존 AttributeExtractor의 부분 문자열 방식 (옵션마다 사전 순서상 첫 일치)"""
+    extracted = []
+    for option in options:
+        for keyword in keywords:
+            if keyword in option:
+                extracted.append(keyword)
+                break
+    return Counter(extracted)
+
+
+def check_regressions(parser):
+    """회귀 사례 확인 (실패한 사례 수 반환)"""
+    failures = 0
+    for text, color, size in REGRESSION_CASES:
+        parsed_color, parsed_size, _ = parser.parse_option(text)
+        if (parsed_color, parsed_size) != (color, size):
+            print(f"  실패: {text!r} -> ({parsed_color}, {parsed_size}), 기대 ({color}, {size})")
+            failures += 1
+    print(f"회귀 사례 {len(REGRESSION_CASES) - failures}/{len(REGRESSION_CASES)}건 통과\n")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='옵션정보 파싱 비교 벤치마크')
+    parser.add_argument('--input', help='주문 데이터 파일 (없으면 합성 데이터 사용)')
+    parser.add_argument('--rows', type=int, default=1000000, help='합성 옵션 수')
+    args = parser.parse_args()
+
+    config = Config()
+    option_parser = OptionParser(config)
+    failures = check_regressions(option_parser)
+
+    if args.input:
+        options = pd.read_excel(args.input)['옵션정보'].dropna().astype(str).tolist()
+    else:
+        options = synthetic_options(args.rows, config)
+    print(f"옵션 {len(options):,}건 (고유 {len(set(options)):,}건)\n")
+
+    start = time.perf_counter()
+    legacy_colors = legacy_extract(options, config.get_product_attributes('colors'))
+    legacy_sizes = legacy_extract(options, config.get_product_attributes('sizes'))
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed = option_parser.parse(pd.Series(options))
+    current_seconds = time.perf_counter() - start
+    current_colors = parsed[OptionParser.COLOR_COLUMN].value_counts()
+    current_sizes = parsed[OptionParser.SIZE_COLUMN].value_counts()
+
+    print(f"{'방식':<32}{'시간(초)':>10}")
+    print(f"{'기존 (부분 문자열)':<32}{legacy_seconds:>10.2f}")
+    print(f"{'OptionParser (고유값 파싱)':<32}{current_seconds:>10.2f}")
+
+    print(f"\n{'항목':<12}{'기존':>10}{'OptionParser':>14}")
+    for label, legacy, current in (('색상', legacy_colors, current_colors), ('사이즈', legacy_sizes, current_sizes)):
+        for value, count in legacy.most_common(5):
+            print(f"{label + ' ' + value:<12}{count:>10,}{int(current.get(value, 0)):>14,}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# benchmarks/stopword_benchmark.py
+"""
+불용어/비패션 키워드 필터링 처리량 벤치마크
+
+기존 방식(불용어마다 str.replace를 반복하는 부분 문자열 치환)과
+토큰 단위 frozenset 필터링(FashionTokenizer)의 처리량을 비교하고,
+부분 문자열 치환으로 훼손되는 단어 예시를 출력합니다.
+
+사용법:
+    python benchmarks/stopword_benchmark.py               # 합성 상품명 1,000,000건
+    python benchmarks/stopword_benchmark.py --rows 200000
+    python benchmarks/stopword_benchmark.py --input orders.xlsx
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils import FashionTokenizer, clean_text
+
+
+def legacy_preprocess(name, stop_words):
+    """기존 AttributeExtractor.preprocess_product_name과 같은 부분 문자열 치환 방식"""
+    if not isinstance(name, str):
+        return ""
+    name = name.lower()
+    for word in stop_words:
+        name = name.replace(word.lower(), ' ')
+    name = re.sub(r'[^\w\s가-힣]', ' ', name)
+    name = re.sub(r'\s+', ' ', name).strip()
+    return name
+
+
+def synthetic_names(rows, config, seed=42):
+    """패션 키워드/색상/불용어를 섞은 합성 상품명 생성 (고유 상품명 약 rows / 10개)"""
+    rng = np.random.default_rng(seed)
+    fashion = config.get_fashion_keywords()
+    colors = config.get_product_attributes('colors')
+    noise = ['[브리치]', '무료배송', '특가', '1+1', 'best', 'NEW', '당일발송', 'cold', 'colorful', '개나리']
+
+    n_products = max(rows // 10, 100)
+    catalog = []
+    for _ in range(n_products):
+        words = list(rng.choice(fashion, rng.integers(2, 5)))
+        words.append(str(rng.choice(colors)))
+        if rng.random() < 0.5:
+            words.insert(0, str(rng.choice(noise)))
+        # 일부 상품명은 붙여 쓰기
+        catalog.append(''.join(words) if rng.random() < 0.3 else ' '.join(words))
+    popularity = 1.0 / np.arange(1, n_products + 1)
+    popularity /= popularity.sum()
+    return list(rng.choice(catalog, size=rows, p=popularity))
+
+
+def load_names(path):
+    """주문 파일에서 상품명 로드"""
+    from data.data_processor.data_loader import DataLoader
+    df = DataLoader().load_data(path)
+    if df is None or '상품명' not in df.columns:
+        raise SystemExit(f"상품명 컬럼을 읽을 수 없습니다: {path}")
+    return df['상품명'].dropna().astype(str).tolist()
+
+
+def measure(label, func, count):
+    """함수 실행 시간과 초당 처리 건수 출력"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}{elapsed:>10.2f}초{count / elapsed:>14,.0f}건/초")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='불용어 필터링 처리량 벤치마크')
+    parser.add_argument('--input', help='주문 데이터 파일 (없으면 합성 데이터 사용)')
+    parser.add_argument('--rows', type=int, default=1000000, help='합성 상품명 수')
+    args = parser.parse_args()
+
+    config = Config()
+    names = load_names(args.input) if args.input else synthetic_names(args.rows, config)
+    stop_words = list(config.get_stop_words()) + list(config.get_non_fashion_keywords())
+    print(f"상품명 {len(names):,}건 (고유 {len(set(names)):,}건), 불용어 {len(stop_words)}개\n")
+
+    legacy = measure(
+        '기존: 불용어별 str.replace',
+        lambda: [legacy_preprocess(name, stop_words) for name in names],
+        len(names)
+    )
+
+    tokenizer = FashionTokenizer.from_config(config)
+    stop_set = tokenizer.stop_words
+    measure(
+        '토큰 단위: clean_text(frozenset)',
+        lambda: [clean_text(name, stop_set) for name in names],
+        len(names)
+    )
+    measure(
+        '토큰 단위: FashionTokenizer.tokenize',
+        lambda: [tokenizer.tokenize(name) for name in names],
+        len(names)
+    )
+    ids, _ = measure(
+        '토큰 단위: FashionTokenizer.encode (고유값)',
+        lambda: tokenizer.encode(names),
+        len(names)
+    )
+    print(f"\n토큰 {len(ids):,}개, 어휘 {len(tokenizer.tokens):,}개")
+
+    # 부분 문자열 치환으로 훼손된 단어 예시
+    print("\n부분 문자열 치환 결과 비교 (예시):")
+    shown = 0
+    for name, old in zip(names, legacy):
+        new = ' '.join(tokenizer.tokenize(name))
+        if old.split() != new.split() and shown < 5:
+            print(f"  {name}\n    기존: {old}\n    토큰: {new}")
+            shown += 1
+        if shown >= 5:
+            break
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,8 @@ from .keyword_config import KeywordConfig
 from .product_config import ProductConfig
 from .category_config import CategoryConfig
 from .output_config import OutputConfig
+from .analysis_config import AnalysisConfig
+from .snapshot import ConfigSnapshot
 
 class Config:
     """
@@ -20,39 +22,100 @@ class Config:
         self.product_config = ProductConfig()
         self.category_config = CategoryConfig()
         self.output_config = OutputConfig()
+        self.analysis_config = AnalysisConfig()
         
         # 출력 관련 설정을 메인 클래스에 복사
         self.output_folder = self.output_config.output_folder
         self.dashboard_port = self.output_config.dashboard_port
         self.report_port = self.output_config.report_port
         self.template_folder = self.output_config.template_folder
+        self.bundle_assets = self.output_config.bundle_assets
+        self.vendor_folder = self.output_config.vendor_folder
+        self.cdn_assets = self.output_config.cdn_assets
+        self.static_charts = self.output_config.static_charts
+        self.pdf_engine = self.output_config.pdf_engine
+        self.excel_batch_rows = self.output_config.excel_batch_rows
+        
+        # 키워드/속성/카테고리 설정 스냅샷 (snapshot() 첫 호출 시 생성)
+        self._snapshot = None
+    
+    def snapshot(self, refresh=False):
+        """
+        키워드/제품 속성/카테고리 설정의 불변 스냅샷 반환
+        
+        Parameters:
+        - refresh: True이면 환경 변수를 다시 읽어 스냅샷 재생성
+        
+        Returns:
+        - ConfigSnapshot 객체
+        """
+        if self._snapshot is None or refresh:
+            self._snapshot = ConfigSnapshot.build(self.keyword_config, self.product_config, self.category_config)
+        return self._snapshot
     
     # 키워드 관련 메서드
     def get_stop_words(self):
         """불용어 목록 반환"""
-        return self.keyword_config.get_stop_words()
+        return self.snapshot().get_stop_words()
     
     def get_non_fashion_keywords(self):
         """비패션 키워드 목록 반환"""
-        return self.keyword_config.get_non_fashion_keywords()
+        return self.snapshot().get_non_fashion_keywords()
     
     def get_fashion_patterns(self):
         """패션 관련 패턴 목록 반환"""
-        return self.keyword_config.get_fashion_patterns()
+        return self.snapshot().get_fashion_patterns()
     
     def get_fashion_keywords(self):
         """패션 관련 키워드 목록 반환"""
-        return self.keyword_config.get_fashion_keywords()
+        return self.snapshot().get_fashion_keywords()
     
     # 제품 속성 관련 메서드
     def get_product_attributes(self, attr_type=None):
         """제품 속성 반환"""
-        return self.product_config.get_attribute(attr_type)
+        return self.snapshot().get_product_attributes(attr_type)
+    
+    # 분석 관련 메서드
+    def get_counter_settings(self, distinct_hint=None):
+        """빈도 집계 백엔드 설정 반환"""
+        return self.analysis_config.get_counter_settings(distinct_hint)
+    
+    def get_price_bin_settings(self):
+        """가격대 구간 설정 반환"""
+        return self.analysis_config.get_price_bin_settings()
+    
+    def get_tfidf_settings(self):
+        """카테고리별 TF-IDF 병렬 처리 설정 반환"""
+        return self.analysis_config.get_tfidf_settings()
+    
+    def get_cluster_settings(self):
+        """스타일 키워드 클러스터링 설정 반환"""
+        return self.analysis_config.get_cluster_settings()
+    
+    def get_model_store_settings(self):
+        """키워드 추출 모델 저장소 설정 반환"""
+        return self.analysis_config.get_model_store_settings(self.output_folder)
+    
+    def get_chart_cache_settings(self):
+        """차트 렌더링 캐시 설정 반환"""
+        return self.output_config.get_chart_cache_settings(self.output_folder)
+    
+    def get_parquet_export_settings(self):
+        """주문 데이터 Parquet 내보내기 설정 반환"""
+        return self.output_config.get_parquet_export_settings()
+    
+    def get_run_index_settings(self):
+        """실행 기록 저장소 설정 반환"""
+        return self.output_config.get_run_index_settings(self.output_folder)
     
     # 카테고리 관련 메서드
     def get_category_name(self, category_code):
         """카테고리 코드에 대한 이름 반환"""
-        return self.category_config.get_category_name(category_code)
+        return self.snapshot().get_category_name(category_code)
+    
+    def is_allowed_category(self, category_code):
+        """CSV에 정의된 카테고리인지 확인"""
+        return self.snapshot().is_allowed_category(category_code)
     
     # 차트 색상 메서드는 기존 호환성을 위해 유지하되, 하드코딩된 기본값 사용
     def get_chart_colors(self):
@@ -0,0 +1,214 @@
+# config/analysis_config.py
+"""
+분석 단계(빈도 집계 방식 등) 관련 설정을 제공하는 모듈
+"""
+import os
+from pathlib import Path
+from .base_config import BaseConfig
+
+class AnalysisConfig(BaseConfig):
+    """
+    분석 알고리즘 선택 관련 설정 클래스
+    """
+
+    # 빈도 집계 백엔드 (exact: 정확 집계, space_saving / count_min: 스케치,
+    # auto: 데이터 프로파일의 고유값 수에 따라 exact / space_saving 자동 선택)
+    COUNTER_BACKENDS = ['exact', 'space_saving', 'count_min', 'auto']
+    DEFAULT_COUNTER_BACKEND = 'exact'
+
+    # 스케치가 유지할 후보(상위 항목) 수
+    DEFAULT_SKETCH_CAPACITY = 1000
+
+    # Count-Min 스케치 크기 (오차 ε = e / width, 실패 확률 δ = e^-depth)
+    DEFAULT_CMS_WIDTH = 2048
+    DEFAULT_CMS_DEPTH = 5
+
+    # 데이터 프로파일 기준값
+    # - 고유값 수가 이 값을 넘으면 스케치 집계 권장 (auto 백엔드의 전환 기준)
+    DEFAULT_SKETCH_THRESHOLD = 200000
+    # - 고유값 비율(%)이 이 값 이하이면 범주형 인코딩 권장
+    DEFAULT_CATEGORICAL_RATIO = 5
+    # - HyperLogLog 정밀도 (레지스터 2^p개, 표준 오차 약 1.04 / sqrt(2^p))
+    DEFAULT_HLL_PRECISION = 12
+
+    # 가격대 구간 설정
+    # - fixed: 구간 경계 목록 사용, quantile: 분위수 경계, log: 로그 간격 경계
+    PRICE_BIN_MODES = ['fixed', 'quantile', 'log']
+    DEFAULT_PRICE_BIN_MODE = 'fixed'
+    # - 각 구간은 [경계, 다음 경계) 이며 마지막 구간은 상한 없음
+    DEFAULT_PRICE_BIN_EDGES = [0, 10000, 20000, 30000, 50000, 70000, 100000, 150000, 200000]
+    # - quantile / log 모드의 구간 수
+    DEFAULT_PRICE_BIN_COUNT = 9
+
+    # 카테고리별 TF-IDF 병렬 처리 설정
+    # - 워커 프로세스 수 (0이면 CPU 코어 수, 1이면 직렬 처리)
+    DEFAULT_TFIDF_WORKERS = 0
+    # - 작은 카테고리를 묶어 하나의 작업으로 보낼 때의 최소 행 수
+    DEFAULT_TFIDF_CHUNK_ROWS = 2000
+    # - 전체 행 수가 이 값 미만이면 프로세스 생성 비용을 피하기 위해 직렬 처리
+    DEFAULT_TFIDF_PARALLEL_MIN_ROWS = 20000
+
+    # 스타일 키워드 클러스터링 설정
+    # - kmeans: 전체 배치 KMeans, minibatch: MiniBatchKMeans partial_fit
+    CLUSTER_BACKENDS = ['kmeans', 'minibatch']
+    DEFAULT_CLUSTER_BACKEND = 'kmeans'
+    # - 1이면 주문 행 대신 고유 상품명을 빈도 가중치로 클러스터링
+    DEFAULT_CLUSTER_DISTINCT = 0
+    # - 최대 반복 수 (minibatch는 최대 미니배치 스텝 수)
+    DEFAULT_CLUSTER_MAX_ITER = 300
+    # - 클러스터링 시간 제한(초, 0이면 제한 없음)
+    DEFAULT_CLUSTER_TIME_LIMIT = 0
+    # - minibatch 백엔드의 배치 크기
+    DEFAULT_CLUSTER_BATCH_SIZE = 4096
+
+    # 키워드 추출 모델 저장소 (출력 폴더/models)
+    # - 1이면 학습된 어휘/IDF/중심점을 저장하고 다음 실행에서 재사용
+    DEFAULT_MODEL_STORE = 1
+    # - 저장된 모델의 재학습 주기(일)
+    DEFAULT_MODEL_REFIT_DAYS = 7
+    # - 저장된 어휘로 표현되는 문서 비율(%)이 이 값 미만이면 재학습
+    DEFAULT_MODEL_MIN_COVERAGE = 90
+
+    def __init__(self):
+        super().__init__()
+
+        # 빈도 집계 백엔드 설정
+        backend = str(self.get_env_value('BFLOW_COUNTER_BACKEND', self.DEFAULT_COUNTER_BACKEND)).lower()
+        if backend not in self.COUNTER_BACKENDS:
+            print(f"지원하지 않는 집계 백엔드입니다: {backend} (기본값 {self.DEFAULT_COUNTER_BACKEND} 사용)")
+            backend = self.DEFAULT_COUNTER_BACKEND
+        self.counter_backend = backend
+
+        # 스케치 파라미터
+        self.sketch_capacity = self.get_env_int('BFLOW_SKETCH_CAPACITY', self.DEFAULT_SKETCH_CAPACITY)
+        self.cms_width = self.get_env_int('BFLOW_CMS_WIDTH', self.DEFAULT_CMS_WIDTH)
+        self.cms_depth = self.get_env_int('BFLOW_CMS_DEPTH', self.DEFAULT_CMS_DEPTH)
+
+        # 데이터 프로파일 파라미터
+        self.sketch_threshold = self.get_env_int('BFLOW_SKETCH_THRESHOLD', self.DEFAULT_SKETCH_THRESHOLD)
+        self.categorical_ratio = self.get_env_int('BFLOW_CATEGORICAL_RATIO', self.DEFAULT_CATEGORICAL_RATIO)
+        self.hll_precision = self.get_env_int('BFLOW_HLL_PRECISION', self.DEFAULT_HLL_PRECISION)
+
+        # 가격대 구간 파라미터
+        mode = str(self.get_env_value('BFLOW_PRICE_BIN_MODE', self.DEFAULT_PRICE_BIN_MODE)).lower()
+        if mode not in self.PRICE_BIN_MODES:
+            print(f"지원하지 않는 가격대 구간 모드입니다: {mode} (기본값 {self.DEFAULT_PRICE_BIN_MODE} 사용)")
+            mode = self.DEFAULT_PRICE_BIN_MODE
+        self.price_bin_mode = mode
+        self.price_bin_edges = self._parse_edges(self.get_env_value('BFLOW_PRICE_BIN_EDGES', ''))
+        self.price_bin_count = self.get_env_int('BFLOW_PRICE_BIN_COUNT', self.DEFAULT_PRICE_BIN_COUNT)
+
+        # 카테고리별 TF-IDF 병렬 처리 파라미터
+        self.tfidf_workers = self.get_env_int('BFLOW_TFIDF_WORKERS', self.DEFAULT_TFIDF_WORKERS)
+        self.tfidf_chunk_rows = self.get_env_int('BFLOW_TFIDF_CHUNK_ROWS', self.DEFAULT_TFIDF_CHUNK_ROWS)
+        self.tfidf_parallel_min_rows = self.get_env_int(
+            'BFLOW_TFIDF_PARALLEL_MIN_ROWS', self.DEFAULT_TFIDF_PARALLEL_MIN_ROWS
+        )
+
+        # 스타일 키워드 클러스터링 파라미터
+        cluster_backend = str(self.get_env_value('BFLOW_CLUSTER_BACKEND', self.DEFAULT_CLUSTER_BACKEND)).lower()
+        if cluster_backend not in self.CLUSTER_BACKENDS:
+            print(f"지원하지 않는 클러스터링 백엔드입니다: {cluster_backend} (기본값 {self.DEFAULT_CLUSTER_BACKEND} 사용)")
+            cluster_backend = self.DEFAULT_CLUSTER_BACKEND
+        self.cluster_backend = cluster_backend
+        self.cluster_distinct = self.get_env_int('BFLOW_CLUSTER_DISTINCT', self.DEFAULT_CLUSTER_DISTINCT) > 0
+        self.cluster_max_iter = self.get_env_int('BFLOW_CLUSTER_MAX_ITER', self.DEFAULT_CLUSTER_MAX_ITER)
+        self.cluster_time_limit = self.get_env_int('BFLOW_CLUSTER_TIME_LIMIT', self.DEFAULT_CLUSTER_TIME_LIMIT)
+        self.cluster_batch_size = self.get_env_int('BFLOW_CLUSTER_BATCH_SIZE', self.DEFAULT_CLUSTER_BATCH_SIZE)
+
+        # 키워드 추출 모델 저장소 파라미터
+        self.model_store = self.get_env_int('BFLOW_MODEL_STORE', self.DEFAULT_MODEL_STORE) > 0
+        self.model_refit_days = self.get_env_int('BFLOW_MODEL_REFIT_DAYS', self.DEFAULT_MODEL_REFIT_DAYS)
+        self.model_min_coverage = self.get_env_int('BFLOW_MODEL_MIN_COVERAGE', self.DEFAULT_MODEL_MIN_COVERAGE)
+
+    def _parse_edges(self, value):
+        """쉼표로 구분된 가격대 경계 문자열 파싱 (없거나 잘못된 경우 기본값)"""
+        if not value:
+            return list(self.DEFAULT_PRICE_BIN_EDGES)
+        try:
+            edges = sorted({float(v) for v in value.split(',') if v.strip()})
+        except ValueError:
+            print(f"가격대 경계 값이 올바르지 않습니다: {value} (기본값 사용)")
+            return list(self.DEFAULT_PRICE_BIN_EDGES)
+        return edges if edges else list(self.DEFAULT_PRICE_BIN_EDGES)
+
+    def get_counter_settings(self, distinct_hint=None):
+        """
+        빈도 집계 백엔드 설정 반환
+
+        Parameters:
+        - distinct_hint: 집계 대상 컬럼의 고유값 수 (auto 백엔드에서 사용)
+
+        Returns:
+        - create_counter()에 그대로 전달할 수 있는 설정 딕셔너리
+        """
+        backend = self.counter_backend
+        if backend == 'auto':
+            use_sketch = distinct_hint is not None and distinct_hint > self.sketch_threshold
+            backend = 'space_saving' if use_sketch else 'exact'
+
+        return {
+            'backend': backend,
+            'capacity': self.sketch_capacity,
+            'width': self.cms_width,
+            'depth': self.cms_depth
+        }
+
+    def get_price_bin_settings(self):
+        """
+        가격대 구간 설정 반환
+
+        Returns:
+        - PriceDistribution.from_settings()에 전달할 설정 딕셔너리
+        """
+        return {
+            'mode': self.price_bin_mode,
+            'edges': list(self.price_bin_edges),
+            'count': self.price_bin_count
+        }
+
+    def get_tfidf_settings(self):
+        """
+        카테고리별 TF-IDF 병렬 처리 설정 반환
+
+        Returns:
+        - TfidfExtractor.extract_category_tfidf_keywords()에 전달할 설정 딕셔너리
+        """
+        workers = self.tfidf_workers if self.tfidf_workers > 0 else (os.cpu_count() or 1)
+        return {
+            'workers': workers,
+            'chunk_rows': max(self.tfidf_chunk_rows, 1),
+            'parallel_min_rows': self.tfidf_parallel_min_rows
+        }
+
+    def get_cluster_settings(self):
+        """
+        스타일 키워드 클러스터링 설정 반환
+
+        Returns:
+        - ClusterExtractor.extract_cluster_keywords()에 전달할 설정 딕셔너리
+        """
+        return {
+            'backend': self.cluster_backend,
+            'distinct': self.cluster_distinct,
+            'max_iter': max(self.cluster_max_iter, 1),
+            'time_limit': max(self.cluster_time_limit, 0),
+            'batch_size': max(self.cluster_batch_size, 1)
+        }
+
+    def get_model_store_settings(self, output_folder):
+        """
+        키워드 추출 모델 저장소 설정 반환
+
+        Parameters:
+        - output_folder: 출력 폴더 (모델은 그 아래 models 폴더에 저장)
+
+        Returns:
+        - ModelStore 생성에 사용할 설정 딕셔너리
+        """
+        return {
+            'enabled': self.model_store,
+            'folder': Path(output_folder) / 'models',
+            'refit_days': max(self.model_refit_days, 0),
+            'min_coverage': min(max(self.model_min_coverage, 0), 100) / 100
+        }
@@ -15,6 +15,17 @@ class OutputConfig(BaseConfig):
     DEFAULT_DASHBOARD_PORT = 8050
     DEFAULT_REPORT_PORT = 8051
     DEFAULT_TEMPLATE_FOLDER = 'templates'
+    DEFAULT_BUNDLE_ASSETS = 1
+    DEFAULT_CDN_ASSETS = 0
+    DEFAULT_STATIC_CHARTS = 0
+    DEFAULT_PDF_ENGINE = 'auto'
+    DEFAULT_CHART_CACHE = 1
+    DEFAULT_CHART_CACHE_ENTRIES = 512
+    DEFAULT_CHART_CACHE_MB = 64
+    DEFAULT_EXCEL_BATCH_ROWS = 10000
+    DEFAULT_PARQUET_COMPRESSION = 'zstd'
+    DEFAULT_PARQUET_ROW_GROUP_ROWS = 100000
+    DEFAULT_RUN_INDEX = 1
     
     def __init__(self):
         super().__init__()
@@ -28,6 +39,78 @@ class OutputConfig(BaseConfig):
         
         # 템플릿 폴더
         self.template_folder = Path(self.get_env_value('BFLOW_TEMPLATE_FOLDER', self.DEFAULT_TEMPLATE_FOLDER))
+        
+        # 외부 CSS/폰트를 vendor 번들로 인라인할지 여부 (0이면 CDN 링크 유지)
+        self.bundle_assets = self.get_env_int('BFLOW_BUNDLE_ASSETS', self.DEFAULT_BUNDLE_ASSETS) != 0
+        self.vendor_folder = self.template_folder / 'vendor'
+        
+        # vendor 파일이 없는 링크 처리 (0이면 대체 파일로 바꿔 외부 요청 없음, 1이면 CDN 링크 유지)
+        self.cdn_assets = self.get_env_int('BFLOW_CDN_ASSETS', self.DEFAULT_CDN_ASSETS) != 0
+        
+        # 차트를 서버에서 SVG로 미리 렌더링할지 여부 (1이면 JavaScript 없이 WeasyPrint로 PDF 변환)
+        self.static_charts = self.get_env_int('BFLOW_STATIC_CHARTS', self.DEFAULT_STATIC_CHARTS) != 0
+        
+        # PDF 변환 엔진 (auto, playwright, weasyprint, native)
+        self.pdf_engine = self.get_env_value('BFLOW_PDF_ENGINE', self.DEFAULT_PDF_ENGINE)
+        
+        # 차트 렌더링 캐시 (0이면 사용 안 함, 항목 수/크기 한도를 넘으면 오래된 항목부터 삭제)
+        self.chart_cache = self.get_env_int('BFLOW_CHART_CACHE', self.DEFAULT_CHART_CACHE) != 0
+        self.chart_cache_entries = self.get_env_int('BFLOW_CHART_CACHE_ENTRIES', self.DEFAULT_CHART_CACHE_ENTRIES)
+        self.chart_cache_bytes = self.get_env_int('BFLOW_CHART_CACHE_MB', self.DEFAULT_CHART_CACHE_MB) * 1024 * 1024
+        
+        # Excel 원본 주문 시트를 한 번에 변환해 기록할 행 수
+        self.excel_batch_rows = self.get_env_int('BFLOW_EXCEL_BATCH_ROWS', self.DEFAULT_EXCEL_BATCH_ROWS)
+        
+        # 정제된 주문 데이터 Parquet 내보내기 (압축 방식, 행 그룹 크기)
+        self.parquet_compression = self.get_env_value('BFLOW_PARQUET_COMPRESSION', self.DEFAULT_PARQUET_COMPRESSION)
+        self.parquet_row_group_rows = self.get_env_int('BFLOW_PARQUET_ROW_GROUP_ROWS', self.DEFAULT_PARQUET_ROW_GROUP_ROWS)
+        
+        # 실행 기록(매니페스트) 저장 여부 (0이면 저장 안 함)
+        self.run_index = self.get_env_int('BFLOW_RUN_INDEX', self.DEFAULT_RUN_INDEX) != 0
+    
+    def get_chart_cache_settings(self, output_folder):
+        """
+        차트 렌더링 캐시 설정 반환
+        
+        Parameters:
+        - output_folder: 출력 폴더 (캐시는 그 아래 chart_cache 폴더에 저장)
+        
+        Returns:
+        - ChartCache 생성에 사용할 설정 딕셔너리
+        """
+        return {
+            'enabled': self.chart_cache,
+            'folder': Path(output_folder) / 'chart_cache',
+            'max_entries': max(self.chart_cache_entries, 1),
+            'max_bytes': max(self.chart_cache_bytes, 0)
+        }
+    
+    def get_parquet_export_settings(self):
+        """
+        주문 데이터 Parquet 내보내기 설정 반환
+        
+        Returns:
+        - OrderExporter 생성에 사용할 설정 딕셔너리
+        """
+        return {
+            'compression': self.parquet_compression,
+            'row_group_rows': max(self.parquet_row_group_rows, 1)
+        }
+    
+    def get_run_index_settings(self, output_folder):
+        """
+        실행 기록 저장소 설정 반환
+        
+        Parameters:
+        - output_folder: 출력 폴더 (실행 기록은 그 아래 runs 폴더에 저장)
+        
+        Returns:
+        - RunIndex 생성에 사용할 설정 딕셔너리
+        """
+        return {
+            'enabled': self.run_index,
+            'folder': Path(output_folder) / 'runs'
+        }
     
     def create_output_folders(self):
         """
@@ -0,0 +1,195 @@
+# config/snapshot.py
+"""
+설정 스냅샷 (실행 시작 시 한 번 만들어 재사용하는 불변 설정) 모듈
+"""
+import hashlib
+import json
+import re
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+
+def _normalize_code(category_code):
+    """카테고리 코드를 문자열로 정규화 (숫자형은 정수 문자열로, 결측은 None)"""
+    if pd.isna(category_code):
+        return None
+    if isinstance(category_code, (int, float)):
+        return str(int(category_code))
+    return str(category_code)
+
+
+def _compile_alternation(words, flags=re.IGNORECASE):
+    """단어 목록을 긴 단어부터 시도하는 하나의 정규식으로 컴파일 (빈 목록이면 None)"""
+    words = sorted({str(word) for word in words if word}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile('|'.join(re.escape(word) for word in words), flags)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """
+    키워드/제품 속성/카테고리 설정의 불변 스냅샷
+
+    환경 변수(BFLOW_EXTRA_*)와 category.csv를 한 번만 읽어 튜플, frozenset,
+    컴파일된 정규식, 읽기 전용 매핑(MappingProxyType)으로 고정합니다. Config의 키워드/속성/카테고리
+    조회는 모두 이 스냅샷에서 응답하므로 행 단위 함수나 카테고리 루프 안에서 호출해도
+    환경 변수 조회와 목록 결합이 반복되지 않습니다.
+    pickle 가능하므로 작업 프로세스에 그대로 전달할 수 있고, content_hash는
+    설정 내용이 같으면 같은 값이므로 캐시/모델 저장소 키로 사용할 수 있습니다.
+    """
+
+    stop_words: tuple
+    non_fashion_keywords: tuple
+    fashion_patterns: tuple
+    fashion_keywords: tuple
+    product_attributes: MappingProxyType
+    category_mapping: MappingProxyType
+    allowed_categories: frozenset
+
+    # 미리 컴파일된 정규식 (FashionTokenizer, OptionParser에서 사용)
+    fashion_regex: object
+    attribute_regex: MappingProxyType
+
+    content_hash: str
+
+    # 읽기 전용 매핑 필드 (pickle 시 dict로 변환)
+    _MAPPING_FIELDS = ('product_attributes', 'category_mapping', 'attribute_regex')
+
+    def __getstate__(self):
+        return [
+            dict(value) if field.name in self._MAPPING_FIELDS else value
+            for field, value in ((field, getattr(self, field.name)) for field in fields(self))
+        ]
+
+    def __setstate__(self, state):
+        for field, value in zip(fields(self), state):
+            if field.name in self._MAPPING_FIELDS:
+                value = MappingProxyType(value)
+            object.__setattr__(self, field.name, value)
+
+    @classmethod
+    def build(cls, keyword_config, product_config, category_config):
+        """
+        설정 모듈에서 스냅샷 생성
+
+        Parameters:
+        - keyword_config: KeywordConfig 객체
+        - product_config: ProductConfig 객체
+        - category_config: CategoryConfig 객체
+
+        Returns:
+        - ConfigSnapshot 객체
+        """
+        stop_words = tuple(keyword_config.get_stop_words())
+        non_fashion_keywords = tuple(keyword_config.get_non_fashion_keywords())
+        fashion_patterns = tuple(keyword_config.get_fashion_patterns())
+        fashion_keywords = tuple(keyword_config.get_fashion_keywords())
+        product_attributes = {
+            attr_type: tuple(product_config.get_attribute(attr_type))
+            for attr_type in product_config.PRODUCT_ATTRIBUTES
+        }
+        category_mapping = dict(category_config.category_mapping)
+        allowed_categories = frozenset(category_config.allowed_categories)
+
+        patterns = [p for p in fashion_patterns if p]
+        fashion_regex = re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+
+        payload = json.dumps({
+            'stop_words': stop_words,
+            'non_fashion_keywords': non_fashion_keywords,
+            'fashion_patterns': fashion_patterns,
+            'fashion_keywords': fashion_keywords,
+            'product_attributes': product_attributes,
+            'category_mapping': sorted(category_mapping.items()),
+        }, ensure_ascii=False, sort_keys=True, default=str)
+
+        return cls(
+            stop_words=stop_words,
+            non_fashion_keywords=non_fashion_keywords,
+            fashion_patterns=fashion_patterns,
+            fashion_keywords=fashion_keywords,
+            product_attributes=MappingProxyType(product_attributes),
+            category_mapping=MappingProxyType(category_mapping),
+            allowed_categories=allowed_categories,
+            fashion_regex=fashion_regex,
+            attribute_regex=MappingProxyType({
+                attr_type: _compile_alternation(values)
+                for attr_type, values in product_attributes.items()
+            }),
+            content_hash=hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        )
+
+    # 키워드 관련 조회
+    def get_stop_words(self):
+        """불용어 목록 반환"""
+        return self.stop_words
+
+    def get_non_fashion_keywords(self):
+        """비패션 키워드 목록 반환"""
+        return self.non_fashion_keywords
+
+    def get_fashion_patterns(self):
+        """패션 관련 패턴 목록 반환"""
+        return self.fashion_patterns
+
+    def get_fashion_keywords(self):
+        """패션 관련 키워드 목록 반환"""
+        return self.fashion_keywords
+
+    # 제품 속성 관련 조회
+    def get_product_attributes(self, attr_type=None):
+        """
+        제품 속성 반환
+
+        Parameters:
+        - attr_type: 속성 타입 (colors, sizes, materials, designs)
+
+        Returns:
+        - 해당 속성 튜플 또는 전체 속성 사전
+        """
+        if attr_type and attr_type in self.product_attributes:
+            return self.product_attributes[attr_type]
+        return self.product_attributes
+
+    def get_attribute_regex(self, attr_type):
+        """속성 값 중 하나라도 포함되는지 찾는 정규식 (대소문자 무시, 긴 값 우선, 없으면 None)"""
+        return self.attribute_regex.get(attr_type)
+
+    # 카테고리 관련 조회
+    def get_category_name(self, category_code):
+        """카테고리 코드에 대한 이름 반환"""
+        code = _normalize_code(category_code)
+        if code is None:
+            return "알 수 없는 카테고리"
+
+        name = self.category_mapping.get(code)
+        if name is None:
+            # 앞의 0을 제거하고 찾기
+            name = self.category_mapping.get(code.lstrip('0'))
+        return name if name is not None else f"알 수 없는 카테고리 ({code})"
+
+    def is_allowed_category(self, category_code):
+        """CSV에 정의된 카테고리인지 확인"""
+        code = _normalize_code(category_code)
+        if code is None:
+            return False
+        return code in self.allowed_categories or code.lstrip('0') in self.allowed_categories
+
+    def allowed_category_mask(self, codes):
+        """
+        카테고리 컬럼의 허용 여부 마스크 (고유 코드당 한 번만 확인)
+
+        Parameters:
+        - codes: 카테고리 코드 시리즈
+
+        Returns:
+        - codes와 같은 인덱스의 불리언 시리즈
+        """
+        positions, uniques = pd.factorize(codes, use_na_sentinel=True)
+        allowed = [self.is_allowed_category(code) for code in uniques] + [False]
+        # 결측(-1)은 마지막(False) 항목을 가리킴
+        return pd.Series(np.array(allowed, dtype=bool)[positions], index=codes.index)
@@ -1,36 +1,55 @@
+import time
 import pandas as pd
 from datetime import datetime
 from config import Config
 from data.data_processor.data_processor import DataProcessor
 
 # 동료 모듈을 상대 경로로 import
-from . import category_analyzer, keyword_analyzer, utils
+from . import category_analyzer, keyword_analyzer
+from .results import AnalysisResult, RankedItems
 
 class BflowAnalyzer:
     """비플로우 주문 데이터 분석 클래스 (모듈화된 각 기능을 활용하여 결과 통합)"""
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, order_filter=None):
         """
         Parameters:
           - config: 설정 객체
+          - order_filter: 파일을 읽을 때 적용할 OrderFilter (기간/채널/카테고리, None이면 전체)
         """
         self.config = config if config is not None else Config()
-        self.data_processor = DataProcessor(self.config)
+        self.order_filter = order_filter
+        self.data_processor = DataProcessor(self.config, order_filter)
         self.output_folder = self.config.create_output_folders()
         self.chart_folder = self.output_folder / 'charts'
         self.now = datetime.now()
         self.timestamp = self.now.strftime("%Y%m%d_%H%M")
-        self.insights = {}
+        self.insights = AnalysisResult()
         self.df = None
+        
+        # 실행 기록용 단계별 행 수와 소요 시간(초)
+        self.row_counts = {}
+        self.timings = {}
     
     def load_data(self, file_path):
         """데이터 로드 및 전처리 (허용된 카테고리만 필터링)"""
+        start = time.perf_counter()
         self.df = self.data_processor.load_data(file_path)
+        self.insights['source'] = str(file_path)
+        loaded = len(self.df) if self.df is not None else 0
+        loader_counts = self.data_processor.data_loader.row_counts
+        self.row_counts = {key: loader_counts[key] for key in ('source', 'read') if key in loader_counts}
+        self.row_counts['loaded'] = loader_counts.get('loaded', loaded)
         
         # CSV에 정의된 카테고리의 상품만 필터링
         self.df = self.data_processor.filter_allowed_categories()
+        self.row_counts['filtered'] = len(self.df)
+        
+        # 컬럼별 고유값 수/결측률 프로파일 (집계 방식 자동 선택 및 대시보드 표시용)
+        self.insights['data_profile'] = self.data_processor.profile_data()
         
         self.insights['start_date'], self.insights['end_date'] = self.data_processor.get_analysis_period()
+        self.timings['load'] = time.perf_counter() - start
         return self.df
     
     def analyze_data(self):
@@ -38,23 +57,24 @@ class BflowAnalyzer:
         데이터 분석 수행 및 최종 인사이트 조합
         
         Returns:
-          - 분석 결과(insights) 딕셔너리
+          - 분석 결과(AnalysisResult, 딕셔너리처럼 조회 가능)
         """
         if self.df is None or self.df.empty:
             print("분석할 데이터가 없습니다. load_data 메소드를 먼저 호출하세요.")
-            return {}
+            return AnalysisResult()
         
         print("데이터 분석 수행 중...")
+        start = time.perf_counter()
         
         try:
-            # 1. 판매 채널 분석
-            channels = self.data_processor.get_channel_data()
+            # 1. 판매 채널 분석 (전체 채널 순위, 상위 10개는 복사 없는 뷰)
+            channel_counts, top3_ratio, top3_channels = self.data_processor.get_channel_data()
+            channel_items = RankedItems.from_series(channel_counts)
             self.insights['channels'] = {
-                'counts': channels[0],
-                'top_channels': channels[1],
-                'top3_ratio': channels[2],
-                'top3_channels': channels[3],
-                'channel_data': channels[4]
+                'counts': channel_items,
+                'top_channels': channel_items.head(10),
+                'top3_ratio': top3_ratio,
+                'top3_channels': top3_channels
             }
             
             # 2. 카테고리 분석 (모듈화된 함수 호출)
@@ -62,38 +82,40 @@ class BflowAnalyzer:
             
             # 3. 상품 속성 분석
             self.insights['product_keywords'] = {
-                'top_keywords': self.data_processor.extract_product_keywords()
+                'top_keywords': RankedItems.from_pairs(self.data_processor.extract_product_keywords())
             }
-            self.insights['colors'] = utils.format_items(self.data_processor.extract_colors())
+            self.insights['colors'] = RankedItems.from_pairs(self.data_processor.extract_colors())
             
             sizes, free_size_ratio = self.data_processor.extract_sizes()
             self.insights['sizes'] = {
-                'top_items': sizes,
-                'free_size_ratio': free_size_ratio,
-                'formatted': utils.format_items(sizes)
+                'top_items': RankedItems.from_pairs(sizes),
+                'free_size_ratio': free_size_ratio
             }
-            self.insights['materials'] = utils.format_items(self.data_processor.extract_materials())
-            self.insights['designs'] = utils.format_items(self.data_processor.extract_designs())
+            self.insights['materials'] = RankedItems.from_pairs(self.data_processor.extract_materials())
+            self.insights['designs'] = RankedItems.from_pairs(self.data_processor.extract_designs())
             
             # 4. 가격대, 베스트셀러, 채널별 가격 분석
-            price_ranges = self.data_processor.analyze_price_ranges()
+            price_distribution = self.data_processor.analyze_price_distribution()
+            price_counts = self.data_processor.analyze_price_ranges(price_distribution)
             self.insights['price_ranges'] = {
-                'counts': price_ranges[0],
-                'percent': price_ranges[1],
-                'price_data': price_ranges[2]
+                'counts': RankedItems.from_series(price_counts)
             }
-            bestsellers = self.data_processor.analyze_bestsellers()
+            if price_distribution is not None:
+                self.insights['price_ranges']['by_channel'] = price_distribution.group_counts('channel')
+                self.insights['price_ranges']['by_category'] = price_distribution.group_counts('category')
+            top_products = self.data_processor.analyze_bestsellers()
             self.insights['bestsellers'] = {
-                'top_products': bestsellers[0],
-                'bestseller_data': bestsellers[1]
+                'top_products': RankedItems.from_series(top_products)
             }
-            self.insights['channel_prices'] = self.data_processor.analyze_channel_prices()
+            price_statistics = self.data_processor.analyze_price_statistics()
+            self.insights['price_statistics'] = price_statistics
+            self.insights['channel_prices'] = self.data_processor.analyze_channel_prices(price_statistics)
             
             # 5. 자동 키워드 추출 (모듈화된 함수 호출)
-            self.insights['auto_keywords'] = keyword_analyzer.extract_auto_keywords(self.df, self.config)
+            self.insights['auto_keywords'] = keyword_analyzer.extract_auto_keywords(self.df, self.config, self.data_processor.profile)
             
-            # 6. 전체 데이터프레임 저장 (후속 모듈 참조용)
-            self.insights['df'] = self.df
+            # 6. 분석 대상 행 수 (원본 데이터프레임은 결과에 포함하지 않음)
+            self.insights['row_count'] = len(self.df)
             
             print("데이터 분석 완료")
         except Exception as e:
@@ -101,4 +123,14 @@ class BflowAnalyzer:
             import traceback
             traceback.print_exc()
         
+        self.timings['analyze'] = time.perf_counter() - start
         return self.insights
+    
+    def release_data(self):
+        """
+        분석이 끝난 원본 데이터프레임 참조 해제
+        (이후 요약, 템플릿 렌더링, PDF 생성 동안에는 집계 결과만 메모리에 유지)
+        """
+        self.df = None
+        self.insights.release()
+        self.data_processor.release_data()
@@ -1,5 +1,5 @@
 # data/analyzer/category_analyzer.py
-import pandas as pd
+from .results import RankedItems
 
 def analyze_categories(df, config):
     """
@@ -8,8 +8,8 @@ def analyze_categories(df, config):
     """
     if '상품 카테고리' not in df.columns:
         return {
-            'counts': pd.Series(dtype=int),
-            'top_categories': pd.Series(dtype=int)
+            'counts': RankedItems.empty(),
+            'top_categories': RankedItems.empty()
         }
     
     category_counts = df['상품 카테고리'].value_counts()
@@ -45,22 +45,15 @@ def analyze_categories(df, config):
                     }
                 depth_analysis[depth1]['subcategories'][depth2]['count'] += top_categories[cat]
     
-    # 카테고리 매핑 적용
+    # 카테고리 매핑 적용 (전체 카테고리, 빈도순)
     category_mapping = {}
-    for cat in top_categories.index:
+    for cat in category_counts.index:
         category_mapping[cat] = config.get_category_name(cat)
         
+    counts = RankedItems.from_series(category_counts)
     return {
-        'counts': category_counts,
-        'top_categories': top_categories,
+        'counts': counts,
+        'top_categories': counts.head(10),
         'mapping': category_mapping,
-        'depth_analysis': depth_analysis,
-        'category_data': [
-            {
-                'name': config.get_category_name(cat),
-                'id': cat,
-                'value': count
-            }
-            for cat, count in top_categories.items()
-        ]
-    }
\ No newline at end of file
+        'depth_analysis': depth_analysis
+    }
@@ -1,16 +1,18 @@
 # data/analyzer/keyword_analyzer.py
 from data.keyword_extractor import KeywordExtractor
+from .results import RankedItems
 
-def extract_auto_keywords(df, config):
+def extract_auto_keywords(df, config, profile=None):
     """
     자동 키워드 추출 함수.
     df와 config를 기반으로 KeywordExtractor를 활용하여 자동 키워드를 추출합니다.
+    profile이 주어지면 집계 백엔드 자동 선택에 사용합니다.
     """
     if df is None or df.empty:
         return {}
     
     try:
-        extractor = KeywordExtractor(df, config)
+        extractor = KeywordExtractor(df, config, profile)
         
         # 스타일 키워드 추출
         style_keywords = extractor.extract_style_keywords(
@@ -28,8 +30,8 @@ def extract_auto_keywords(df, config):
         
         result = {
             'style_keywords': style_keywords,
-            'additional_product_keywords': additional_keywords,
-            'color_groups': color_groups
+            'additional_product_keywords': RankedItems.from_pairs(additional_keywords or []),
+            'color_groups': RankedItems.from_pairs(color_groups or [])
         }
         
         # 디버깅용 출력
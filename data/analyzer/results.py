@@ -0,0 +1,231 @@
+# data/analyzer/results.py
+"""
+분석 결과(insights) 구조 모듈
+"""
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True, eq=False)
+class RankedItems:
+    """
+    이름/값/비율을 병렬 numpy 배열로 보관하는 순위 항목 (채널, 색상, 가격대, 베스트셀러 등)
+
+    (이름, 값) 튜플 리스트처럼 순회/슬라이싱할 수 있으며, 슬라이스는 배열을 복사하지 않는 뷰입니다.
+    차트/테이블/요약용 딕셔너리 리스트는 to_records() 한 곳에서만 만듭니다.
+    """
+    labels: np.ndarray
+    values: np.ndarray
+    percents: np.ndarray
+
+    # to_records()에서 사용할 수 있는 필드
+    RECORD_FIELDS = ('rank', 'name', 'product', 'count', 'value', 'percent', 'range')
+
+    @classmethod
+    def from_arrays(cls, labels, values, total=None):
+        """
+        이름/값 배열에서 생성
+
+        Parameters:
+        - labels: 항목 이름 배열
+        - values: 항목 값 배열
+        - total: 비율 계산 기준 합계 (None이면 values 합계)
+        """
+        labels = np.asarray(labels, dtype=object)
+        values = np.asarray(values)
+        if values.dtype == object:
+            values = values.astype('float64')
+        total = values.sum() if total is None else total
+        if total:
+            percents = values / total * 100
+        else:
+            percents = np.zeros(len(values), dtype='float64')
+        return cls(labels, values, percents)
+
+    @classmethod
+    def from_pairs(cls, pairs, total=None):
+        """(이름, 값) 튜플 목록에서 생성 (Counter.most_common() 결과 등)"""
+        pairs = list(pairs)
+        return cls.from_arrays([pair[0] for pair in pairs], [pair[1] for pair in pairs], total)
+
+    @classmethod
+    def from_series(cls, series, total=None):
+        """인덱스가 이름인 시리즈에서 생성 (value_counts() 결과 등)"""
+        if series is None:
+            return cls.empty()
+        return cls.from_arrays(series.index.to_numpy(dtype=object), series.to_numpy(), total)
+
+    @classmethod
+    def empty(cls):
+        """빈 순위 항목"""
+        return cls.from_arrays([], np.zeros(0, dtype='int64'))
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __iter__(self):
+        return zip(self.labels.tolist(), self.values.tolist())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return RankedItems(self.labels[key], self.values[key], self.percents[key])
+        return self.labels[key], self.values[key].item()
+
+    def head(self, n):
+        """상위 n개 항목 (복사 없는 뷰)"""
+        return self[:n]
+
+    def get(self, label, default=None):
+        """이름에 해당하는 값 (없으면 default)"""
+        positions = np.flatnonzero(self.labels == label)
+        return self.values[positions[0]].item() if len(positions) else default
+
+    def percent_of(self, label, decimals=1):
+        """이름에 해당하는 비율(%) (없으면 0)"""
+        positions = np.flatnonzero(self.labels == label)
+        return round(float(self.percents[positions[0]]), decimals) if len(positions) else 0
+
+    def idxmax(self):
+        """값이 가장 큰 항목의 이름 (비어 있으면 None)"""
+        return self.labels[int(np.argmax(self.values))] if len(self) else None
+
+    def total(self):
+        """값 합계"""
+        return self.values.sum().item()
+
+    def to_series(self):
+        """이름 인덱스 시리즈로 변환"""
+        return pd.Series(self.values, index=pd.Index(self.labels, dtype=object))
+
+    def to_records(self, fields=('name', 'value'), name_length=None):
+        """
+        차트/테이블용 딕셔너리 리스트로 변환 (JSON 직렬화 가능한 기본 타입)
+
+        Parameters:
+        - fields: 포함할 필드 (RECORD_FIELDS 중에서 선택, 'count'는 'value'와 같은 값,
+          'range'는 'name'과 같은 값, 'product'는 줄이지 않은 이름)
+        - name_length: 'name'의 최대 길이 (넘으면 잘라서 '...' 표시, None이면 그대로)
+
+        Returns:
+        - [{'name': ..., 'value': ..., ...}, ...]
+        """
+        unknown = set(fields) - set(self.RECORD_FIELDS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 필드: {sorted(unknown)}")
+
+        labels = self.labels.tolist()
+        values = self.values.tolist()
+        percents = np.round(self.percents, 1).tolist()
+        records = []
+        for position, (label, value, percent) in enumerate(zip(labels, values, percents)):
+            name = label
+            if name_length is not None and isinstance(label, str) and len(label) > name_length:
+                name = label[:name_length - 3] + "..."
+            columns = {
+                'rank': position + 1, 'name': name, 'product': label, 'count': value,
+                'value': value, 'percent': percent, 'range': label
+            }
+            records.append({field_name: columns[field_name] for field_name in fields})
+        return records
+
+
+@dataclass(slots=True)
+class AnalysisMetadata:
+    """
+    분석 메타데이터 (원본 데이터 없이 리포트에 필요한 정보)
+
+    - row_count: 분석 대상 주문 행 수 (허용 카테고리 필터링 후)
+    - start_date, end_date: 분석 기간 표시 문자열
+    - source: 원본 파일 경로
+    - analyzed_at: 분석 시각
+    """
+    row_count: int = 0
+    start_date: str = None
+    end_date: str = None
+    source: str = None
+    analyzed_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(slots=True, eq=False)
+class AnalysisResult(MutableMapping):
+    """
+    BflowAnalyzer 분석 결과
+
+    채널/카테고리/속성/가격 등 섹션별 집계 결과와 메타데이터만 보관하며,
+    기존 insights 딕셔너리처럼 insights['channels'], insights.get('start_date')로 조회합니다.
+    메타데이터 필드(row_count, start_date, end_date, source, analyzed_at)는 같은 이름의 키로도 접근되며,
+    값이 설정되지 않은(None) 항목은 없는 키로 취급되어 insights.get('start_date', '알 수 없음')이 기본값을 반환합니다.
+    원본 데이터프레임은 결과에 포함되지 않고, 필요한 구간에서만 attach()/attached()로
+    명시적으로 붙였다가 release()로 해제합니다.
+    """
+    metadata: AnalysisMetadata = field(default_factory=AnalysisMetadata)
+    sections: dict = field(default_factory=dict)
+    _frame: object = field(default=None, repr=False)
+
+    _METADATA_KEYS = ('row_count', 'start_date', 'end_date', 'source', 'analyzed_at')
+
+    # 매핑 인터페이스 (기존 insights 딕셔너리 호환)
+    def __getitem__(self, key):
+        if key in self._METADATA_KEYS:
+            value = getattr(self.metadata, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.sections[key]
+
+    def __setitem__(self, key, value):
+        if key in self._METADATA_KEYS:
+            setattr(self.metadata, key, value)
+        else:
+            self.sections[key] = value
+
+    def __delitem__(self, key):
+        if key in self._METADATA_KEYS:
+            raise KeyError(f"메타데이터 항목은 삭제할 수 없습니다: {key}")
+        del self.sections[key]
+
+    def _present_metadata_keys(self):
+        """값이 설정된 메타데이터 키"""
+        return [key for key in self._METADATA_KEYS if getattr(self.metadata, key) is not None]
+
+    def __iter__(self):
+        yield from self._present_metadata_keys()
+        yield from self.sections
+
+    def __len__(self):
+        return len(self._present_metadata_keys()) + len(self.sections)
+
+    # 원본 데이터프레임 첨부
+    @property
+    def frame(self):
+        """첨부된 원본 데이터프레임 (해제되었으면 None)"""
+        return self._frame
+
+    def attach(self, frame):
+        """원본 데이터프레임 첨부 (후속 처리에서 행 단위 데이터가 필요할 때만 사용)"""
+        self._frame = frame
+        return self
+
+    def release(self):
+        """첨부된 원본 데이터프레임 해제"""
+        self._frame = None
+        return self
+
+    @contextmanager
+    def attached(self, frame):
+        """
+        with 블록 안에서만 원본 데이터프레임을 첨부
+
+        Parameters:
+        - frame: 원본 데이터프레임
+        """
+        self.attach(frame)
+        try:
+            yield self
+        finally:
+            self.release()
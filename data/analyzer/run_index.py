@@ -0,0 +1,416 @@
+# data/analyzer/run_index.py
+"""
+실행 기록(run manifest) 저장소와 실행 간 비교 모듈
+
+실행마다 입력 파일 지문, 설정 해시, 행 수, 단계별 소요 시간, 주요 집계(순위 항목 상위 N개)를
+작은 JSON 매니페스트로 저장하고 index.jsonl에 한 줄씩 추가합니다.
+비교는 저장된 분석 결과 스냅샷(없으면 매니페스트의 집계)만 사용하므로 원본 데이터를 다시 읽지 않습니다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from .results import RankedItems
+from .serialization import load_snapshot
+
+# 매니페스트 형식 버전
+MANIFEST_VERSION = 1
+
+# 비교/집계 대상 섹션 (이름 -> (insights 섹션, 하위 키))
+RANKED_SECTIONS = {
+    'channels': ('channels', 'counts'),
+    'colors': ('colors', None),
+    'bestsellers': ('bestsellers', 'top_products'),
+    'categories': ('categories', 'counts'),
+    'price_ranges': ('price_ranges', 'counts'),
+    'sizes': ('sizes', 'top_items'),
+}
+
+# 기본 비교 섹션
+DEFAULT_COMPARE_SECTIONS = ('channels', 'colors', 'bestsellers')
+
+
+def file_fingerprint(path, chunk_size=1024 * 1024):
+    """
+    입력 파일 지문 (경로, 크기, 수정 시각, sha256)
+
+    Parameters:
+    - path: 파일 경로
+    - chunk_size: 해시 계산 시 한 번에 읽을 바이트 수
+
+    Returns:
+    - 지문 딕셔너리 (파일이 없으면 경로만)
+    """
+    path = Path(path)
+    if not path.is_file():
+        return {'path': str(path)}
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    stat = path.stat()
+    return {
+        'path': str(path.resolve()),
+        'size': stat.st_size,
+        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='seconds'),
+        'sha256': digest.hexdigest()
+    }
+
+
+def ranked_items(insights, section):
+    """insights에서 비교 대상 섹션의 순위 항목 조회 (없으면 None)"""
+    section_name, key = RANKED_SECTIONS[section]
+    items = insights.get(section_name)
+    if key is not None:
+        items = items.get(key) if isinstance(items, dict) else None
+    return items if isinstance(items, RankedItems) else None
+
+
+def key_aggregates(insights, top_n=20):
+    """
+    매니페스트에 저장할 주요 집계 (섹션별 상위 top_n개 [이름, 값])
+
+    Parameters:
+    - insights: 분석 결과
+    - top_n: 섹션별 저장 항목 수
+
+    Returns:
+    - {섹션: [[이름, 값], ...]}
+    """
+    aggregates = {}
+    for section in RANKED_SECTIONS:
+        items = ranked_items(insights, section)
+        if items is not None:
+            aggregates[section] = [[str(label), value] for label, value in items.head(top_n)]
+    return aggregates
+
+
+def build_run_manifest(insights, config=None, source=None, row_counts=None, timings=None, outputs=None, top_n=20,
+                       filters=None):
+    """
+    실행 매니페스트 생성
+
+    Parameters:
+    - insights: 분석 결과 (AnalysisResult)
+    - config: 설정 객체 (설정 해시 기록)
+    - source: 입력 파일 경로 (None이면 insights['source'])
+    - row_counts: 단계별 행 수 {'loaded': n, 'filtered': n}
+    - timings: 단계별 소요 시간(초) {'load': s, 'analyze': s, 'outputs': s}
+    - outputs: 생성된 결과물 경로 {'html': path, 'snapshot': path, ...}
+    - top_n: 섹션별로 저장할 집계 항목 수
+    - filters: 적용한 분석 범위 (OrderFilter.describe(), 전체 분석이면 None)
+
+    Returns:
+    - 매니페스트 딕셔너리
+    """
+    source = source if source is not None else insights.get('source')
+    fingerprint = file_fingerprint(source) if source else {}
+    created_at = datetime.now()
+    run_id = created_at.strftime('%Y%m%d_%H%M%S')
+    if fingerprint.get('sha256'):
+        run_id += f"_{fingerprint['sha256'][:6]}"
+
+    return {
+        'manifest_version': MANIFEST_VERSION,
+        'run_id': run_id,
+        'created_at': created_at.isoformat(timespec='seconds'),
+        'input': fingerprint,
+        'config_hash': config.snapshot().content_hash if config is not None else None,
+        'period': [insights.get('start_date'), insights.get('end_date')],
+        'filters': dict(filters or {}),
+        'row_counts': dict(row_counts or {}, analyzed=insights.get('row_count', 0)),
+        'timings': {stage: round(seconds, 3) for stage, seconds in (timings or {}).items()},
+        'outputs': {
+            name: str(Path(path).resolve()) for name, path in (outputs or {}).items() if isinstance(path, (str, Path))
+        },
+        'aggregates': key_aggregates(insights, top_n)
+    }
+
+
+class RunIndex:
+    """
+    실행 매니페스트 저장소 (<폴더>/<run_id>.json + index.jsonl)
+
+    index.jsonl에는 실행마다 요약 한 줄(run_id, 시각, 입력 파일, 설정 해시, 행 수)을 추가하며,
+    조회는 run_id, run_id 앞부분, 'latest'(마지막), 'previous'(마지막 직전)로 할 수 있습니다.
+    """
+
+    INDEX_NAME = 'index.jsonl'
+
+    def __init__(self, folder):
+        """
+        Parameters:
+        - folder: 매니페스트 저장 폴더
+        """
+        self.folder = Path(folder)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        설정에서 실행 기록 저장소 생성
+
+        Returns:
+        - RunIndex 객체 (비활성화된 경우 None)
+        """
+        settings = config.get_run_index_settings()
+        if not settings['enabled']:
+            return None
+        return cls(settings['folder'])
+
+    @property
+    def index_path(self):
+        return self.folder / self.INDEX_NAME
+
+    def record(self, manifest):
+        """
+        매니페스트 저장 및 색인 추가
+
+        Parameters:
+        - manifest: build_run_manifest()로 만든 매니페스트
+
+        Returns:
+        - 저장된 매니페스트 경로 (실패하면 None)
+        """
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            # 같은 초에 같은 입력으로 실행한 기록이 있으면 run_id 뒤에 번호를 붙여 구분
+            run_id = manifest['run_id']
+            suffix = 1
+            while (self.folder / f"{manifest['run_id']}.json").exists():
+                suffix += 1
+                manifest['run_id'] = f"{run_id}_{suffix}"
+            path = self.folder / f"{manifest['run_id']}.json"
+            temp_path = path.with_suffix('.json.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2, default=str)
+            os.replace(temp_path, path)
+
+            entry = {
+                'run_id': manifest['run_id'],
+                'created_at': manifest['created_at'],
+                'source': manifest['input'].get('path'),
+                'sha256': manifest['input'].get('sha256'),
+                'config_hash': manifest['config_hash'],
+                'rows': manifest['row_counts'].get('analyzed'),
+                'manifest': path.name
+            }
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            return path
+        except OSError as e:
+            print(f"실행 기록 저장 중 오류 발생: {e}")
+            return None
+
+    def entries(self):
+        """색인 항목 목록 (기록 순서)"""
+        if not self.index_path.exists():
+            return []
+        entries = []
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        return entries
+
+    def resolve(self, ref):
+        """
+        실행 참조를 색인 항목으로 변환
+
+        Parameters:
+        - ref: run_id, run_id 앞부분, 'latest', 'previous' 또는 매니페스트 파일 경로
+
+        Returns:
+        - 색인 항목 (찾지 못하거나 앞부분이 여러 실행과 일치하면 ValueError)
+        """
+        if Path(ref).suffix == '.json' and Path(ref).is_file():
+            return {'run_id': Path(ref).stem, 'manifest_path': str(Path(ref))}
+        entries = self.entries()
+        if ref in ('latest', 'previous'):
+            position = -1 if ref == 'latest' else -2
+            if len(entries) < -position:
+                raise ValueError(f"'{ref}' 실행이 없습니다 (기록된 실행 {len(entries)}개)")
+            return entries[position]
+        matches = [entry for entry in entries if entry['run_id'] == ref]
+        if not matches:
+            matches = [entry for entry in entries if entry['run_id'].startswith(ref)]
+        if len(matches) != 1:
+            reason = '없습니다' if not matches else f"{len(matches)}개와 일치합니다"
+            raise ValueError(f"실행 '{ref}'이(가) {reason}")
+        return matches[-1]
+
+    def load(self, ref):
+        """
+        매니페스트 로드
+
+        Parameters:
+        - ref: resolve()와 같음
+
+        Returns:
+        - 매니페스트 딕셔너리
+        """
+        entry = self.resolve(ref)
+        path = Path(entry.get('manifest_path') or self.folder / entry['manifest'])
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def snapshot_matches(insights, manifest):
+    """
+    스냅샷이 매니페스트를 기록한 실행의 결과인지 확인
+
+    분석 행 수와 매니페스트에 저장된 섹션별 상위 집계가 모두 같아야 같은 실행으로 봅니다.
+    (스냅샷 파일이 다른 실행에 덮어쓰였거나 다시 생성된 경우를 걸러냄)
+
+    Parameters:
+    - insights: 스냅샷에서 읽은 분석 결과
+    - manifest: 실행 매니페스트
+
+    Returns:
+    - 일치 여부
+    """
+    if insights.get('row_count') != manifest.get('row_counts', {}).get('analyzed'):
+        return False
+    for section, stored in manifest.get('aggregates', {}).items():
+        # 매니페스트와 같은 방식(JSON 변환)으로 비교
+        current = json.loads(json.dumps(key_aggregates(insights, len(stored)).get(section, []), default=str))
+        if current != stored:
+            return False
+    return True
+
+
+def _ranking(manifest, section, cache):
+    """
+    비교에 사용할 섹션 순위 {이름: (순위, 값)}
+
+    매니페스트와 일치하는 스냅샷이 있으면 전체 순위를, 없으면 매니페스트에 저장된 상위 집계를 사용합니다.
+    """
+    snapshot_path = manifest.get('outputs', {}).get('snapshot')
+    cache_key = (manifest['run_id'], snapshot_path)
+    if snapshot_path and cache_key not in cache:
+        insights = load_snapshot(snapshot_path) if Path(snapshot_path).exists() else None
+        if insights is not None and not snapshot_matches(insights, manifest):
+            print(f"스냅샷이 실행 기록({manifest['run_id']})과 달라 저장된 상위 집계로 비교합니다: {snapshot_path}")
+            insights = None
+        cache[cache_key] = insights
+    insights = cache.get(cache_key)
+
+    if insights is not None:
+        items = ranked_items(insights, section)
+        pairs = [(str(label), value) for label, value in items] if items is not None else []
+    else:
+        pairs = [tuple(pair) for pair in manifest.get('aggregates', {}).get(section, [])]
+    return {name: (rank, value) for rank, (name, value) in enumerate(pairs, start=1)}
+
+
+def compare_runs(base, target, sections=DEFAULT_COMPARE_SECTIONS, top_n=10):
+    """
+    두 실행의 순위 변화 비교 (저장된 스냅샷/매니페스트만 사용)
+
+    Parameters:
+    - base: 기준 실행 매니페스트
+    - target: 비교 실행 매니페스트
+    - sections: 비교할 섹션 (RANKED_SECTIONS 중)
+    - top_n: 섹션별로 비교할 상위 항목 수 (두 실행 중 한쪽이라도 상위 top_n인 항목)
+
+    Returns:
+    - {'base': run_id, 'target': run_id, 'row_counts': (기준, 비교), 'filters': (기준, 비교),
+       'sections': {섹션: [변화 행, ...]}}
+      변화 행: {'name', 'base_rank', 'target_rank', 'rank_change', 'base_value', 'target_value', 'value_change'}
+      (순위 변화는 양수가 상승, 한쪽에 없는 항목은 순위 None)
+    """
+    cache = {}
+    comparison = {
+        'base': base['run_id'],
+        'target': target['run_id'],
+        'row_counts': (base['row_counts'].get('analyzed'), target['row_counts'].get('analyzed')),
+        'filters': (base.get('filters') or {}, target.get('filters') or {}),
+        'sections': {}
+    }
+    for section in sections:
+        if section not in RANKED_SECTIONS:
+            raise ValueError(f"비교할 수 없는 섹션: {section} (사용 가능: {', '.join(RANKED_SECTIONS)})")
+        base_ranking = _ranking(base, section, cache)
+        target_ranking = _ranking(target, section, cache)
+        names = dict.fromkeys(
+            [name for name, (rank, _) in target_ranking.items() if rank <= top_n]
+            + [name for name, (rank, _) in base_ranking.items() if rank <= top_n]
+        )
+
+        rows = []
+        for name in names:
+            base_rank, base_value = base_ranking.get(name, (None, 0))
+            target_rank, target_value = target_ranking.get(name, (None, 0))
+            rows.append({
+                'name': name,
+                'base_rank': base_rank,
+                'target_rank': target_rank,
+                'rank_change': base_rank - target_rank if base_rank and target_rank else None,
+                'base_value': base_value,
+                'target_value': target_value,
+                'value_change': target_value - base_value
+            })
+        rows.sort(key=lambda row: (row['target_rank'] is None, row['target_rank'] or row['base_rank']))
+        comparison['sections'][section] = rows
+    return comparison
+
+
+def _format_filters(filters):
+    """매니페스트의 분석 범위를 한 줄로 표시 (범위가 없으면 '전체')"""
+    parts = []
+    if 'from' in filters or 'to' in filters:
+        parts.append(f"{filters.get('from', '처음')} ~ {filters.get('to', '끝')}")
+    for key, label in (('channels', '채널'), ('categories', '카테고리')):
+        if filters.get(key):
+            parts.append(f"{label} {', '.join(filters[key])}")
+    return ' / '.join(parts) or '전체'
+
+
+def format_comparison(comparison):
+    """
+    비교 결과를 출력용 텍스트로 변환
+
+    Returns:
+    - 여러 줄 문자열
+    """
+    section_titles = {
+        'channels': '판매 채널', 'colors': '색상', 'bestsellers': '베스트셀러',
+        'categories': '카테고리', 'price_ranges': '가격대', 'sizes': '사이즈'
+    }
+    base_rows, target_rows = comparison['row_counts']
+    lines = [
+        f"실행 비교: {comparison['base']} -> {comparison['target']}",
+        f"분석 행 수: {base_rows or 0:,} -> {target_rows or 0:,}"
+    ]
+    base_filters, target_filters = comparison.get('filters', ({}, {}))
+    if base_filters or target_filters:
+        lines.append(f"분석 범위: {_format_filters(base_filters)} -> {_format_filters(target_filters)}")
+    for section, rows in comparison['sections'].items():
+        lines.append('')
+        lines.append(f"[{section_titles.get(section, section)}]")
+        if not rows:
+            lines.append("  비교할 데이터가 없습니다")
+            continue
+        for row in rows:
+            if row['base_rank'] is None:
+                change = 'NEW'
+            elif row['target_rank'] is None:
+                change = 'OUT'
+            elif row['rank_change'] > 0:
+                change = f"▲{row['rank_change']}"
+            elif row['rank_change'] < 0:
+                change = f"▼{-row['rank_change']}"
+            else:
+                change = '-'
+            base_rank = row['base_rank'] or '-'
+            target_rank = row['target_rank'] or '-'
+            lines.append(
+                f"  {str(target_rank):>3} ({str(base_rank):>3}) {change:<5} {row['name'][:40]:<40} "
+                f"{row['base_value']:>10,.0f} -> {row['target_value']:>10,.0f} ({row['value_change']:+,.0f})"
+            )
+    return '\n'.join(lines)
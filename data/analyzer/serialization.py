@@ -0,0 +1,205 @@
+# data/analyzer/serialization.py
+"""
+분석 결과(AnalysisResult) 스냅샷 저장/로드 모듈
+
+스냅샷은 하나의 .npz 파일로, 숫자 배열(순위 항목 값/비율, 데이터프레임 숫자 컬럼)은
+numpy 배열 그대로 저장하고 나머지 구조(섹션 딕셔너리, 이름, 문자열 컬럼, 메타데이터)는
+스키마 버전과 함께 JSON으로 직렬화해 같은 파일 안에 저장합니다.
+pickle을 사용하지 않으므로 로드 시 임의 코드가 실행되지 않습니다.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .results import AnalysisMetadata, AnalysisResult, RankedItems
+
+# 스냅샷 스키마 버전 (구조가 바뀌면 올리고, 다른 버전의 스냅샷은 로드하지 않음)
+SCHEMA_VERSION = 1
+
+# 구조 JSON을 담는 배열 이름과 스냅샷 파일 확장자
+STRUCTURE_KEY = '__structure__'
+SNAPSHOT_SUFFIX = '.insights.npz'
+
+# 값 종류 표시 키
+_TYPE = '__type__'
+
+
+def snapshot_path_for(html_path):
+    """대시보드 HTML 파일 옆에 저장할 스냅샷 경로 (dashboard_x.html -> dashboard_x.insights.npz)"""
+    html_path = Path(html_path)
+    return html_path.with_name(html_path.stem + SNAPSHOT_SUFFIX)
+
+
+class _Encoder:
+    """분석 결과 값을 JSON 구조 + 숫자 배열로 분리"""
+
+    def __init__(self):
+        self.arrays = {}
+
+    def _array(self, values):
+        name = f"a{len(self.arrays)}"
+        self.arrays[name] = np.ascontiguousarray(values)
+        return name
+
+    def _column(self, values):
+        """숫자/불리언 컬럼은 배열로, 그 외(문자열 등)는 JSON 리스트로"""
+        values = np.asarray(values)
+        if values.dtype.kind in 'biuf':
+            return {_TYPE: 'array', 'array': self._array(values)}
+        return self.encode(values.tolist())
+
+    def encode(self, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, RankedItems):
+            return {
+                _TYPE: 'ranked',
+                'labels': self.encode(value.labels.tolist()),
+                'values': self._array(value.values),
+                'percents': self._array(value.percents)
+            }
+        if isinstance(value, pd.DataFrame):
+            return {
+                _TYPE: 'frame',
+                'index': self._column(value.index),
+                'index_name': value.index.name,
+                'columns': self.encode(value.columns.tolist()),
+                'data': [self._column(value.iloc[:, position]) for position in range(value.shape[1])]
+            }
+        if isinstance(value, pd.Series):
+            return {
+                _TYPE: 'series',
+                'index': self._column(value.index),
+                'name': self.encode(value.name),
+                'values': self._column(value)
+            }
+        if isinstance(value, np.ndarray):
+            return self._column(value)
+        if isinstance(value, datetime):
+            return {_TYPE: 'datetime', 'value': value.isoformat()}
+        if isinstance(value, tuple):
+            return {_TYPE: 'tuple', 'items': [self.encode(item) for item in value]}
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value) and _TYPE not in value:
+                return {key: self.encode(item) for key, item in value.items()}
+            return {_TYPE: 'dict', 'items': [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        raise TypeError(f"스냅샷에 저장할 수 없는 값 형식입니다: {type(value).__name__}")
+
+
+class _Decoder:
+    """JSON 구조 + 숫자 배열에서 분석 결과 값 복원"""
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+
+    def _column(self, node):
+        if isinstance(node, dict) and node.get(_TYPE) == 'array':
+            return self.arrays[node['array']]
+        return np.asarray(self.decode(node), dtype=object)
+
+    def decode(self, node):
+        if isinstance(node, list):
+            return [self.decode(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        kind = node.get(_TYPE)
+        if kind is None:
+            return {key: self.decode(item) for key, item in node.items()}
+        if kind == 'ranked':
+            labels = np.empty(len(node['labels']), dtype=object)
+            labels[:] = self.decode(node['labels'])
+            return RankedItems(labels, self.arrays[node['values']], self.arrays[node['percents']])
+        if kind == 'frame':
+            index = pd.Index(self._column(node['index']), name=node['index_name'])
+            columns = self.decode(node['columns'])
+            data = {position: self._column(column) for position, column in enumerate(node['data'])}
+            frame = pd.DataFrame(data, index=index)
+            frame.columns = columns
+            return frame
+        if kind == 'series':
+            return pd.Series(self._column(node['values']), index=self._column(node['index']), name=self.decode(node['name']))
+        if kind == 'array':
+            return self.arrays[node['array']]
+        if kind == 'datetime':
+            return datetime.fromisoformat(node['value'])
+        if kind == 'tuple':
+            return tuple(self.decode(item) for item in node['items'])
+        if kind == 'dict':
+            return {self.decode(key): self.decode(item) for key, item in node['items']}
+        raise ValueError(f"알 수 없는 스냅샷 값 형식입니다: {kind}")
+
+
+def save_snapshot(result, path):
+    """
+    분석 결과를 스냅샷 파일로 저장
+
+    Parameters:
+    - result: AnalysisResult (또는 같은 구조의 insights 딕셔너리)
+    - path: 저장 경로 (.npz)
+
+    Returns:
+    - 저장된 파일 경로 (실패하면 None)
+    """
+    try:
+        encoder = _Encoder()
+        if isinstance(result, AnalysisResult):
+            metadata = {name: getattr(result.metadata, name) for name in AnalysisResult._METADATA_KEYS}
+            sections = result.sections
+        else:
+            metadata = {}
+            sections = dict(result)
+
+        structure = {
+            'schema_version': SCHEMA_VERSION,
+            'metadata': encoder.encode(metadata),
+            'sections': encoder.encode(sections)
+        }
+        payload = json.dumps(structure, ensure_ascii=False).encode('utf-8')
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **{STRUCTURE_KEY: np.frombuffer(payload, dtype=np.uint8)}, **encoder.arrays)
+        return path
+    except Exception as e:
+        print(f"분석 결과 스냅샷 저장 중 오류 발생: {e}")
+        return None
+
+
+def load_snapshot(path):
+    """
+    스냅샷 파일에서 분석 결과 로드
+
+    Parameters:
+    - path: 스냅샷 파일 경로
+
+    Returns:
+    - AnalysisResult (읽을 수 없거나 스키마 버전이 다르면 None)
+    """
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+        structure = json.loads(arrays.pop(STRUCTURE_KEY).tobytes().decode('utf-8'))
+    except Exception as e:
+        print(f"분석 결과 스냅샷을 읽을 수 없습니다 ({path}): {e}")
+        return None
+
+    version = structure.get('schema_version')
+    if version != SCHEMA_VERSION:
+        print(f"지원하지 않는 스냅샷 스키마 버전입니다: {version} (현재 {SCHEMA_VERSION})")
+        return None
+
+    decoder = _Decoder(arrays)
+    metadata = decoder.decode(structure['metadata'])
+    return AnalysisResult(
+        metadata=AnalysisMetadata(**metadata) if metadata else AnalysisMetadata(),
+        sections=decoder.decode(structure['sections'])
+    )
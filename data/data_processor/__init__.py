@@ -5,11 +5,19 @@ from data.data_processor.data_processor import DataProcessor
 from data.data_processor.data_loader import DataLoader
 from data.data_processor.attribute_extractor import AttributeExtractor
 from data.data_processor.sales_analyzer import SalesAnalyzer
+from data.data_processor.data_profiler import DataProfiler
+from data.data_processor.price_statistics import PriceStatistics
+from data.data_processor.option_parser import OptionParser
+from data.data_processor.order_filter import OrderFilter
 
 # 이 패키지에서 외부로 노출할 클래스 목록
 __all__ = [
     'DataProcessor',    # 주로 이 클래스만 외부에서 직접 사용됨
     'DataLoader',       # 필요시 직접 사용 가능
     'AttributeExtractor',
-    'SalesAnalyzer'
+    'SalesAnalyzer',
+    'DataProfiler',
+    'PriceStatistics',
+    'OptionParser',
+    'OrderFilter'
 ]
\ No newline at end of file
@@ -1,7 +1,11 @@
 # data/data_processor/attribute_extractor.py
-import re
 from collections import Counter
+import numpy as np
 from config import Config
+from utils import FashionTokenizer, clean_text
+from data.sketches import create_counter
+from data.data_processor.data_profiler import DataProfiler
+from data.data_processor.option_parser import OptionParser
 
 class AttributeExtractor:
     """상품 속성(키워드, 색상, 사이즈, 소재, 디자인 등) 추출을 담당하는 클래스"""
@@ -14,95 +18,106 @@ class AttributeExtractor:
         """
         self.df = df
         self.config = config if config is not None else Config()
+        # 데이터 프로파일 (DataProcessor.profile_data()에서 설정, 집계 백엔드 자동 선택에 사용)
+        self.profile = None
     
     def extract_product_keywords(self):
         """상품명에서 키워드 추출"""
         if '상품명' not in self.df.columns:
             return []
         
-        # 불용어 목록 가져오기
-        stop_words = self.config.get_stop_words()
+        # 상품명 전처리 (소문자 변환, 특수문자 제거)
+        # 불용어/비패션 키워드는 토크나이저가 분할된 토큰 단위로 제거
+        processed_names = self.df['상품명'].astype(str).map(clean_text)
         
-        def preprocess_product_name(name):
-            if not isinstance(name, str):
-                return ""
-            # 소문자 변환 및 특수문자 제거
-            name = name.lower()
-            # 불용어 제거
-            for word in stop_words:
-                name = name.replace(word.lower(), ' ')
-            # 특수문자 제거 (알파벳, 숫자, 한글, 공백만 남김)
-            name = re.sub(r'[^\w\s가-힣]', ' ', name)
-            # 연속된 공백 제거
-            name = re.sub(r'\s+', ' ', name).strip()
-            return name
+        # 패션 사전 기반 토크나이저로 붙여 쓴 상품명 분할 (자주 나오는 미등록 구간은 어휘로 학습)
+        tokenizer = FashionTokenizer.from_config(self.config).learn(processed_names)
         
-        # 상품명 전처리
-        processed_names = self.df['상품명'].astype(str).apply(preprocess_product_name)
+        # 토큰 id 배열 -> bincount 빈도를 청크 단위로 집계 백엔드에 누적
+        distinct_hint = DataProfiler.distinct_count(self.profile, '상품명')
+        counter = create_counter(**self.config.get_counter_settings(distinct_hint))
+        chunk_size = 50000
+        for start in range(0, len(processed_names), chunk_size):
+            ids, _ = tokenizer.encode(processed_names.iloc[start:start + chunk_size])
+            counts = tokenizer.count(ids)
+            present = np.flatnonzero(counts)
+            counter.update([tokenizer.tokens[i] for i in present], counts[present])
         
-        # 단어 추출 및 빈도 계산
-        all_words = []
-        for name in processed_names:
-            words = re.findall(r'\b[가-힣a-zA-Z]{2,}\b', name)  # 2글자 이상 단어만 추출
-            all_words.extend(words)
-        
-        word_counts = Counter(all_words)
-        top_keywords = word_counts.most_common(20)
+        top_keywords = counter.most_common(20)
         return top_keywords
 
-    def _extract_option_attribute(self, keywords, top_n=10):
-        """옵션정보 컬럼에서 키워드 추출 (공통 함수)"""
+    def _option_column(self, column):
+        """
+        옵션정보 파싱 결과 컬럼 반환 (DataLoader에서 파싱하지 않은 경우 여기서 파싱)
+        
+        Parameters:
+        - column: OptionParser.COLOR_COLUMN 또는 OptionParser.SIZE_COLUMN
+        
+        Returns:
+        - 범주형 시리즈 (옵션정보 컬럼이 없으면 None)
+        """
+        if column in self.df.columns:
+            return self.df[column]
         if '옵션정보' not in self.df.columns:
-            return []
-        extracted = []
-        for option in self.df['옵션정보'].dropna().astype(str):
-            for keyword in keywords:
-                if keyword in option:
-                    extracted.append(keyword)
-                    break
-        return Counter(extracted).most_common(top_n)
+            return None
+        return OptionParser(self.config).parse(self.df['옵션정보'])[column]
     
     def extract_colors(self):
         """옵션정보에서 색상 추출"""
-        color_keywords = self.config.get_product_attributes('colors')
-        return self._extract_option_attribute(color_keywords, top_n=10)
+        colors = self._option_column(OptionParser.COLOR_COLUMN)
+        if colors is None:
+            return []
+        counts = colors.value_counts()
+        counts = counts[counts > 0]
+        return [(color, int(count)) for color, count in counts.head(10).items()]
     
     def extract_sizes(self):
         """옵션정보에서 사이즈 추출 및 FREE 사이즈 비율 계산"""
-        size_keywords = self.config.get_product_attributes('sizes')
-        # 공통 함수로 사이즈 추출
-        extracted = []
-        if '옵션정보' in self.df.columns:
-            for option in self.df['옵션정보'].dropna().astype(str):
-                for size in size_keywords:
-                    if size in option:
-                        extracted.append(size)
-                        break
-        size_counts = Counter(extracted)
-        top_sizes = size_counts.most_common(10)
-        free_size_count = size_counts.get('FREE', 0)
-        free_size_ratio = (free_size_count / sum(size_counts.values()) * 100) if size_counts else 0
+        sizes = self._option_column(OptionParser.SIZE_COLUMN)
+        if sizes is None:
+            return [], 0
+        size_counts = sizes.value_counts()
+        size_counts = size_counts[size_counts > 0]
+        top_sizes = [(size, int(count)) for size, count in size_counts.head(10).items()]
+        
+        # FREE(44-66) 등 FREE 계열 사이즈 포함
+        total = size_counts.sum()
+        free_size_count = size_counts[size_counts.index.astype(str).str.startswith('FREE')].sum()
+        free_size_ratio = float(free_size_count / total * 100) if total else 0
         
         return top_sizes, free_size_ratio
     
-    def _extract_attribute_from_columns(self, columns, keywords, top_n=10):
-        """여러 컬럼에서 키워드 추출 (공통 함수)"""
-        extracted = []
+    def _extract_attribute_from_columns(self, columns, attr_type, top_n=10):
+        """
+        여러 컬럼에서 속성 키워드 추출 (공통 함수)
+        
+        텍스트마다 속성 목록 순서상 처음 포함된 키워드 하나를 집계합니다.
+        고유 텍스트당 한 번만 검사하고, 스냅샷의 컴파일된 정규식에 걸리지 않는 텍스트는
+        키워드 목록을 순회하지 않고 건너뜁니다.
+        """
+        snapshot = self.config.snapshot()
+        keywords = snapshot.get_product_attributes(attr_type)
+        regex = snapshot.get_attribute_regex(attr_type)
+        if regex is None:
+            return []
+        
+        extracted = Counter()
         for col in columns:
-            if col in self.df.columns:
-                for text in self.df[col].dropna().astype(str):
-                    for keyword in keywords:
-                        if keyword in text:
-                            extracted.append(keyword)
-                            break
-        return Counter(extracted).most_common(top_n)
+            if col not in self.df.columns:
+                continue
+            for text, count in self.df[col].dropna().astype(str).value_counts(sort=False).items():
+                if not regex.search(text):
+                    continue
+                for keyword in keywords:
+                    if keyword in text:
+                        extracted[keyword] += count
+                        break
+        return extracted.most_common(top_n)
     
     def extract_materials(self):
         """상품명과 상세설명에서 소재 추출"""
-        material_keywords = self.config.get_product_attributes('materials')
-        return self._extract_attribute_from_columns(['상품명', '상품상세설명'], material_keywords, top_n=10)
+        return self._extract_attribute_from_columns(['상품명', '상품상세설명'], 'materials', top_n=10)
     
     def extract_designs(self):
         """상품명과 상세설명에서 디자인 요소 추출"""
-        design_keywords = self.config.get_product_attributes('designs')
-        return self._extract_attribute_from_columns(['상품명', '상품상세설명'], design_keywords, top_n=10)
+        return self._extract_attribute_from_columns(['상품명', '상품상세설명'], 'designs', top_n=10)
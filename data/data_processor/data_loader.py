@@ -1,35 +1,63 @@
 # data/data_processor/data_loader.py
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from config import Config
+from data.data_processor.option_parser import OptionParser
+from data.data_processor.order_filter import ds
 
 class DataLoader:
     """데이터 로딩 및 기본 전처리를 담당하는 클래스"""
     
-    def __init__(self, config=None):
+    # 결측이면 제거하는 필수 컬럼과 중복 판정 키 컬럼
+    ESSENTIAL_COLUMNS = ('결제일', '상품명')
+    DUPLICATE_KEYS = ('주문번호', '상품번호')
+    
+    # CSV를 청크로 읽을 때 한 번에 읽는 행 수
+    CSV_CHUNK_ROWS = 100000
+    CSV_ENCODINGS = ('utf-8-sig', 'cp949')
+    
+    def __init__(self, config=None, filter_categories=False, order_filter=None):
         """
         Parameters:
         - config: 설정 객체
+        - filter_categories: True이면 전처리 단계에서 허용 카테고리 행만 남김 (같은 take에서 함께 선택)
+        - order_filter: 파일을 읽을 때 적용할 OrderFilter (기간/채널/카테고리, None이면 전체)
         """
         self.config = config if config is not None else Config()
+        self.filter_categories = filter_categories
+        self.order_filter = order_filter if order_filter is not None and order_filter.active else None
         self.df = None
         self.start_date = None
         self.end_date = None
+        
+        # 단계별 행 수 (source: 파일 전체, read: 범위 필터 후, loaded: 결측/중복 제거 후,
+        # filtered: 허용 카테고리 선택 후)
+        self.row_counts = {}
+        
+        # 청크 단위로 읽은 입력(CSV) 여부 (프로파일을 청크 누적 HyperLogLog로 집계)
+        self.streamed = False
     
     def load_data(self, file_path):
         """
         데이터 로드 및 기본 전처리
         
         Parameters:
-        - file_path: 엑셀 파일 경로
+        - file_path: 주문 데이터 파일 경로 (엑셀, .csv, .parquet 또는 Parquet 데이터셋 폴더)
         
         Returns:
         - 전처리된 데이터프레임
         """
         print("데이터 로드 및 전처리 중...")
+        if self.order_filter is not None:
+            print(f"분석 범위: {self.order_filter}")
         
         try:
-            # 단일 파일 로드
-            self.df = pd.read_excel(file_path)
+            # 파일 형식별 로드 (범위 필터는 읽는 단계에서 적용)
+            self.df = self._read(Path(file_path))
+            if self.order_filter is not None:
+                print(f"범위 필터 적용: 전체 {self.row_counts['source']}개 중 {self.row_counts['read']}개 주문")
             
             # 기본 전처리 수행
             self._preprocess_data()
@@ -44,9 +72,98 @@ class DataLoader:
             traceback.print_exc()
             return pd.DataFrame()  # 빈 데이터프레임 반환
     
+    def _read(self, path):
+        """
+        파일 형식에 맞게 읽고 범위 필터 적용
+        
+        Parameters:
+        - path: 파일 경로 (Path)
+        
+        Returns:
+        - 범위 안의 행만 담은 원본 데이터프레임
+        """
+        suffix = path.suffix.lower()
+        if path.is_dir() or suffix == '.parquet':
+            df = self._read_parquet(path)
+        elif suffix == '.csv':
+            df = self._read_csv(path)
+        else:
+            df = pd.read_excel(path)
+            self.row_counts['source'] = len(df)
+            if self.order_filter is not None:
+                df = self.order_filter.apply(df)
+        self.row_counts['read'] = len(df)
+        return df
+    
+    def _read_csv(self, path):
+        """
+        CSV를 청크 단위로 읽기
+        
+        범위 필터가 있으면 청크마다 걸러 범위 밖 행을 쌓지 않습니다.
+        """
+        for encoding in self.CSV_ENCODINGS:
+            try:
+                chunks = []
+                source_rows = 0
+                for chunk in pd.read_csv(path, encoding=encoding, chunksize=self.CSV_CHUNK_ROWS):
+                    source_rows += len(chunk)
+                    if self.order_filter is not None:
+                        chunk = self.order_filter.apply(chunk)
+                    chunks.append(chunk)
+                self.row_counts['source'] = source_rows
+                self.streamed = True
+                return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+            except UnicodeDecodeError:
+                if encoding == self.CSV_ENCODINGS[-1]:
+                    raise
+    
+    def _read_parquet(self, path):
+        """
+        Parquet 파일 또는 month=YYYY-MM 분할 데이터셋 폴더 읽기
+        
+        범위 필터 조건을 데이터셋 조건식으로 넘겨 범위 밖 분할 폴더와 행 그룹(최솟값/최댓값 통계 기준)은
+        읽지 않고, 조건식으로 넘기지 못한 조건은 읽은 뒤 마스크로 적용합니다.
+        """
+        if ds is None:
+            raise ImportError("pyarrow가 설치되지 않아 Parquet 파일을 읽을 수 없습니다. (pip install pyarrow)")
+        
+        dataset = ds.dataset(path, format='parquet', partitioning='hive' if path.is_dir() else None)
+        # 분할 폴더 이름에서 만든 컬럼(month 등)은 원본 주문 데이터에 없으므로 읽은 뒤 제거
+        partitioning = getattr(dataset, 'partitioning', None) if path.is_dir() else None
+        partition_columns = list(partitioning.schema.names) if partitioning is not None else []
+        self.row_counts['source'] = dataset.count_rows()
+        
+        expression = self.order_filter.dataset_expression(dataset.schema) if self.order_filter is not None else None
+        if expression is not None:
+            total_groups = sum(fragment.num_row_groups for fragment in dataset.get_fragments())
+            scanned_groups = 0
+            # 분할 폴더로 걸러진 파일마다 파일 안의 컬럼 조건으로 행 그룹 통계 확인
+            for fragment in dataset.get_fragments(filter=expression):
+                file_expression = self.order_filter.dataset_expression(fragment.physical_schema)
+                if file_expression is None:
+                    scanned_groups += fragment.num_row_groups
+                else:
+                    scanned_groups += len(fragment.split_by_row_group(file_expression))
+            print(f"Parquet 행 그룹 {total_groups}개 중 {scanned_groups}개만 읽음 (범위 밖 {total_groups - scanned_groups}개 건너뜀)")
+        
+        df = dataset.to_table(filter=expression).to_pandas()
+        df = df.drop(columns=partition_columns)
+        if self.order_filter is not None:
+            df = self.order_filter.apply(df)
+        return df
+    
     def _preprocess_data(self):
-        """기본 데이터 전처리 수행"""
-        # 날짜 형식 변환
+        """
+        기본 데이터 전처리 수행 (행 선택은 한 번의 take로)
+        
+        필수 컬럼 결측, 주문번호/상품번호 중복, (filter_categories이면) 허용 카테고리 조건을
+        하나의 유지 마스크로 합친 뒤 한 번만 행을 선택하므로, 단계마다 전체 데이터프레임을
+        복사하지 않습니다. 숫자 변환/결측 대체와 옵션 파싱은 선택된 행의 컬럼에만 수행합니다.
+        """
+        rows = len(self.df)
+        print(f"[DEBUG] 전처리 전 데이터 수: {rows}")
+        
+        # 날짜 형식 변환 (결측 판정에 필요하므로 선택 전에 컬럼 단위로 변환)
         if '결제일' in self.df.columns:
             self.df['결제일'] = pd.to_datetime(self.df['결제일'], errors='coerce')
             
@@ -58,39 +175,75 @@ class DataLoader:
                 self.start_date = "알 수 없음"
                 self.end_date = "알 수 없음"
         
-        # 상품가격을 숫자로 변환
-        if '상품가격' in self.df.columns:
-            self.df['상품가격'] = pd.to_numeric(self.df['상품가격'], errors='coerce')
+        # 유지 마스크: 필수 컬럼 결측 제거 -> 남은 행에서 중복 제거 -> 허용 카테고리
+        keep = self._missing_mask()
+        print(f"[DEBUG] 결제일/상품명 누락 제거 후: {int(keep.sum())}")
+        keep &= ~self._duplicate_mask(keep)
+        self.row_counts['loaded'] = int(keep.sum())
+        if self.filter_categories:
+            keep &= self._category_mask()
+            print(f"전체 {self.row_counts['loaded']}개 상품 중 {int(keep.sum())}개의 허용된 카테고리 상품 발견")
+            if self.row_counts['loaded'] and not keep.any() and '상품 카테고리' in self.df.columns:
+                # 디버깅: 카테고리 샘플과 허용된 카테고리 목록 출력
+                print(f"필터링 전 카테고리 샘플: {self.df['상품 카테고리'].head(10).tolist()}")
+                print(f"허용된 카테고리 목록: {sorted(self.config.snapshot().allowed_categories)[:10]}...")
+        
+        # 한 번의 take로 행 선택 (모두 유지하면 복사하지 않음)
+        if not keep.all():
+            self.df = self.df.take(np.flatnonzero(keep))
+        self.row_counts['filtered'] = len(self.df)
         
-        # 상품별 총 주문금액을 숫자로 변환
+        # 선택된 행의 컬럼만 숫자로 변환 (상품가격 결측치는 0으로 대체)
+        if '상품가격' in self.df.columns:
+            self.df['상품가격'] = pd.to_numeric(self.df['상품가격'], errors='coerce').fillna(0)
         if '상품별 총 주문금액' in self.df.columns:
             self.df['상품별 총 주문금액'] = pd.to_numeric(self.df['상품별 총 주문금액'], errors='coerce')
         
-        # 결측치 처리
-        self._handle_missing_data()
+        # 옵션정보를 색상/사이즈/기타 범주형 컬럼으로 구조화
+        self._parse_options()
+    
+    def _missing_mask(self):
+        """필수 컬럼(결제일, 상품명)에 결측이 없는 행 마스크"""
+        keep = np.ones(len(self.df), dtype=bool)
+        for column in self.ESSENTIAL_COLUMNS:
+            if column in self.df.columns:
+                keep &= self.df[column].notna().to_numpy()
+        return keep
+    
+    def _duplicate_mask(self, keep):
+        """
+        유지 대상 행 중 주문번호(+상품번호)가 앞 행과 같은 중복 행 마스크
+        
+        컬럼별 해시 테이블 인코딩(factorize) 코드를 하나의 정수 키로 합쳐 비교하므로
+        문자열 행을 묶어 비교하지 않고, 처음 나온 행을 남기는 drop_duplicates와 결과가 같습니다.
+        """
+        duplicated = np.zeros(len(self.df), dtype=bool)
+        key_columns = [column for column in self.DUPLICATE_KEYS if column in self.df.columns]
+        if '주문번호' not in key_columns:
+            return duplicated
         
-        # 중복 데이터 제거
-        self._remove_duplicates()
+        positions = np.flatnonzero(keep)
+        key = np.zeros(len(positions), dtype='int64')
+        for column in key_columns:
+            codes, uniques = pd.factorize(self.df[column].take(positions), use_na_sentinel=False)
+            # 다시 인코딩해 키 범위를 행 수 이하로 유지 (int64 넘침 방지)
+            key, _ = pd.factorize(key * len(uniques) + codes)
+        duplicated[positions] = pd.Series(key).duplicated().to_numpy()
+        return duplicated
     
-    def _handle_missing_data(self):
-        """결측치 처리"""
-        # 필수 컬럼에 결측치가 있는 행 제거
-        print(f"[DEBUG] 전처리 전 데이터 수: {len(self.df)}")
-        essential_columns = ['결제일', '상품명']
-        self.df = self.df.dropna(subset=essential_columns)
-        print(f"[DEBUG] 결제일/상품명 누락 제거 후: {len(self.df)}")
-        
-        # 상품가격 결측치는 0으로 대체
-        if '상품가격' in self.df.columns:
-            self.df['상품가격'] = self.df['상품가격'].fillna(0)
+    def _category_mask(self):
+        """CSV에 정의된 카테고리 행 마스크 (카테고리 컬럼이 없으면 모두 유지)"""
+        if '상품 카테고리' not in self.df.columns:
+            return np.ones(len(self.df), dtype=bool)
+        return self.config.snapshot().allowed_category_mask(self.df['상품 카테고리']).to_numpy()
     
-    def _remove_duplicates(self):
-        """중복 데이터 제거"""
-        # 주문 ID와 상품 ID 기준 중복 제거 (있는 경우)
-        if '주문번호' in self.df.columns and '상품번호' in self.df.columns:
-            self.df = self.df.drop_duplicates(subset=['주문번호', '상품번호'])
-        elif '주문번호' in self.df.columns:
-            self.df = self.df.drop_duplicates(subset=['주문번호'])
+    def _parse_options(self):
+        """옵션정보 파싱 (고유 옵션 문자열당 한 번, 결과는 범주형 컬럼)"""
+        if '옵션정보' not in self.df.columns:
+            return
+        parsed = OptionParser(self.config).parse(self.df['옵션정보'])
+        for name in parsed.columns:
+            self.df[name] = parsed[name]
     
     def get_analysis_period(self):
         """분석 기간 반환"""
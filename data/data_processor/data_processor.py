@@ -4,19 +4,22 @@ from config import Config
 from data.data_processor.data_loader import DataLoader
 from data.data_processor.attribute_extractor import AttributeExtractor
 from data.data_processor.sales_analyzer import SalesAnalyzer
+from data.data_processor.data_profiler import DataProfiler
 
 class DataProcessor:
     """데이터 로딩 및 전처리를 담당하는 클래스 - 통합 인터페이스 제공"""
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, order_filter=None):
         """
         Parameters:
         - config: 설정 객체
+        - order_filter: 파일을 읽을 때 적용할 OrderFilter (기간/채널/카테고리, None이면 전체)
         """
         self.config = config if config is not None else Config()
         
         # 하위 프로세서 생성
-        self.data_loader = DataLoader(self.config)
+        # 허용 카테고리 선택은 로드 단계의 유지 마스크에 포함 (별도 복사 없음)
+        self.data_loader = DataLoader(self.config, filter_categories=True, order_filter=order_filter)
         self.df = None
         self.start_date = None
         self.end_date = None
@@ -24,13 +27,16 @@ class DataProcessor:
         # AttributeExtractor와 SalesAnalyzer는 데이터가 로드된 후 초기화됨
         self.attribute_extractor = None
         self.sales_analyzer = None
+        
+        # 데이터 프로파일 (profile_data() 호출 후 설정됨)
+        self.profile = None
     
     def load_data(self, file_path):
         """
         데이터 로드 및 기본 전처리
         
         Parameters:
-        - file_path: 엑셀 파일 경로
+        - file_path: 주문 데이터 파일 경로 (엑셀, .csv, .parquet 또는 Parquet 데이터셋 폴더)
         
         Returns:
         - 전처리된 데이터프레임
@@ -54,31 +60,20 @@ class DataProcessor:
         if '상품 카테고리' not in self.df.columns:
             return self.df
         
-        # 디버깅을 위한 출력 추가
-        print(f"필터링 전 카테고리 샘플: {self.df['상품 카테고리'].head(10).tolist()}")
-        print(f"필터링 전 카테고리 타입: {self.df['상품 카테고리'].dtype}")
-        
-        # CSV에 정의된 카테고리에 속하는 상품만 필터링
-        def is_allowed(code):
-            if pd.isna(code):
-                return False
-            if isinstance(code, (int, float)):
-                code = str(int(code))
-            else:
-                code = str(code)
-            result = self.config.category_config.is_allowed_category(code)
-            # 디버깅을 위한 출력
-            if result:
-                print(f"허용된 카테고리: {code}")
-            return result
-        
-        filtered_df = self.df[self.df['상품 카테고리'].apply(is_allowed)]
+        # 로드 단계에서 이미 허용 카테고리 행만 선택됨
+        if self.data_loader.filter_categories:
+            return self.df
+        
+        # CSV에 정의된 카테고리에 속하는 상품만 필터링 (고유 코드당 한 번만 확인)
+        snapshot = self.config.snapshot()
+        filtered_df = self.df[snapshot.allowed_category_mask(self.df['상품 카테고리'])]
         
         print(f"전체 {len(self.df)}개 상품 중 {len(filtered_df)}개의 허용된 카테고리 상품 발견")
         
         if len(filtered_df) == 0:
-            # 디버깅: 허용된 카테고리 목록 출력
-            print(f"허용된 카테고리 목록: {list(self.config.category_config.allowed_categories)[:10]}...")
+            # 디버깅: 카테고리 샘플과 허용된 카테고리 목록 출력
+            print(f"필터링 전 카테고리 샘플: {self.df['상품 카테고리'].head(10).tolist()}")
+            print(f"허용된 카테고리 목록: {sorted(snapshot.allowed_categories)[:10]}...")
         
         self.df = filtered_df
         if self.df is not None and not self.df.empty:
@@ -87,6 +82,37 @@ class DataProcessor:
         
         return self.df    
     
+    def release_data(self):
+        """로드한 데이터프레임과 이를 참조하는 하위 프로세서 해제 (분석 기간/프로파일은 유지)"""
+        self.df = None
+        self.data_loader.df = None
+        self.attribute_extractor = None
+        self.sales_analyzer = None
+    
+    def profile_data(self):
+        """
+        분석 대상 컬럼의 고유값 수, 결측률, 상위값 쏠림 프로파일 생성
+        (하위 분석기가 집계 방식을 자동 선택할 수 있도록 결과를 전달)
+        
+        청크로 읽은 입력(CSV)은 전처리 후 남은 행을 같은 크기의 청크로 누적해(HyperLogLog) 집계하고,
+        그 외에는 정확히 집계합니다. 두 경우 모두 같은 행(결측/중복/카테고리 선택 후)이 기준입니다.
+        
+        Returns:
+        - 프로파일 결과 딕셔너리
+        """
+        profiler = DataProfiler(self.config)
+        if self.data_loader.streamed and self.df is not None and not self.df.empty:
+            self.profile = profiler.profile_chunks(self.df, self.data_loader.CSV_CHUNK_ROWS)
+        else:
+            self.profile = profiler.profile(self.df)
+        
+        if self.attribute_extractor is not None:
+            self.attribute_extractor.profile = self.profile
+        if self.sales_analyzer is not None:
+            self.sales_analyzer.profile = self.profile
+        
+        return self.profile
+    
     def get_analysis_period(self):
         """분석 기간 반환"""
         return self.start_date, self.end_date
@@ -126,29 +152,41 @@ class DataProcessor:
     def get_channel_data(self):
         """판매 채널 분석"""
         if self.sales_analyzer is None:
-            return pd.Series(), pd.Series(), 0, [], []
+            return pd.Series(dtype='int64'), 0, []
         return self.sales_analyzer.get_channel_data()
     
-    def analyze_price_ranges(self):
+    def analyze_price_distribution(self):
+        """가격대 분포 분석 (전체/채널별/카테고리별)"""
+        if self.sales_analyzer is None:
+            return None
+        return self.sales_analyzer.analyze_price_distribution()
+    
+    def analyze_price_ranges(self, distribution=None):
         """가격대 분석"""
         if self.sales_analyzer is None:
-            return pd.Series(), pd.Series(), []
-        return self.sales_analyzer.analyze_price_ranges()
+            return pd.Series(dtype='int64')
+        return self.sales_analyzer.analyze_price_ranges(distribution)
     
     def analyze_bestsellers(self):
         """베스트셀러 상품 분석"""
         if self.sales_analyzer is None:
-            return pd.Series(), []
+            return pd.Series(dtype='int64')
         return self.sales_analyzer.analyze_bestsellers()
     
-    def analyze_channel_prices(self):
+    def analyze_price_statistics(self):
+        """채널별/카테고리별 가격 통계 분석"""
+        if self.sales_analyzer is None:
+            return {}
+        return self.sales_analyzer.analyze_price_statistics()
+    
+    def analyze_channel_prices(self, statistics=None):
         """채널별 평균 가격 분석"""
         if self.sales_analyzer is None:
             return {}
-        return self.sales_analyzer.analyze_channel_prices()
+        return self.sales_analyzer.analyze_channel_prices(statistics)
     
     def analyze_categories(self):
         """카테고리 분석"""
         if self.sales_analyzer is None:
-            return pd.Series(), pd.Series(), []
+            return pd.Series(dtype='int64')
         return self.sales_analyzer.analyze_categories()
\ No newline at end of file
@@ -0,0 +1,162 @@
+# data/data_processor/data_profiler.py
+from config import Config
+from data.sketches import HyperLogLog, SpaceSavingCounter
+
+class DataProfiler:
+    """분석 대상 컬럼의 고유값 수, 결측률, 상위값 쏠림을 집계하는 프로파일러"""
+
+    # 분석기들이 사용하는 컬럼 목록
+    PROFILE_COLUMNS = [
+        '주문번호', '상품번호', '결제일', '상품명', '옵션정보', '상품가격',
+        '상품별 총 주문금액', '판매채널', '상품 카테고리', '상품상세설명'
+    ]
+
+    # 스트리밍 모드에서 상위값 추정에 사용할 후보 수
+    TOP_VALUE_CAPACITY = 64
+
+    def __init__(self, config=None):
+        """
+        메모리에 올라온 데이터프레임은 profile()로 정확히 집계하고,
+        청크로 읽는 입력(CSV)은 profile_chunks()로 청크마다 update()한 뒤 result()로 근사 집계(HyperLogLog)를 얻습니다.
+        
+        Parameters:
+        - config: 설정 객체
+        """
+        self.config = config if config is not None else Config()
+        self._rows = 0
+        self._accumulators = {}
+
+    def profile(self, df):
+        """
+        데이터프레임 전체 프로파일 (정확 집계)
+
+        Parameters:
+        - df: 분석할 데이터프레임
+
+        Returns:
+        - 프로파일 결과 딕셔너리 {'row_count': int, 'columns': [컬럼별 정보, ...]}
+        """
+        if df is None or df.empty:
+            return {'row_count': 0, 'columns': []}
+
+        rows = len(df)
+        columns = []
+        for col in self.PROFILE_COLUMNS:
+            if col not in df.columns:
+                continue
+            counts = df[col].value_counts(dropna=True)
+            non_null = int(counts.sum())
+            top_value = counts.index[0] if not counts.empty else None
+            top_count = int(counts.iloc[0]) if not counts.empty else 0
+            columns.append(self._column_entry(col, rows, non_null, len(counts), 'exact', top_value, top_count))
+
+        return {'row_count': rows, 'columns': columns}
+
+    def profile_chunks(self, df, chunk_rows):
+        """
+        데이터프레임을 청크로 나눠 update()로 누적한 스트리밍 프로파일
+
+        Parameters:
+        - df: 분석할 데이터프레임
+        - chunk_rows: 청크 행 수
+
+        Returns:
+        - result()의 반환값
+        """
+        for start in range(0, len(df), max(chunk_rows, 1)):
+            self.update(df.iloc[start:start + chunk_rows])
+        return self.result()
+
+    def update(self, chunk):
+        """
+        스트리밍 입력의 청크 누적 (HyperLogLog + Space-Saving)
+
+        Parameters:
+        - chunk: 데이터프레임 청크
+        """
+        precision = self.config.analysis_config.hll_precision
+        self._rows += len(chunk)
+        for col in self.PROFILE_COLUMNS:
+            if col not in chunk.columns:
+                continue
+            if col not in self._accumulators:
+                self._accumulators[col] = {
+                    'non_null': 0,
+                    'distinct': HyperLogLog(precision),
+                    'top': SpaceSavingCounter(self.TOP_VALUE_CAPACITY)
+                }
+            values = chunk[col].dropna()
+            acc = self._accumulators[col]
+            acc['non_null'] += len(values)
+            acc['distinct'].update(values)
+            acc['top'].update(values)
+        return self
+
+    def result(self):
+        """
+        스트리밍 누적 결과 반환
+
+        Returns:
+        - profile()과 같은 형식의 프로파일 결과 딕셔너리
+        """
+        columns = []
+        for col in self.PROFILE_COLUMNS:
+            acc = self._accumulators.get(col)
+            if acc is None:
+                continue
+            top = acc['top'].most_common(1)
+            top_value, top_count = top[0] if top else (None, 0)
+            distinct = min(acc['distinct'].count(), acc['non_null'])
+            columns.append(self._column_entry(col, self._rows, acc['non_null'], distinct, 'hll', top_value, top_count))
+
+        return {'row_count': self._rows, 'columns': columns}
+
+    def _column_entry(self, column, rows, non_null, distinct, method, top_value, top_count):
+        """컬럼별 프로파일 항목 구성"""
+        null_rate = ((rows - non_null) / rows * 100) if rows else 0
+        top_share = (top_count / non_null * 100) if non_null else 0
+        return {
+            'column': column,
+            'non_null': non_null,
+            'null_rate': round(null_rate, 1),
+            'distinct': int(distinct),
+            'distinct_method': method,
+            'top_value': None if top_value is None else str(top_value),
+            'top_share': round(top_share, 1),
+            'strategy': self._recommend_strategy(non_null, distinct)
+        }
+
+    def _recommend_strategy(self, non_null, distinct):
+        """
+        고유값 수에 따른 집계 방식 권장
+        - sketch: 고유값이 많아 스케치 집계가 유리
+        - categorical: 고유값 비율이 낮아 범주형 인코딩이 유리
+        - exact: 정확 해시 집계
+        """
+        analysis_config = self.config.analysis_config
+        if non_null == 0:
+            return 'empty'
+        if distinct > analysis_config.sketch_threshold:
+            return 'sketch'
+        if distinct / non_null * 100 <= analysis_config.categorical_ratio:
+            return 'categorical'
+        return 'exact'
+
+    @staticmethod
+    def distinct_count(profile, column):
+        """
+        프로파일 결과에서 컬럼의 고유값 수 조회
+
+        Parameters:
+        - profile: profile() 또는 result()의 반환값 (None 허용)
+        - column: 컬럼명
+
+        Returns:
+        - 고유값 수 (정보가 없으면 None)
+        """
+        if not profile:
+            return None
+        for entry in profile.get('columns', []):
+            if entry['column'] == column:
+                return entry['distinct']
+        return None
@@ -0,0 +1,149 @@
+# data/data_processor/option_parser.py
+import re
+import numpy as np
+import pandas as pd
+from config import Config
+
+class OptionParser:
+    """
+    옵션정보 문자열을 색상/사이즈/기타 컬럼으로 구조화하는 파서
+
+    '색상:블랙 / 사이즈:FREE', '블랙,M', '컬러=아이보리 | size: xl' 같은 옵션 문자열을
+    구분자(/ , | ; 줄바꿈, '[키]' 앞의 공백)로 나누고 색상/사이즈 키이면 키로, 아니면
+    ('옵션1:블랙'처럼 다른 키이거나 키가 없으면) 값 자체를 사전과 비교해 색상/사이즈를 판별합니다.
+    사이즈는 값 전체 또는 공백/괄호로 나눈 조각('아이보리 M', '화이트 (FREE)')이 사전과 일치하면,
+    색상은 제품 속성 사전에서 값에 포함된 최장 일치 값으로 정규화합니다.
+    파싱은 고유 옵션 문자열당 한 번만 수행하고 결과는 범주형(category) 컬럼으로 저장합니다.
+    """
+
+    # 결과 컬럼명
+    COLOR_COLUMN = '옵션_색상'
+    SIZE_COLUMN = '옵션_사이즈'
+    OTHER_COLUMN = '옵션_기타'
+
+    # 옵션 키 이름 (소문자 비교)
+    COLOR_KEYS = ('색상', '컬러', '칼라', 'color', 'colour')
+    SIZE_KEYS = ('사이즈', '치수', 'size')
+
+    # 사이즈 별칭 (대문자, 공백 제거 후 비교)
+    SIZE_ALIASES = {'F': 'FREE', '프리': 'FREE', 'FREESIZE': 'FREE', 'ONESIZE': 'FREE', '프리사이즈': 'FREE'}
+
+    # 옵션 구분자와 키/값 구분자
+    PART_DELIMITERS = re.compile(r'\s*[/,|;\n]\s*|\s+(?=\[)')
+    KEY_VALUE = re.compile(r'^\s*\[?([^:=\]]+?)\]?\s*[:=\]]\s*(.+?)\s*$')
+
+    # 사이즈 조각 구분자 (공백, 대괄호, 괄호)
+    SIZE_TOKEN_DELIMITERS = re.compile(r'[\s\[\]()]+')
+
+    def __init__(self, config=None):
+        """
+        Parameters:
+        - config: 설정 객체
+        """
+        self.config = config if config is not None else Config()
+        snapshot = self.config.snapshot()
+
+        # 색상: 소문자 -> 사전 표기, 긴 이름부터 찾는 정규식 (라이트블루 > 블루, 스냅샷에서 컴파일됨)
+        self._colors = {}
+        for color in snapshot.get_product_attributes('colors'):
+            self._colors.setdefault(color.lower(), color)
+        self._color_regex = snapshot.get_attribute_regex('colors')
+
+        # 사이즈: 대문자/공백 제거 -> 사전 표기
+        self._sizes = {}
+        for size in snapshot.get_product_attributes('sizes'):
+            self._sizes.setdefault(self._size_key(size), size)
+        for alias, size in self.SIZE_ALIASES.items():
+            self._sizes.setdefault(alias, size)
+
+    @staticmethod
+    def _size_key(value):
+        return re.sub(r'\s+', '', str(value)).upper()
+
+    def match_color(self, value):
+        """
+        값에서 사전 색상 찾기 (값 전체 일치 우선, 없으면 값에 포함된 가장 긴 색상명)
+
+        Returns:
+        - 사전 표기 색상명 (없으면 None)
+        """
+        color = self._colors.get(value.strip().lower())
+        if color is not None:
+            return color
+        match = self._color_regex.search(value) if self._color_regex is not None else None
+        return self._colors[match.group(0).lower()] if match else None
+
+    def match_size(self, value):
+        """
+        값에서 사전 사이즈 찾기 (값 전체 일치 우선, 없으면 공백/괄호로 나눈 조각 중 첫 일치)
+
+        Returns:
+        - 사전 표기 사이즈 (없으면 None)
+        """
+        size = self._sizes.get(self._size_key(value))
+        if size is not None:
+            return size
+        for token in self.SIZE_TOKEN_DELIMITERS.split(value):
+            size = self._sizes.get(self._size_key(token)) if token else None
+            if size is not None:
+                return size
+        return None
+
+    def parse_option(self, text):
+        """
+        옵션 문자열 하나를 파싱
+
+        Returns:
+        - (색상, 사이즈, 기타) 튜플 (없는 항목은 None)
+        """
+        color = size = None
+        others = []
+        for part in self.PART_DELIMITERS.split(str(text).strip()):
+            if not part:
+                continue
+            key_value = self.KEY_VALUE.match(part)
+            if key_value:
+                key, value = key_value.group(1).strip().lower(), key_value.group(2)
+                if color is None and key in self.COLOR_KEYS:
+                    color = self.match_color(value) or value.strip()
+                    continue
+                if size is None and key in self.SIZE_KEYS:
+                    size = self.match_size(value) or self._size_key(value)
+                    continue
+                if key in self.COLOR_KEYS or key in self.SIZE_KEYS:
+                    others.append(part)
+                    continue
+            else:
+                value = part
+
+            # 다른 키의 값이나 키 없는 값: 사이즈와 색상을 모두 사전과 비교
+            matched_size = self.match_size(value) if size is None else None
+            matched_color = self.match_color(value) if color is None else None
+            if matched_size is None and matched_color is None:
+                others.append(part)
+                continue
+            size = matched_size or size
+            color = matched_color or color
+
+        return color, size, (' / '.join(others) if others else None)
+
+    def parse(self, options):
+        """
+        옵션정보 컬럼 전체 파싱 (고유 옵션 문자열당 한 번)
+
+        Parameters:
+        - options: 옵션정보 시리즈
+
+        Returns:
+        - COLOR_COLUMN, SIZE_COLUMN, OTHER_COLUMN 범주형 컬럼을 가진 데이터프레임 (options와 같은 인덱스)
+        """
+        codes, uniques = pd.factorize(options, use_na_sentinel=True)
+        parsed = [self.parse_option(text) for text in uniques]
+
+        # 결측 옵션(-1)은 마지막(None) 항목을 가리키도록 변환
+        rows = np.where(codes < 0, len(uniques), codes)
+        columns = {}
+        for position, name in enumerate((self.COLOR_COLUMN, self.SIZE_COLUMN, self.OTHER_COLUMN)):
+            unique_values = pd.Categorical([item[position] for item in parsed] + [None])
+            columns[name] = pd.Categorical.from_codes(unique_values.codes[rows], unique_values.categories)
+        return pd.DataFrame(columns, index=options.index)
@@ -0,0 +1,285 @@
+# data/data_processor/order_filter.py
+"""
+주문 데이터 범위 필터 (결제일 기간, 판매채널, 카테고리)
+
+파일을 읽는 단계에서 적용해 범위 밖의 주문이 전처리/분석/인사이트에 들어가지 않게 합니다.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+
+def normalize_category_code(category_code):
+    """
+    카테고리 코드를 category.csv 형식(4자리 단위, 앞자리 0 포함)의 문자열로 정규화
+
+    엑셀에서 숫자로 읽혀 앞의 0이 사라진 코드(예: 1000500040003)를 '0001000500040003'으로 복원합니다.
+
+    Parameters:
+    - category_code: 카테고리 코드 (숫자 또는 문자열)
+
+    Returns:
+    - 정규화된 코드 문자열 (결측이면 None)
+    """
+    if pd.isna(category_code):
+        return None
+    if isinstance(category_code, (int, float, np.integer, np.floating)):
+        code = str(int(category_code))
+    else:
+        code = str(category_code).strip()
+    if not code.isdigit():
+        return code
+    return code.zfill(-(-len(code) // 4) * 4)
+
+
+def parse_date_bound(value, today=None):
+    """
+    --from/--to 값을 날짜로 변환
+
+    Parameters:
+    - value: 'YYYY-MM-DD' 형식 날짜 또는 '30d'(오늘로부터 30일 전)
+    - today: 상대 기간의 기준일 (None이면 오늘)
+
+    Returns:
+    - 자정 기준 pd.Timestamp (값이 없으면 None)
+    """
+    if value is None or str(value).strip() == '':
+        return None
+    value = str(value).strip()
+    relative = re.fullmatch(r'(\d+)d', value, re.IGNORECASE)
+    if relative:
+        today = pd.Timestamp(today) if today is not None else pd.Timestamp.now()
+        return today.normalize() - pd.Timedelta(days=int(relative.group(1)))
+    try:
+        return pd.Timestamp(value).normalize()
+    except ValueError:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value} (YYYY-MM-DD 또는 30d)") from None
+
+
+def _split_values(value):
+    """쉼표로 구분된 값(또는 값 목록)을 중복 없는 튜플로 변환"""
+    if value is None:
+        return ()
+    values = value.split(',') if isinstance(value, str) else value
+    return tuple(dict.fromkeys(str(item).strip() for item in values if str(item).strip()))
+
+
+class OrderFilter:
+    """
+    결제일 기간/판매채널/카테고리로 분석 대상 주문을 제한하는 필터
+
+    - Parquet: pyarrow 데이터셋 조건으로 넘겨 행 그룹 통계(최솟값/최댓값)와
+      month=YYYY-MM 분할 폴더로 범위 밖 행 그룹을 읽지 않고 건너뜀
+    - Excel/CSV: 읽은 직후(CSV는 청크마다) mask()로 걸러 전처리에는 범위 안의 행만 전달
+
+    조건끼리는 AND, 한 조건 안의 여러 값(채널, 카테고리)은 OR로 적용합니다.
+    카테고리는 코드(앞부분 일치, 예: 0001 = 여성 전체) 또는 category.csv의 이름으로 지정합니다.
+    """
+
+    DATE_COLUMN = '결제일'
+    CHANNEL_COLUMN = '판매채널'
+    CATEGORY_COLUMN = '상품 카테고리'
+    PARTITION_COLUMN = 'month'
+
+    def __init__(self, start=None, end=None, channels=None, category_prefixes=None, categories=None):
+        """
+        Parameters:
+        - start: 시작일 (포함, pd.Timestamp)
+        - end: 종료일 (포함, 날짜 단위 - 해당 날짜의 주문까지 포함)
+        - channels: 판매채널 이름 목록
+        - category_prefixes: 정규화된 카테고리 코드 앞부분 목록
+        - categories: 사용자가 지정한 카테고리 값 (기록/표시용, None이면 category_prefixes)
+        """
+        if start is not None and end is not None and start > end:
+            raise ValueError(f"시작일({start:%Y-%m-%d})이 종료일({end:%Y-%m-%d})보다 늦습니다.")
+        self.start = start
+        self.end = end
+        self.channels = _split_values(channels)
+        self.category_prefixes = _split_values(category_prefixes)
+        self.categories = _split_values(categories) if categories is not None else self.category_prefixes
+
+    @classmethod
+    def from_args(cls, date_from=None, date_to=None, channel=None, category=None, config=None, today=None):
+        """
+        명령줄 값으로 생성
+
+        Parameters:
+        - date_from, date_to: 'YYYY-MM-DD' 또는 '30d'
+        - channel: 쉼표로 구분된 판매채널 이름
+        - category: 쉼표로 구분된 카테고리 코드 또는 이름
+        - config: 카테고리 이름 조회에 사용할 설정 객체
+        - today: 상대 기간의 기준일 (None이면 오늘)
+
+        Returns:
+        - OrderFilter (잘못된 값이면 ValueError)
+        """
+        categories = _split_values(category)
+        prefixes = cls.resolve_categories(categories, config) if categories else ()
+        return cls(
+            start=parse_date_bound(date_from, today),
+            end=parse_date_bound(date_to, today),
+            channels=channel,
+            category_prefixes=prefixes,
+            categories=categories
+        )
+
+    @staticmethod
+    def resolve_categories(values, config=None):
+        """
+        카테고리 코드/이름을 정규화된 코드 앞부분 목록으로 변환
+
+        숫자는 코드로, 그 외에는 category.csv의 전체 이름('여성 > 의류') 또는
+        마지막 단계 이름('원피스')과 같은 카테고리의 코드로 변환합니다.
+
+        Parameters:
+        - values: 카테고리 코드 또는 이름 목록
+        - config: 설정 객체 (이름으로 지정한 경우 필요)
+
+        Returns:
+        - 코드 앞부분 튜플 (찾을 수 없는 이름이 있으면 ValueError)
+        """
+        mapping = config.snapshot().category_mapping if config is not None else {}
+        prefixes = []
+        for value in values:
+            if value.isdigit():
+                prefixes.append(normalize_category_code(value))
+                continue
+            codes = [
+                normalize_category_code(code) for code, name in mapping.items()
+                if name == value or str(name).split('>')[-1].strip() == value
+            ]
+            if not codes:
+                raise ValueError(f"카테고리를 찾을 수 없습니다: {value} (코드 또는 category.csv의 이름)")
+            prefixes.extend(codes)
+        return tuple(dict.fromkeys(prefixes))
+
+    @property
+    def active(self):
+        """적용할 조건이 하나라도 있는지 여부"""
+        return bool(self.start is not None or self.end is not None or self.channels or self.category_prefixes)
+
+    @property
+    def end_exclusive(self):
+        """종료일 다음 날 자정 (결제일 < end_exclusive 비교용)"""
+        return self.end + pd.Timedelta(days=1) if self.end is not None else None
+
+    def describe(self):
+        """
+        실행 기록용 조건 요약
+
+        Returns:
+        - 지정된 조건만 담은 딕셔너리 {'from': 'YYYY-MM-DD', 'to': ..., 'channels': [...], 'categories': [...]}
+        """
+        summary = {}
+        if self.start is not None:
+            summary['from'] = self.start.strftime('%Y-%m-%d')
+        if self.end is not None:
+            summary['to'] = self.end.strftime('%Y-%m-%d')
+        if self.channels:
+            summary['channels'] = list(self.channels)
+        if self.categories:
+            summary['categories'] = list(self.categories)
+        return summary
+
+    def __str__(self):
+        summary = self.describe()
+        parts = []
+        if 'from' in summary or 'to' in summary:
+            parts.append(f"기간 {summary.get('from', '처음')} ~ {summary.get('to', '끝')}")
+        if 'channels' in summary:
+            parts.append(f"채널 {', '.join(summary['channels'])}")
+        if 'categories' in summary:
+            parts.append(f"카테고리 {', '.join(summary['categories'])}")
+        return ' / '.join(parts) or '전체'
+
+    def mask(self, df):
+        """
+        조건을 만족하는 행 마스크
+
+        결제일이 날짜 형식이 아니면 변환한 컬럼을 df에 다시 넣으므로(이후 전처리에서 재변환 없음),
+        읽기 직후의 데이터프레임에만 사용합니다. 조건 컬럼이 없으면 그 조건은 적용하지 않습니다.
+
+        Parameters:
+        - df: 주문 데이터프레임
+
+        Returns:
+        - 불리언 numpy 배열
+        """
+        keep = np.ones(len(df), dtype=bool)
+
+        if (self.start is not None or self.end is not None) and self.DATE_COLUMN in df.columns:
+            if not pd.api.types.is_datetime64_any_dtype(df[self.DATE_COLUMN]):
+                df[self.DATE_COLUMN] = pd.to_datetime(df[self.DATE_COLUMN], errors='coerce')
+            dates = df[self.DATE_COLUMN]
+            if self.start is not None:
+                keep &= (dates >= self.start).to_numpy(dtype=bool, na_value=False)
+            if self.end is not None:
+                keep &= (dates < self.end_exclusive).to_numpy(dtype=bool, na_value=False)
+
+        if self.channels and self.CHANNEL_COLUMN in df.columns:
+            keep &= df[self.CHANNEL_COLUMN].isin(self.channels).to_numpy(dtype=bool)
+
+        if self.category_prefixes and self.CATEGORY_COLUMN in df.columns:
+            # 고유 코드당 한 번만 앞부분 비교 (결측(-1)은 마지막(False) 항목)
+            positions, uniques = pd.factorize(df[self.CATEGORY_COLUMN], use_na_sentinel=True)
+            matched = [
+                (normalize_category_code(code) or '').startswith(self.category_prefixes) for code in uniques
+            ]
+            keep &= np.array(matched + [False], dtype=bool)[positions]
+
+        return keep
+
+    def apply(self, df):
+        """조건에 맞는 행만 남긴 데이터프레임 (모두 맞으면 그대로 반환)"""
+        keep = self.mask(df)
+        return df if keep.all() else df.take(np.flatnonzero(keep))
+
+    def dataset_expression(self, schema):
+        """
+        pyarrow 데이터셋 조건식 (행 그룹 통계/분할 폴더로 건너뛸 수 있는 조건만)
+
+        결제일은 timestamp/date 형식일 때만, 판매채널은 문자열 형식일 때만 넘기며,
+        month 분할 컬럼이 있으면 기간을 월 단위로도 넘겨 범위 밖 폴더를 열지 않습니다.
+        넘기지 못한 조건(카테고리 앞부분 등)은 읽은 뒤 mask()로 적용합니다.
+
+        Parameters:
+        - schema: 데이터셋 스키마 (분할 컬럼 포함)
+
+        Returns:
+        - pyarrow.dataset 조건식 (넘길 조건이 없으면 None)
+        """
+        conditions = []
+        names = set(schema.names)
+
+        if self.DATE_COLUMN in names:
+            date_type = schema.field(self.DATE_COLUMN).type
+            if (pa.types.is_timestamp(date_type) and date_type.tz is None) or pa.types.is_date(date_type):
+                field = ds.field(self.DATE_COLUMN)
+                if self.start is not None:
+                    conditions.append(field >= pa.scalar(self.start.to_pydatetime()).cast(date_type))
+                if self.end is not None:
+                    conditions.append(field < pa.scalar(self.end_exclusive.to_pydatetime()).cast(date_type))
+
+        if self.PARTITION_COLUMN in names and pa.types.is_string(schema.field(self.PARTITION_COLUMN).type):
+            if self.start is not None:
+                conditions.append(ds.field(self.PARTITION_COLUMN) >= self.start.strftime('%Y-%m'))
+            if self.end is not None:
+                conditions.append(ds.field(self.PARTITION_COLUMN) <= self.end.strftime('%Y-%m'))
+
+        if self.channels and self.CHANNEL_COLUMN in names:
+            channel_type = schema.field(self.CHANNEL_COLUMN).type
+            if pa.types.is_string(channel_type) or pa.types.is_large_string(channel_type):
+                conditions.append(ds.field(self.CHANNEL_COLUMN).isin(list(self.channels)))
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
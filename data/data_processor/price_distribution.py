@@ -0,0 +1,176 @@
+# data/data_processor/price_distribution.py
+import numpy as np
+import pandas as pd
+
+class PriceDistribution:
+    """
+    가격대 분포(히스토그램) 집계 엔진
+
+    가격 배열을 np.searchsorted로 한 번에 구간화하고, 채널/카테고리 등 그룹별 분포는
+    (그룹 코드 x 구간 수 + 구간) 2차원 bincount로 같은 구간 결과를 재사용해 계산합니다.
+    구간 경계가 같은 엔진끼리는 merge로 청크별 결과를 합칠 수 있습니다.
+    """
+
+    def __init__(self, edges, labels=None):
+        """
+        Parameters:
+        - edges: 구간 하한 경계 목록 (오름차순, 마지막 구간은 상한 없음)
+        - labels: 구간 이름 목록 (None이면 경계에서 자동 생성)
+        """
+        edges = np.unique(np.asarray(edges, dtype='float64'))
+        if len(edges) == 0:
+            raise ValueError("가격대 구간 경계가 비어 있습니다.")
+        self.edges = edges
+        self.labels = list(labels) if labels is not None else self._make_labels(edges)
+        if len(self.labels) != len(self.edges):
+            raise ValueError("구간 이름 수와 구간 수가 다릅니다.")
+
+        self._counts = np.zeros(len(self.edges), dtype='int64')
+        self._group_counts = {}
+
+    @classmethod
+    def from_settings(cls, settings, prices=None):
+        """
+        설정에 따라 구간 경계 생성
+
+        Parameters:
+        - settings: Config.get_price_bin_settings()의 반환값
+        - prices: quantile / log 모드에서 경계 계산에 사용할 가격 배열
+
+        Returns:
+        - PriceDistribution 객체
+        """
+        mode = settings.get('mode', 'fixed')
+        if mode == 'fixed' or prices is None:
+            return cls(settings['edges'])
+
+        values = np.asarray(prices, dtype='float64')
+        values = values[np.isfinite(values) & (values >= 0)]
+        if values.size == 0:
+            return cls(settings['edges'])
+
+        count = max(int(settings.get('count', 9)), 1)
+        if mode == 'quantile':
+            edges = np.quantile(values, np.linspace(0, 1, count + 1)[:-1])
+        else:
+            positive = values[values > 0]
+            low = max(positive.min() if positive.size else 1000.0, 1000.0)
+            high = max(values.max(), low)
+            edges = np.geomspace(low, high, count)
+
+        # 읽기 쉬운 경계값으로 반올림 (유효숫자 2자리), 첫 구간은 0부터 시작
+        edges = np.array([cls._round_price(v) for v in edges])
+        edges[0] = 0
+        return cls(edges)
+
+    @staticmethod
+    def _round_price(value):
+        """가격을 유효숫자 2자리로 반올림"""
+        if value <= 0:
+            return 0.0
+        digits = int(np.floor(np.log10(value))) - 1
+        return float(round(value, -digits))
+
+    @staticmethod
+    def _format_price(value):
+        """가격을 만원/천원 단위 문자열로 변환"""
+        if value >= 10000:
+            return f"{value / 10000:g}만원"
+        if value >= 1000:
+            return f"{value / 1000:g}천원"
+        return f"{value:g}원"
+
+    @classmethod
+    def _make_labels(cls, edges):
+        """구간 경계에서 구간 이름 생성 (예: '1만원 미만', '1~2만원', '20만원 이상')"""
+        labels = []
+        last = len(edges) - 1
+        for i, low in enumerate(edges):
+            if i == last:
+                labels.append(f"{cls._format_price(low)} 이상")
+                continue
+            high = edges[i + 1]
+            if i == 0 and low == 0:
+                labels.append(f"{cls._format_price(high)} 미만")
+            elif low >= 10000:
+                labels.append(f"{low / 10000:g}~{high / 10000:g}만원")
+            else:
+                labels.append(f"{cls._format_price(low)}~{cls._format_price(high)}")
+        return labels
+
+    def bin_index(self, prices):
+        """
+        가격별 구간 인덱스 계산
+
+        Parameters:
+        - prices: 가격 배열
+
+        Returns:
+        - 구간 인덱스 배열 (결측치나 첫 경계 미만 가격은 -1)
+        """
+        values = np.asarray(prices, dtype='float64')
+        bins = np.searchsorted(self.edges, values, side='right') - 1
+        bins[~np.isfinite(values)] = -1
+        return bins
+
+    def update(self, prices, groups=None):
+        """
+        가격 분포 누적
+
+        Parameters:
+        - prices: 가격 배열
+        - groups: {차원 이름: 그룹 라벨 배열} (예: {'판매채널': 채널 시리즈})
+        """
+        n_bins = len(self.edges)
+        bins = self.bin_index(prices)
+        valid = bins >= 0
+        self._counts += np.bincount(bins[valid], minlength=n_bins)
+
+        for dimension, labels in (groups or {}).items():
+            codes, uniques = pd.factorize(np.asarray(labels, dtype=object), use_na_sentinel=True)
+            mask = valid & (codes >= 0)
+            flat = codes[mask] * n_bins + bins[mask]
+            grid = np.bincount(flat, minlength=len(uniques) * n_bins).reshape(len(uniques), n_bins)
+            frame = pd.DataFrame(grid, index=pd.Index(uniques, dtype=object), columns=self.labels)
+            if dimension in self._group_counts:
+                frame = self._group_counts[dimension].add(frame, fill_value=0).astype('int64')
+            self._group_counts[dimension] = frame
+        return self
+
+    def merge(self, other):
+        """같은 구간 경계를 가진 다른 PriceDistribution(청크 결과)과 합침"""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("구간 경계가 다른 가격 분포는 합칠 수 없습니다.")
+        self._counts += other._counts
+        for dimension, frame in other._group_counts.items():
+            if dimension in self._group_counts:
+                frame = self._group_counts[dimension].add(frame, fill_value=0).astype('int64')
+            self._group_counts[dimension] = frame
+        return self
+
+    def counts(self):
+        """구간별 상품 수 (구간 이름 인덱스 시리즈)"""
+        return pd.Series(self._counts.copy(), index=self.labels, dtype='int64')
+
+    def percent(self):
+        """구간별 비율 (%)"""
+        counts = self.counts()
+        total = counts.sum()
+        if total == 0:
+            return counts.astype('float64')
+        return (counts / total * 100).round(1)
+
+    def group_counts(self, dimension):
+        """
+        그룹별 구간 분포 반환
+
+        Parameters:
+        - dimension: update()에 전달한 차원 이름
+
+        Returns:
+        - 행: 그룹, 열: 구간 이름인 데이터프레임 (없으면 빈 데이터프레임)
+        """
+        frame = self._group_counts.get(dimension)
+        if frame is None:
+            return pd.DataFrame(columns=self.labels, dtype='int64')
+        return frame.copy()
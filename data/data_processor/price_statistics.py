@@ -0,0 +1,77 @@
+# data/data_processor/price_statistics.py
+import numpy as np
+import pandas as pd
+
+# 그룹별 통계 결과 컬럼
+STAT_COLUMNS = ['count', 'share', 'mean', 'median', 'p10', 'p90', 'std', 'min', 'max']
+
+
+class PriceStatistics:
+    """
+    그룹(채널/카테고리)별 가격 통계 엔진
+
+    그룹 코드와 가격을 한 번 정렬한 뒤 np.add.reduceat으로 건수/합계/편차제곱합을
+    구하고, 정렬된 구간에서 직접 분위수를 읽어 반복 groupby 없이 모든 통계를 계산합니다.
+    """
+
+    def __init__(self, quantiles=(0.1, 0.5, 0.9)):
+        """
+        Parameters:
+        - quantiles: 계산할 분위 (p10, median, p90)
+        """
+        self.quantiles = quantiles
+
+    def compute(self, prices, groups):
+        """
+        그룹별 가격 통계 계산
+
+        Parameters:
+        - prices: 가격 배열
+        - groups: 그룹 라벨 배열 (가격과 같은 길이)
+
+        Returns:
+        - 그룹을 인덱스로, STAT_COLUMNS를 컬럼으로 하는 데이터프레임 (주문 수 내림차순)
+        """
+        values = np.asarray(prices, dtype='float64')
+        codes, uniques = pd.factorize(np.asarray(groups, dtype=object), use_na_sentinel=True)
+        valid = (codes >= 0) & np.isfinite(values)
+        codes, values = codes[valid], values[valid]
+        if values.size == 0:
+            return pd.DataFrame(columns=STAT_COLUMNS, dtype='float64')
+
+        # 그룹 코드 -> 가격 순으로 한 번만 정렬
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        counts = np.diff(np.r_[starts, values.size])
+
+        sums = np.add.reduceat(values, starts)
+        means = sums / counts
+        deviations = values - np.repeat(means, counts)
+        squared = np.add.reduceat(deviations * deviations, starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(counts > 1, np.sqrt(squared / (counts - 1)), np.nan)
+
+        stats = {
+            'count': counts,
+            'share': (counts / counts.sum() * 100).round(1),
+            'mean': means,
+            'min': values[starts],
+            'max': values[starts + counts - 1],
+            'std': std
+        }
+        p10, median, p90 = (self._sorted_quantile(values, starts, counts, q) for q in self.quantiles)
+        stats.update({'p10': p10, 'median': median, 'p90': p90})
+
+        result = pd.DataFrame(stats, index=pd.Index(uniques[codes[starts]], dtype=object))[STAT_COLUMNS]
+        return result.sort_values('count', ascending=False, kind='stable')
+
+    @staticmethod
+    def _sorted_quantile(values, starts, counts, q):
+        """그룹별로 정렬된 구간에서 선형 보간 분위수 계산 (pandas 기본 방식과 동일)"""
+        position = (counts - 1) * q
+        lower = np.floor(position).astype('int64')
+        upper = np.ceil(position).astype('int64')
+        low_values = values[starts + lower]
+        high_values = values[starts + upper]
+        return low_values + (high_values - low_values) * (position - lower)
@@ -1,6 +1,11 @@
 # data/data_processor/sales_analyzer.py
+import numpy as np
 import pandas as pd
 from config import Config
+from data.sketches import create_counter
+from data.data_processor.data_profiler import DataProfiler
+from data.data_processor.price_distribution import PriceDistribution
+from data.data_processor.price_statistics import PriceStatistics
 
 class SalesAnalyzer:
     """판매 데이터 분석을 담당하는 클래스 (가격, 채널, 베스트셀러 등)"""
@@ -13,128 +18,132 @@ class SalesAnalyzer:
         """
         self.df = df
         self.config = config if config is not None else Config()
+        # 데이터 프로파일 (DataProcessor.profile_data()에서 설정, 집계 백엔드 자동 선택에 사용)
+        self.profile = None
+    
+    def _counter_settings(self, column):
+        """컬럼의 고유값 수를 반영한 집계 백엔드 설정"""
+        return self.config.get_counter_settings(DataProfiler.distinct_count(self.profile, column))
     
     def get_channel_data(self):
-        """판매 채널 분석"""
+        """
+        판매 채널 분석
+        
+        Returns:
+        - (채널별 주문 수 시리즈, 상위 3개 채널 비율(%), 상위 3개 채널 이름 리스트)
+        """
         if '판매채널' not in self.df.columns:
-            return pd.Series(), pd.Series(), 0, [], []
+            return pd.Series(dtype='int64'), 0, []
             
         # 채널별 주문 수 계산
         channel_counts = self.df['판매채널'].value_counts()
         
-        # 상위 10개 채널 선택
-        top_channels = channel_counts.head(10)
-        
         # 전체 주문 중 상위 3개 채널의 비율 계산
         top3_channels = channel_counts.head(3)
         top3_ratio = (top3_channels.sum() / channel_counts.sum() * 100).round(1)
-        
-        # 채널 리스트
-        top3_channel_list = top3_channels.index.tolist()
-        
-        # 데이터 포맷팅
-        channel_data = []
-        for channel, count in top_channels.items():
-            channel_data.append({
-                'name': channel,
-                'value': count
-            })
             
-        return channel_counts, top_channels, top3_ratio, top3_channel_list, channel_data
+        return channel_counts, top3_ratio, top3_channels.index.tolist()
     
-    def analyze_price_ranges(self):
-        """가격대 분석"""
+    def analyze_price_distribution(self):
+        """
+        가격대 분포 분석 (전체 + 채널별 + 카테고리별을 한 번의 구간화로 계산)
+        
+        Returns:
+        - PriceDistribution 객체 (가격 컬럼이 없으면 None)
+        """
         if '상품가격' not in self.df.columns:
-            return pd.Series(), pd.Series(), []
-        
-        # 가격대 구간 정의
-        price_bins = [0, 10000, 20000, 30000, 50000, 70000, 100000, 150000, 200000, 1000000]
-        price_labels = [
-            '1만원 미만', '1~2만원', '2~3만원', '3~5만원', 
-            '5~7만원', '7~10만원', '10~15만원', '15~20만원', '20만원 이상'
-        ]
-        
-        # 가격대별 상품 수 계산
-        price_counts = pd.cut(
-            self.df['상품가격'], 
-            bins=price_bins, 
-            labels=price_labels, 
-            right=False
-        ).value_counts().sort_index()
-        
-        # 가격대별 비율 계산
-        price_percent = (price_counts / price_counts.sum() * 100).round(1)
-        
-        # 데이터 포맷팅
-        price_data = []
-        for price_range, count in price_counts.items():
-            percent = price_percent[price_range]
-            price_data.append({
-                'name': price_range,
-                'value': count,
-                'percent': percent,
-                'range': price_range
-            })
-        
-        return price_counts, price_percent, price_data
+            return None
+        
+        prices = self.df['상품가격'].to_numpy(dtype='float64', na_value=np.nan)
+        distribution = PriceDistribution.from_settings(self.config.get_price_bin_settings(), prices)
+        
+        # 채널/카테고리별 분포는 같은 구간 결과를 재사용
+        groups = {}
+        if '판매채널' in self.df.columns:
+            groups['channel'] = self.df['판매채널']
+        if '상품 카테고리' in self.df.columns:
+            groups['category'] = self.df['상품 카테고리']
+        
+        return distribution.update(prices, groups)
+    
+    def analyze_price_ranges(self, distribution=None):
+        """
+        가격대 분석
+        
+        Parameters:
+        - distribution: 이미 계산된 PriceDistribution (None이면 새로 계산)
+        
+        Returns:
+        - 가격대별 주문 수 시리즈
+        """
+        if distribution is None:
+            distribution = self.analyze_price_distribution()
+        if distribution is None:
+            return pd.Series(dtype='int64')
+        
+        return distribution.counts()
     
     def analyze_bestsellers(self):
-        """베스트셀러 상품 분석"""
+        """
+        베스트셀러 상품 분석
+        
+        Returns:
+        - 상위 10개 상품의 주문 수 시리즈
+        """
         if '상품명' not in self.df.columns:
-            return pd.Series(), []
+            return pd.Series(dtype='int64')
         
-        # 상품별 주문 수 계산
-        product_counts = self.df['상품명'].value_counts()
+        # 상품별 주문 수 계산 (설정된 집계 백엔드 사용)
+        counter = create_counter(**self._counter_settings('상품명'))
+        counter.update(self.df['상품명'])
         
         # 상위 10개 상품 선택
-        top_products = product_counts.head(10)
-        
-        # 데이터 포맷팅
-        bestseller_data = []
-        for idx, (product, count) in enumerate(top_products.items(), 1):
-            # 상품명이 너무 길면 잘라서 표시
-            display_name = product
-            if len(product) > 50:
-                display_name = product[:47] + "..."
-                
-            bestseller_data.append({
-                'rank': idx,
-                'name': display_name,
-                'product': product,
-                'count': count,
-                'value': count  # 차트 데이터 포맷팅용
-            })
-        
-        return top_products, bestseller_data
+        return pd.Series(dict(counter.most_common(10)), dtype='int64')
+    
+    def analyze_price_statistics(self):
+        """
+        채널별/카테고리별 가격 통계 (주문 수, 점유율, 평균, 중앙값, p10/p90, 표준편차)
+        
+        Returns:
+        - {'channels': 데이터프레임, 'categories': 데이터프레임}
+        """
+        if '상품가격' not in self.df.columns:
+            return {}
+        
+        prices = self.df['상품가격'].to_numpy(dtype='float64', na_value=np.nan)
+        engine = PriceStatistics()
+        
+        statistics = {}
+        if '판매채널' in self.df.columns:
+            statistics['channels'] = engine.compute(prices, self.df['판매채널'])
+        if '상품 카테고리' in self.df.columns:
+            statistics['categories'] = engine.compute(prices, self.df['상품 카테고리'])
+        return statistics
     
-    def analyze_channel_prices(self):
-        """채널별 평균 가격 분석"""
+    def analyze_channel_prices(self, statistics=None):
+        """
+        채널별 평균 가격 분석
+        
+        Parameters:
+        - statistics: 이미 계산된 analyze_price_statistics() 결과 (None이면 새로 계산)
+        """
         if '판매채널' not in self.df.columns or '상품가격' not in self.df.columns:
             return {}
-            
-        # 채널별 평균 가격 계산
-        channel_prices = self.df.groupby('판매채널')['상품가격'].mean()
         
-        return channel_prices.to_dict()
+        if statistics is None:
+            statistics = self.analyze_price_statistics()
+        
+        # 채널별 평균 가격 (통계 결과 재사용)
+        return statistics['channels']['mean'].to_dict()
     
     def analyze_categories(self):
-        """카테고리 분석"""
+        """
+        카테고리 분석
+        
+        Returns:
+        - 카테고리 코드별 주문 수 시리즈
+        """
         if '상품 카테고리' not in self.df.columns:
-            return pd.Series(), pd.Series(), []
-            
-        # 카테고리별 주문 수 계산
-        category_counts = self.df['상품 카테고리'].value_counts()
-        
-        # 상위 10개 카테고리 선택
-        top_categories = category_counts.head(10)
-        
-        # 데이터 포맷팅
-        category_data = []
-        for category, count in top_categories.items():
-            category_data.append({
-                'name': self.config.get_category_name(category),
-                'id': category,
-                'value': count
-            })
+            return pd.Series(dtype='int64')
             
-        return category_counts, top_categories, category_data
\ No newline at end of file
+        return self.df['상품 카테고리'].value_counts()
\ No newline at end of file
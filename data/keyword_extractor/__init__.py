@@ -3,7 +3,9 @@
 비플로우 분석 시스템의 키워드 추출 서브모듈
 """
 from data.keyword_extractor.keyword_extractor import KeywordExtractor
+from data.keyword_extractor.model_store import ModelStore
 
 __all__ = [
-    'KeywordExtractor'
+    'KeywordExtractor',
+    'ModelStore'
 ]
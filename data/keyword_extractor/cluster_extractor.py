@@ -1,54 +1,240 @@
 """
 클러스터링(스타일 키워드) 추출 로직
 """
+import time
 import numpy as np
+import pandas as pd
+from scipy import sparse
 from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
+
+# 지원하는 클러스터링 백엔드
+CLUSTER_BACKENDS = ['kmeans', 'minibatch']
 
 class ClusterExtractor:
     """K-Means 등 클러스터링을 통해 스타일 키워드를 자동 추출"""
 
+    # 시간 제한이 있을 때 KMeans를 나누어 실행할 반복 횟수 단위
+    KMEANS_STEP_ITER = 10
+
+    # MiniBatchKMeans 패스 간 중심점 이동 허용치 (이하이면 수렴으로 판단)
+    MINIBATCH_TOL = 1e-4
+
     @staticmethod
-    def extract_cluster_keywords(texts, n_clusters=5, n_keywords=3):
+    def extract_cluster_keywords(texts, n_clusters=5, n_keywords=3, backend='kmeans', distinct=False,
+                                 max_iter=300, time_limit=0, batch_size=4096, random_state=42, store=None):
         """
         클러스터링을 통한 키워드 추출
         Parameters:
         - texts: 전처리된 텍스트 리스트
-        - n_clusters: 클러스터 개수
+        - n_clusters: 클러스터 개수 (문서 수보다 많으면 문서 수로 제한)
         - n_keywords: 각 클러스터에서 추출할 키워드 수
+        - backend: 'kmeans'(전체 배치) 또는 'minibatch'(MiniBatchKMeans partial_fit)
+        - distinct: True이면 고유 텍스트를 빈도 가중치로 클러스터링
+        - max_iter: kmeans는 최대 반복 수, minibatch는 최대 미니배치 스텝 수
+        - time_limit: 클러스터링 시간 제한(초, 0이면 제한 없음)
+        - batch_size: minibatch 백엔드의 배치 크기
+        - random_state: 난수 시드
+        - store: ModelStore (주어지면 저장된 어휘와 중심점에서 이어서 학습하고 결과를 저장)
         Returns:
         - 키워드 문자열들의 리스트 (ex: ["basic", "fit", "cotton", ...])
         """
         if len(texts) < n_clusters:
             return []
+        if backend not in CLUSTER_BACKENDS:
+            print(f"지원하지 않는 클러스터링 백엔드입니다: {backend} (kmeans 사용)")
+            backend = 'kmeans'
 
         try:
-            count_vec = CountVectorizer(max_features=200, min_df=3)
-            term_matrix = count_vec.fit_transform(texts)
+            action, entry, key, fingerprint = 'fit', None, None, None
+            if store is not None:
+                params = {'n_clusters': n_clusters, 'n_keywords': n_keywords, 'backend': backend,
+                          'distinct': distinct, 'max_features': 200, 'min_df': 3}
+                key = store.make_key('cluster', params)
+                entry = store.load(key)
+                fingerprint = store.fingerprint(texts)
+                action = store.decide(entry['meta'] if entry else None, fingerprint)
+                if action == 'reuse':
+                    return entry['model']['keywords']
+
+            init = None
+            if action == 'transform':
+                # 저장된 어휘로 새 문서만 변환하고 저장된 중심점에서 학습 시작
+                term_matrix, weights, vectorizer = ClusterExtractor._term_matrix(
+                    texts, distinct, entry['model']['vectorizer'])
+                init = entry['model']['centers']
+                if not store.covers(term_matrix) or len(init) != min(n_clusters, term_matrix.shape[0]):
+                    action, init = 'fit', None
+            if action != 'transform':
+                term_matrix, weights, vectorizer = ClusterExtractor._term_matrix(texts, distinct)
+            feature_names = vectorizer.get_feature_names_out()
 
             # 특성이 너무 적으면 클러스터링 불가
             if term_matrix.shape[1] < 5:
                 return []
 
-            kmeans = KMeans(n_clusters=min(n_clusters, len(texts) // 5 + 1), random_state=42)
-            clusters = kmeans.fit_predict(term_matrix)
+            n_clusters = min(n_clusters, term_matrix.shape[0])
+            if backend == 'minibatch':
+                clusters, centers = ClusterExtractor._fit_minibatch(
+                    term_matrix, weights, n_clusters, max_iter, time_limit, batch_size, random_state, init
+                )
+            else:
+                clusters, centers = ClusterExtractor._fit_kmeans(
+                    term_matrix, weights, n_clusters, max_iter, time_limit, random_state, init
+                )
 
-            feature_names = count_vec.get_feature_names_out()
-            style_keywords = []
+            # 클러스터별 (가중) 단어 빈도 합계를 한 번의 희소 행렬 곱으로 계산
+            membership = sparse.csr_matrix(
+                (weights, (clusters, np.arange(len(clusters)))),
+                shape=(n_clusters, len(clusters))
+            )
+            cluster_term_freq = (membership @ term_matrix).toarray()
+            cluster_sizes = np.bincount(clusters, minlength=n_clusters)
 
-            for i in range(kmeans.n_clusters):
-                # 해당 클러스터 문서 인덱스
-                cluster_doc_indices = np.where(clusters == i)[0]
-                if len(cluster_doc_indices) > 0:
-                    # 클러스터 내 문서들의 단어 빈도 합계
-                    cluster_term_freq = term_matrix[cluster_doc_indices].sum(axis=0).A1
-                    top_indices = cluster_term_freq.argsort()[-n_keywords:][::-1]
+            style_keywords = []
+            for i in range(n_clusters):
+                if cluster_sizes[i] > 0:
+                    top_indices = cluster_term_freq[i].argsort()[-n_keywords:][::-1]
                     cluster_keywords = [feature_names[idx] for idx in top_indices]
                     style_keywords.append(cluster_keywords)
 
             # 2차원 리스트를 1차원으로 펴기
             flattened_keywords = [kw for cluster in style_keywords for kw in cluster]
+
+            if store is not None:
+                fitted_at = entry['meta']['fitted_at'] if action == 'transform' else None
+                model = {'vectorizer': store.compact(vectorizer), 'centers': centers, 'keywords': flattened_keywords}
+                store.save(key, model, fingerprint, fitted_at=fitted_at, documents=len(texts),
+                           vocabulary_size=len(feature_names))
             return flattened_keywords
         except Exception as e:
             print(f"클러스터링 중 오류 발생: {e}")
             return []
+
+    @staticmethod
+    def _term_matrix(texts, distinct, vectorizer=None):
+        """
+        클러스터링용 단어 행렬 생성
+
+        Parameters:
+        - texts: 전처리된 텍스트 리스트
+        - distinct: True이면 고유 텍스트 x 어휘 행렬과 빈도 가중치 사용
+        - vectorizer: 저장된 CountVectorizer (주어지면 어휘를 새로 만들지 않고 변환만 수행)
+
+        Returns:
+        - (단어 행렬, 행별 가중치, CountVectorizer)
+        """
+        if distinct:
+            if vectorizer is None:
+                return ClusterExtractor._distinct_term_matrix(texts)
+            counts = pd.Series(texts, dtype=object).value_counts(sort=False)
+            return vectorizer.transform(counts.index.tolist()), counts.to_numpy(dtype='int64'), vectorizer
+
+        if vectorizer is None:
+            vectorizer = CountVectorizer(max_features=200, min_df=3)
+            term_matrix = vectorizer.fit_transform(texts)
+        else:
+            term_matrix = vectorizer.transform(texts)
+        return term_matrix, np.ones(term_matrix.shape[0], dtype='int64'), vectorizer
+
+    @staticmethod
+    def _distinct_term_matrix(texts, max_features=200, min_df=3):
+        """
+        고유 텍스트 기준 단어 행렬 생성
+
+        전체 텍스트에 CountVectorizer(max_features, min_df)를 적용한 것과 같은 어휘를
+        고유 텍스트와 빈도 가중치만으로 선택합니다.
+
+        Returns:
+        - (고유 텍스트 x 어휘 행렬, 고유 텍스트별 빈도, 선택된 어휘로 고정한 CountVectorizer)
+        """
+        counts = pd.Series(texts, dtype=object).value_counts(sort=False)
+        unique_texts = counts.index.tolist()
+        weights = counts.to_numpy(dtype='int64')
+
+        count_vec = CountVectorizer()
+        full_matrix = count_vec.fit_transform(unique_texts).tocsc()
+        vocabulary = count_vec.get_feature_names_out()
+
+        # 가중 문서 빈도(min_df)와 가중 단어 빈도(max_features) 기준 어휘 선택
+        doc_freq = (full_matrix > 0).T.astype('int64') @ weights
+        term_freq = full_matrix.T @ weights
+        candidates = np.flatnonzero(doc_freq >= min_df)
+        if len(candidates) > max_features:
+            candidates = candidates[(-term_freq[candidates]).argsort()[:max_features]]
+        selected = np.sort(candidates)
+
+        selected_vectorizer = CountVectorizer(vocabulary=list(vocabulary[selected])).fit([])
+        return full_matrix[:, selected].tocsr(), weights, selected_vectorizer
+
+    @staticmethod
+    def _fit_kmeans(term_matrix, weights, n_clusters, max_iter, time_limit, random_state, init=None):
+        """
+        전체 배치 KMeans (시간 제한이 있으면 반복을 나누어 실행하고 중심점을 이어받음)
+
+        Returns:
+        - (문서별 클러스터 번호, 클러스터 중심점)
+        """
+        init_options = {'init': init, 'n_init': 1} if init is not None else {}
+        if not time_limit:
+            kmeans = KMeans(n_clusters=n_clusters, max_iter=max_iter, random_state=random_state, **init_options)
+            labels = kmeans.fit_predict(term_matrix, sample_weight=weights)
+            return labels, kmeans.cluster_centers_
+
+        deadline = time.monotonic() + time_limit
+        kmeans = KMeans(n_clusters=n_clusters, max_iter=min(ClusterExtractor.KMEANS_STEP_ITER, max_iter),
+                        random_state=random_state, **(init_options or {'n_init': 1}))
+        kmeans.fit(term_matrix, sample_weight=weights)
+        done = kmeans.n_iter_
+        while done < max_iter and kmeans.n_iter_ >= kmeans.max_iter and time.monotonic() < deadline:
+            step = min(ClusterExtractor.KMEANS_STEP_ITER, max_iter - done)
+            kmeans = KMeans(n_clusters=n_clusters, init=kmeans.cluster_centers_, max_iter=step,
+                            n_init=1, random_state=random_state)
+            kmeans.fit(term_matrix, sample_weight=weights)
+            done += kmeans.n_iter_
+        return kmeans.labels_, kmeans.cluster_centers_
+
+    @staticmethod
+    def _fit_minibatch(term_matrix, weights, n_clusters, max_iter, time_limit, batch_size, random_state, init=None):
+        """
+        MiniBatchKMeans를 청크 단위 partial_fit으로 학습 후 전체 문서 할당
+
+        Returns:
+        - (문서별 클러스터 번호, 클러스터 중심점)
+        """
+        n_rows = term_matrix.shape[0]
+        batch_size = max(batch_size, n_clusters)
+        rng = np.random.default_rng(random_state)
+        order = rng.permutation(n_rows)
+        starts = list(range(0, n_rows, batch_size))
+
+        # 첫 배치는 클러스터 수 이상의 문서를 가져야 함
+        if len(starts) > 1 and n_rows - starts[-1] < n_clusters:
+            starts.pop()
+
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, random_state=random_state,
+                                 n_init=1, init=init if init is not None else 'k-means++')
+        deadline = time.monotonic() + time_limit if time_limit else None
+        max_steps = max(max_iter, 1)
+        steps = 0
+        previous_centers = None
+        while steps < max_steps:
+            for i, start in enumerate(starts):
+                end = starts[i + 1] if i + 1 < len(starts) else n_rows
+                rows = order[start:end]
+                kmeans.partial_fit(term_matrix[rows], sample_weight=weights[rows])
+                steps += 1
+                if steps >= max_steps or (deadline is not None and time.monotonic() >= deadline):
+                    steps = max_steps
+                    break
+
+            # 한 패스 동안 중심점 이동이 거의 없으면 수렴으로 보고 종료
+            centers = kmeans.cluster_centers_
+            if previous_centers is not None and np.abs(centers - previous_centers).max() < ClusterExtractor.MINIBATCH_TOL:
+                break
+            previous_centers = centers.copy()
+
+        labels = np.empty(n_rows, dtype='int64')
+        for start in range(0, n_rows, batch_size):
+            labels[start:start + batch_size] = kmeans.predict(term_matrix[start:start + batch_size])
+        return labels, kmeans.cluster_centers_
@@ -1,36 +1,29 @@
 """
 색상 그룹 추출 로직
 """
-import re
-import pandas as pd
+from data.sketches import ExactCounter
 
 class ColorExtractor:
     """색상 데이터 클러스터링/그룹 추출"""
 
     @staticmethod
-    def extract_color_groups(option_texts, color_patterns):
+    def extract_color_groups(option_colors, counter=None):
         """
-        옵션 텍스트에서 색상 그룹 추출
+        옵션 색상 컬럼에서 색상 그룹 추출
         Parameters:
-        - option_texts: 시리즈 또는 리스트(옵션 텍스트)
-        - color_patterns: 정규식으로 사용할 색상 패턴(|로 연결한 문자열)
+        - option_colors: OptionParser로 파싱한 색상 시리즈 (범주형)
+        - counter: 빈도 집계 백엔드 (None이면 정확 집계)
         Returns:
         - [(색상, 빈도), ...] 형태의 상위 색상 리스트
         """
-        if len(option_texts) == 0:
+        if len(option_colors) == 0:
             return []
 
-        color_regex = re.compile(r'(' + color_patterns + r')', re.IGNORECASE)
+        # 범주형 컬럼의 value_counts 결과를 집계 백엔드에 한 번에 누적
+        counts = option_colors.value_counts()
+        counts = counts[counts > 0]
+        if counter is None:
+            counter = ExactCounter()
+        counter.update(counts.index.astype(object), counts.to_numpy())
 
-        colors = []
-        for text in option_texts:
-            matches = color_regex.findall(text)
-            colors.extend(matches)
-
-        if not colors:
-            return []
-
-        color_counts = pd.Series(colors).value_counts()
-        top_colors = color_counts.head(20)
-
-        return [(color, count) for color, count in top_colors.items()]
+        return counter.most_common(20)
@@ -2,25 +2,41 @@
 키워드 추출 메인 클래스 - KeywordExtractor
 """
 import re
+import numpy as np
+import pandas as pd
 
 # 절대 경로 import (사용자 요청사항)
 from config import Config
-from utils import clean_text, safe_process_data
+from utils import clean_text, safe_process_data, FashionTokenizer
 from data.keyword_extractor.tfidf_extractor import TfidfExtractor
 from data.keyword_extractor.cluster_extractor import ClusterExtractor
 from data.keyword_extractor.color_extractor import ColorExtractor
+from data.keyword_extractor.model_store import ModelStore
+from data.sketches import create_counter
+from data.data_processor.data_profiler import DataProfiler
+from data.data_processor.option_parser import OptionParser
 
 class KeywordExtractor:
     """상품 데이터에서 자동으로 키워드를 추출하는 클래스"""
     
-    def __init__(self, df, config=None):
+    def __init__(self, df, config=None, profile=None):
         """
         Parameters:
         - df: 분석할 데이터프레임
         - config: 설정 객체
+        - profile: 데이터 프로파일 (집계 백엔드 자동 선택용, 선택)
         """
         self.df = df
         self.config = config if config is not None else Config()
+        self.profile = profile
+        
+        # 학습된 어휘/IDF/중심점 저장소 (비활성화 시 None)
+        self.model_store = ModelStore.from_config(self.config)
+        
+        # 패션 사전 기반 토크나이저 (상품명의 자주 나오는 미등록 구간을 어휘로 학습)
+        self.tokenizer = FashionTokenizer.from_config(self.config)
+        if '상품명' in self.df.columns:
+            self.tokenizer.learn(self.df['상품명'])
     
     def extract_product_keywords(self, column='상품명', n_keywords=10, use_category=True):
         """
@@ -43,6 +59,9 @@ class KeywordExtractor:
             return safe_process_data(
                 TfidfExtractor.extract_category_tfidf_keywords,
                 self.df, '상품 카테고리', column, n_keywords,
+                **self.config.get_tfidf_settings(),
+                store=self.model_store,
+                tokenizer=self.tokenizer,
                 default_value=[],
                 error_message=f"카테고리별 {column} 키워드 추출 중 오류"
             )
@@ -55,6 +74,7 @@ class KeywordExtractor:
         return safe_process_data(
             TfidfExtractor.extract_tfidf_keywords,
             texts, n_keywords,
+            store=self.model_store,
             default_value=[],
             error_message=f"{column} 키워드 추출 중 오류"
         )
@@ -68,32 +88,33 @@ class KeywordExtractor:
         return safe_process_data(
             ClusterExtractor.extract_cluster_keywords,
             texts, n_clusters, n_keywords,
+            **self.config.get_cluster_settings(),
+            store=self.model_store,
             default_value=[],
             error_message=f"{column} 스타일 키워드 추출 중 오류"
         )
     
     def extract_color_groups(self):
-        """색상 데이터 클러스터링을 통한 색상 그룹 추출"""
-        # '옵션정보' 컬럼이 없으면 불가능
-        if '옵션정보' not in self.df.columns:
+        """옵션정보에서 파싱한 색상 컬럼으로 색상 그룹 추출"""
+        # 옵션 파싱 결과가 없으면 옵션정보를 직접 파싱
+        if OptionParser.COLOR_COLUMN in self.df.columns:
+            option_colors = self.df[OptionParser.COLOR_COLUMN]
+        elif '옵션정보' in self.df.columns:
+            option_colors = OptionParser(self.config).parse(self.df['옵션정보'])[OptionParser.COLOR_COLUMN]
+        else:
             return []
         
-        option_texts = self.df['옵션정보'].dropna().astype(str)
-        if option_texts.empty:
-            return []
-        
-        # 색상 키워드 목록 -> 정규식 패턴으로 결합
-        color_patterns = '|'.join(self.config.get_product_attributes('colors'))
-        
         return safe_process_data(
             ColorExtractor.extract_color_groups,
-            option_texts, color_patterns,
+            option_colors,
+            create_counter(**self.config.get_counter_settings(
+                DataProfiler.distinct_count(self.profile, '옵션정보'))),
             default_value=[],
             error_message="색상 그룹 추출 중 오류"
         )
     
     def _prepare_texts(self, column):
-        """텍스트 데이터 전처리: utils의 clean_text() 사용"""
+        """텍스트 데이터 전처리: utils의 clean_text() 후 토크나이저로 분할 (고유 텍스트당 한 번)"""
         if column not in self.df.columns:
             return None
         
@@ -101,6 +122,7 @@ class KeywordExtractor:
         if texts.empty:
             return None
         
-        # 각 텍스트에 대해 utils의 clean_text 함수를 사용하여 전처리 수행
-        cleaned_texts = [clean_text(text) for text in texts]
-        return cleaned_texts
+        # 각 고유 텍스트에 대해 정제 + 토큰 분할을 한 번만 수행한 뒤 전체 행으로 펼침
+        codes, uniques = pd.factorize(texts)
+        segmented = np.array([self.tokenizer.segment(clean_text(text)) for text in uniques], dtype=object)
+        return segmented[codes].tolist()
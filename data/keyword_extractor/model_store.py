@@ -0,0 +1,181 @@
+# data/keyword_extractor/model_store.py
+"""
+키워드 추출 모델(어휘, IDF 가중치, 클러스터 중심점) 저장소
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+def document_coverage(matrix):
+    """문서 x 어휘 행렬에서 어휘가 하나 이상 포함된 문서의 비율"""
+    if matrix.shape[0] == 0:
+        return 0.0
+    return np.count_nonzero(matrix.getnnz(axis=1)) / matrix.shape[0]
+
+
+class ModelStore:
+    """
+    실행 간 학습된 키워드 추출 모델을 저장/재사용하는 저장소
+
+    모델은 '종류 + 설정 해시' 키로 출력 폴더 아래(models/)에 저장되며,
+    코퍼스 지문(fingerprint)과 학습 시각을 함께 기록합니다. 다음 실행에서는
+    decide()의 정책에 따라 결과 재사용(reuse), 기존 어휘/IDF로 변환(transform),
+    재학습(fit) 중 하나를 선택합니다.
+    """
+
+    # 저장 형식 버전 (형식이 바뀌면 기존 모델은 무시하고 재학습)
+    FORMAT_VERSION = 1
+
+    def __init__(self, folder, refit_days=7, min_coverage=0.9, namespace=''):
+        """
+        Parameters:
+        - folder: 모델 저장 폴더
+        - refit_days: 이 기간(일)이 지난 모델은 재학습
+        - min_coverage: 기존 어휘로 표현되는 문서 비율이 이 값 미만이면 재학습
+        - namespace: 저장 키에 포함할 값 (설정 스냅샷 해시, 불용어/사전이 바뀌면 다른 키 사용)
+        """
+        self.folder = Path(folder)
+        self.refit_days = refit_days
+        self.min_coverage = min_coverage
+        self.namespace = namespace
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        설정에서 모델 저장소 생성
+
+        Returns:
+        - ModelStore 객체 (비활성화된 경우 None)
+        """
+        settings = config.get_model_store_settings()
+        if not settings['enabled']:
+            return None
+        return cls(
+            settings['folder'], settings['refit_days'], settings['min_coverage'],
+            namespace=config.snapshot().content_hash
+        )
+
+    def make_key(self, kind, params):
+        """
+        모델 종류와 설정으로 저장 키 생성
+
+        Parameters:
+        - kind: 모델 종류 (예: 'tfidf', 'category_tfidf', 'cluster')
+        - params: 모델 설정 딕셔너리 (JSON 직렬화 가능)
+        """
+        payload = json.dumps({'kind': kind, 'params': params, 'namespace': self.namespace}, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{kind}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+    @staticmethod
+    def fingerprint(texts):
+        """
+        코퍼스 지문 (문서 순서와 무관한 sha256)
+
+        Parameters:
+        - texts: 전처리된 텍스트 리스트
+        """
+        values = np.asarray(list(texts), dtype=object)
+        hashes = np.sort(pd.util.hash_array(values))
+        digest = hashlib.sha256(hashes.tobytes())
+        digest.update(str(len(values)).encode('ascii'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.folder / f"{key}.pkl"
+
+    def load(self, key):
+        """
+        저장된 모델 항목 로드
+
+        Returns:
+        - {'meta': 메타데이터, 'model': 모델 객체} (없거나 읽을 수 없으면 None)
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            print(f"저장된 모델을 읽을 수 없습니다 ({path.name}): {e}")
+            return None
+        if entry.get('meta', {}).get('format_version') != self.FORMAT_VERSION:
+            return None
+        return entry
+
+    def save(self, key, model, fingerprint, fitted_at=None, **meta):
+        """
+        모델 항목 저장 (임시 파일에 쓴 뒤 교체)
+
+        Parameters:
+        - key: make_key()로 만든 저장 키
+        - model: 저장할 모델 객체 (pickle 가능)
+        - fingerprint: 마지막으로 처리한 코퍼스 지문
+        - fitted_at: 학습 시각 (기존 모델로 변환만 한 경우 원래 학습 시각 유지, None이면 현재)
+        - meta: 추가 메타데이터 (문서 수, 어휘 크기 등)
+        """
+        now = time.time()
+        entry = {
+            'meta': dict(
+                meta,
+                format_version=self.FORMAT_VERSION,
+                fingerprint=fingerprint,
+                fitted_at=now if fitted_at is None else fitted_at,
+                updated_at=now
+            ),
+            'model': model
+        }
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            temp_path = path.with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"모델 저장 중 오류 ({key}): {e}")
+        return entry
+
+    def decide(self, meta, fingerprint):
+        """
+        저장된 모델 사용 정책 결정
+
+        Parameters:
+        - meta: 저장된 모델의 메타데이터 (없으면 None)
+        - fingerprint: 현재 코퍼스 지문
+
+        Returns:
+        - 'reuse': 같은 코퍼스 → 저장된 결과 그대로 사용
+        - 'transform': 재학습 주기 이내 → 저장된 어휘/IDF로 새 문서만 변환 (coverage 확인 필요)
+        - 'fit': 모델이 없거나 재학습 주기가 지남 → 재학습
+        """
+        if meta is None:
+            return 'fit'
+        if meta.get('fingerprint') == fingerprint:
+            return 'reuse'
+        age_days = (time.time() - meta.get('fitted_at', 0)) / 86400
+        if age_days > self.refit_days:
+            return 'fit'
+        return 'transform'
+
+    @staticmethod
+    def compact(vectorizer):
+        """저장 크기를 줄이기 위해 학습 후 불필요한 속성(제외된 단어 목록) 제거"""
+        if hasattr(vectorizer, 'stop_words_'):
+            del vectorizer.stop_words_
+        return vectorizer
+
+    def covers(self, matrix):
+        """
+        기존 어휘로 변환한 문서 행렬이 충분히 표현되는지 확인
+
+        Parameters:
+        - matrix: vectorizer.transform() 결과 (문서 x 어휘 희소 행렬)
+        """
+        return matrix.shape[0] > 0 and document_coverage(matrix) >= self.min_coverage
@@ -1,101 +1,261 @@
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+import numpy as np
+import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from utils import clean_text
+from data.keyword_extractor.model_store import document_coverage
+
+# TF-IDF 벡터라이저 설정 (전체 / 카테고리별)
+TFIDF_PARAMS = {'max_features': 100, 'min_df': 2, 'ngram_range': (1, 2)}
+CATEGORY_TFIDF_PARAMS = {'max_features': 50, 'min_df': 2, 'ngram_range': (1, 2)}
 
 class TfidfExtractor:
     """TF-IDF로 상품 키워드를 추출하는 로직을 담은 클래스/헬퍼 함수 모음"""
 
     @staticmethod
-    def extract_tfidf_keywords(texts, n_keywords=10):
+    def extract_tfidf_keywords(texts, n_keywords=10, store=None):
         """
         TF-IDF로 키워드 추출
         Parameters:
         - texts: 전처리된 텍스트의 리스트 (pd.Series도 가능)
         - n_keywords: 추출할 키워드 수
+        - store: ModelStore (주어지면 저장된 어휘/IDF를 재사용하고 학습 결과를 저장)
         Returns:
         - [(키워드, tfidf값), ...] 형태의 리스트
         """
         if len(texts) == 0:
             return []
 
-        tfidf = TfidfVectorizer(
-            max_features=100,
-            min_df=2,
-            ngram_range=(1, 2)
-        )
+        action, entry, key, fingerprint = 'fit', None, None, None
+        if store is not None:
+            key = store.make_key('tfidf', dict(TFIDF_PARAMS, n_keywords=n_keywords))
+            entry = store.load(key)
+            fingerprint = store.fingerprint(texts)
+            action = store.decide(entry['meta'] if entry else None, fingerprint)
+            if action == 'reuse':
+                return entry['model']['keywords']
 
-        try:
-            tfidf_matrix = tfidf.fit_transform(texts)
-        except ValueError:
-            # 데이터가 부족하거나 부적절한 경우
-            return []
+        tfidf_matrix = None
+        if action == 'transform':
+            # 저장된 어휘/IDF로 새 문서만 변환 (어휘 적중률이 낮으면 재학습)
+            tfidf = entry['model']['vectorizer']
+            tfidf_matrix = tfidf.transform(texts)
+            if not store.covers(tfidf_matrix):
+                action, tfidf_matrix = 'fit', None
 
-        feature_names = tfidf.get_feature_names_out()
-        tfidf_scores = tfidf_matrix.mean(axis=0).A1
+        if tfidf_matrix is None:
+            tfidf = TfidfVectorizer(**TFIDF_PARAMS)
+            try:
+                tfidf_matrix = tfidf.fit_transform(texts)
+            except ValueError:
+                # 데이터가 부족하거나 부적절한 경우
+                return []
 
-        # 상위 n_keywords 추출
-        top_indices = tfidf_scores.argsort()[-n_keywords:][::-1]
-        top_keywords = [(feature_names[i], tfidf_scores[i]) for i in top_indices]
-        
-        # 필터링: 2글자 이상의 의미있는 단어만 선택
-        filtered_keywords = [(kw, score) for kw, score in top_keywords 
-                           if len(kw) >= 2 and re.match(r'^[\w가-힣]+$', kw)]
-        
+        filtered_keywords = _top_tfidf_keywords(tfidf, tfidf_matrix, n_keywords)
+
+        if store is not None:
+            fitted_at = entry['meta']['fitted_at'] if action == 'transform' else None
+            store.save(key, {'vectorizer': store.compact(tfidf), 'keywords': filtered_keywords},
+                       fingerprint, fitted_at=fitted_at, documents=len(texts),
+                       vocabulary_size=len(tfidf.vocabulary_))
         return filtered_keywords
     
     @staticmethod
-    def extract_category_tfidf_keywords(df, category_col, text_col, n_keywords=10):
+    def extract_category_tfidf_keywords(df, category_col, text_col, n_keywords=10,
+                                        workers=1, chunk_rows=2000, parallel_min_rows=20000, store=None,
+                                        tokenizer=None):
         """
         카테고리별 TF-IDF 키워드 추출
+        
+        카테고리 그룹은 정렬된 인덱스로 한 번에 나누고, 텍스트 전처리(clean_text)는
+        고유 텍스트당 한 번만 수행합니다. 작은 카테고리는 chunk_rows 행 이상이 되도록
+        묶어 프로세스 풀에서 병렬로 처리하며, 결과는 카테고리 정렬 순서로 병합하므로
+        직렬 처리와 동일합니다.
+        
         Parameters:
         - df: 데이터프레임
         - category_col: 카테고리 컬럼명
         - text_col: 텍스트 컬럼명
         - n_keywords: 각 카테고리별 추출할 키워드 수
+        - workers: 워커 프로세스 수 (1이면 직렬 처리)
+        - chunk_rows: 작은 카테고리를 묶을 때의 작업당 최소 행 수
+        - parallel_min_rows: 이 행 수 미만이면 직렬 처리
+        - store: ModelStore (주어지면 카테고리별 벡터라이저를 저장하고 재사용)
+        - tokenizer: FashionTokenizer (주어지면 정제된 텍스트를 사전 기반 토큰으로 분할)
         Returns:
         - [(키워드, tfidf값), ...] 형태의 통합 리스트
         """
         if category_col not in df.columns or text_col not in df.columns:
             return []
         
+        groups = TfidfExtractor._build_category_groups(df, category_col, text_col, tokenizer)
+        if not groups:
+            return []
+        
+        # 저장된 카테고리별 모델로 작업 결정 (재사용 / 변환 / 재학습)
         keywords_by_category = {}
+        stored, key, fingerprints = {}, None, {}
+        jobs = []
+        if store is not None:
+            key = store.make_key('category_tfidf', dict(CATEGORY_TFIDF_PARAMS, n_keywords=n_keywords))
+            entry = store.load(key)
+            stored = dict(entry['model']) if entry else {}
+        for category, texts in groups:
+            vectorizer = None
+            if store is not None:
+                fingerprints[category] = store.fingerprint(texts)
+                saved = stored.get(category)
+                action = store.decide(saved, fingerprints[category])
+                if action == 'reuse':
+                    keywords_by_category[category] = saved['keywords']
+                    continue
+                if action == 'transform':
+                    vectorizer = saved['vectorizer']
+            jobs.append((category, texts, vectorizer))
         
-        # 각 카테고리별 그룹 처리
-        for category, group in df.groupby(category_col):
-            # 데이터가 충분한 카테고리만 처리
-            if len(group) < 5:
-                continue
-                
-            # 전처리: 각 텍스트에 대해 utils의 clean_text 함수를 사용하여 전처리 수행
-            texts = [clean_text(text) for text in group[text_col].dropna().astype(str)]
-            
-            try:
-                tfidf = TfidfVectorizer(
-                    max_features=50,
-                    min_df=2,
-                    ngram_range=(1, 2)
-                )
-                tfidf_matrix = tfidf.fit_transform(texts)
-                feature_names = tfidf.get_feature_names_out()
-                tfidf_scores = tfidf_matrix.mean(axis=0).A1
-                
-                # 상위 키워드 추출
-                top_indices = tfidf_scores.argsort()[-n_keywords:][::-1]
-                cat_keywords = [(feature_names[i], tfidf_scores[i]) for i in top_indices]
-                
-                # 필터링
-                filtered_keywords = [(kw, score) for kw, score in cat_keywords 
-                                   if len(kw) >= 2 and re.match(r'^[\w가-힣]+$', kw)]
-                
-                keywords_by_category[category] = filtered_keywords
-            except Exception as e:
-                print(f"카테고리 '{category}' 키워드 추출 중 오류: {e}")
+        min_coverage = store.min_coverage if store is not None else 0
+        batches = TfidfExtractor._bundle_jobs(jobs, chunk_rows)
+        total_rows = sum(len(texts) for _, texts, _ in jobs)
+        if workers > 1 and len(batches) > 1 and total_rows >= parallel_min_rows:
+            results = TfidfExtractor._run_parallel(batches, n_keywords, min_coverage, workers)
+        else:
+            results = [_score_category_batch(batch, n_keywords, min_coverage) for batch in batches]
+        
+        for batch_result in results:
+            for category, keywords, error, vectorizer, refitted in batch_result:
+                if error is not None:
+                    print(f"카테고리 '{category}' 키워드 추출 중 오류: {error}")
+                    continue
+                keywords_by_category[category] = keywords
+                if store is not None:
+                    fitted_at = time.time() if refitted else stored[category]['fitted_at']
+                    stored[category] = {
+                        'vectorizer': store.compact(vectorizer),
+                        'keywords': keywords,
+                        'fingerprint': fingerprints[category],
+                        'fitted_at': fitted_at
+                    }
         
-        # 모든 카테고리 키워드 통합
+        if store is not None and jobs:
+            store.save(key, stored, store.fingerprint(fingerprints.values()), categories=len(stored))
+        
+        # 모든 카테고리 키워드 통합 (카테고리 정렬 순서)
         all_keywords = {}
-        for cat_keywords in keywords_by_category.values():
-            for kw, score in cat_keywords:
+        for category, _ in groups:
+            for kw, score in keywords_by_category.get(category, []):
                 all_keywords[kw] = all_keywords.get(kw, 0) + score
         
         # 점수순 정렬 후 상위 n_keywords 반환
         return sorted(all_keywords.items(), key=lambda x: x[1], reverse=True)[:n_keywords]
+    
+    @staticmethod
+    def _build_category_groups(df, category_col, text_col, tokenizer=None):
+        """
+        정렬된 카테고리 인덱스로 그룹 분할 (텍스트 전처리는 고유 텍스트당 한 번)
+        
+        Returns:
+        - [(카테고리, 전처리된 텍스트 리스트), ...] (카테고리 정렬 순서, 5행 미만 카테고리 제외)
+        """
+        # 카테고리 코드 (groupby와 같은 정렬 순서, 결측 카테고리는 -1)
+        codes, categories = pd.factorize(df[category_col], sort=True, use_na_sentinel=True)
+        group_sizes = np.bincount(codes[codes >= 0], minlength=len(categories))
+        
+        text_series = df[text_col]
+        has_text = text_series.notna().to_numpy()
+        raw_texts = text_series.astype(str).to_numpy(dtype=object)
+        cleaned_cache = {}
+        
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+        boundaries = np.r_[0, np.cumsum(group_sizes)]
+        
+        groups = []
+        for code, category in enumerate(categories):
+            # 데이터가 충분한 카테고리만 처리
+            if group_sizes[code] < 5:
+                continue
+            rows = order[boundaries[code]:boundaries[code + 1]]
+            rows = rows[has_text[rows]]
+            texts = []
+            for raw in raw_texts[rows]:
+                cleaned = cleaned_cache.get(raw)
+                if cleaned is None:
+                    cleaned = clean_text(raw)
+                    if tokenizer is not None:
+                        cleaned = tokenizer.segment(cleaned)
+                    cleaned_cache[raw] = cleaned
+                texts.append(cleaned)
+            groups.append((category, texts))
+        return groups
+    
+    @staticmethod
+    def _bundle_jobs(jobs, chunk_rows):
+        """작은 카테고리 작업을 chunk_rows 행 이상이 되도록 묶음 (순서 유지)"""
+        batches = []
+        current, current_rows = [], 0
+        for job in jobs:
+            current.append(job)
+            current_rows += len(job[1])
+            if current_rows >= chunk_rows:
+                batches.append(current)
+                current, current_rows = [], 0
+        if current:
+            batches.append(current)
+        return batches
+    
+    @staticmethod
+    def _run_parallel(batches, n_keywords, min_coverage, workers):
+        """프로세스 풀에서 작업 묶음 처리 (실패 시 직렬 처리로 대체)"""
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+                return list(executor.map(_score_category_batch, batches, repeat(n_keywords), repeat(min_coverage)))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"병렬 TF-IDF 처리 실패, 직렬 처리로 전환합니다: {e}")
+            return [_score_category_batch(batch, n_keywords, min_coverage) for batch in batches]
+
+
+def _top_tfidf_keywords(tfidf, tfidf_matrix, n_keywords):
+    """TF-IDF 행렬의 평균 점수 기준 상위 키워드 추출 (2글자 이상의 의미있는 단어만)"""
+    feature_names = tfidf.get_feature_names_out()
+    tfidf_scores = tfidf_matrix.mean(axis=0).A1
+    
+    # 상위 n_keywords 추출
+    top_indices = tfidf_scores.argsort()[-n_keywords:][::-1]
+    top_keywords = [(feature_names[i], tfidf_scores[i]) for i in top_indices]
+    
+    # 필터링
+    return [(kw, score) for kw, score in top_keywords 
+            if len(kw) >= 2 and re.match(r'^[\w가-힣]+$', kw)]
+
+
+def _score_category_batch(batch, n_keywords, min_coverage=0):
+    """
+    카테고리 묶음 처리 (프로세스 풀 워커에서 실행되므로 모듈 최상위 함수)
+    
+    저장된 벡터라이저가 있으면 새 문서만 변환하고, 어휘로 표현되는 문서 비율이
+    min_coverage 미만이면 재학습합니다.
+    
+    Returns:
+    - [(카테고리, 키워드 리스트, 오류 메시지 또는 None, 벡터라이저, 재학습 여부), ...]
+    """
+    results = []
+    for category, texts, vectorizer in batch:
+        try:
+            matrix = None
+            if vectorizer is not None:
+                matrix = vectorizer.transform(texts)
+                if matrix.shape[0] == 0 or document_coverage(matrix) < min_coverage:
+                    matrix = None
+            refitted = matrix is None
+            if refitted:
+                vectorizer = TfidfVectorizer(**CATEGORY_TFIDF_PARAMS)
+                matrix = vectorizer.fit_transform(texts)
+            keywords = _top_tfidf_keywords(vectorizer, matrix, n_keywords)
+            results.append((category, keywords, None, vectorizer, refitted))
+        except Exception as e:
+            results.append((category, [], str(e), None, True))
+    return results
@@ -0,0 +1,19 @@
+# data/sketches/__init__.py
+"""
+비플로우 분석 시스템의 집계 백엔드(정확 집계 및 스트리밍 스케치) 서브모듈
+"""
+from data.sketches.frequency import (
+    ExactCounter,
+    SpaceSavingCounter,
+    CountMinSketch,
+    create_counter
+)
+from data.sketches.hyperloglog import HyperLogLog
+
+__all__ = [
+    'ExactCounter',
+    'SpaceSavingCounter',
+    'CountMinSketch',
+    'create_counter',
+    'HyperLogLog'
+]
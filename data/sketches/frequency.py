@@ -0,0 +1,309 @@
+# data/sketches/frequency.py
+"""
+빈도 집계 백엔드 (정확 집계 / Space-Saving / Count-Min 스케치)
+
+모든 백엔드는 동일한 인터페이스(update, merge, most_common)를 제공하며,
+청크 단위로 나누어 집계한 결과를 merge로 합칠 수 있습니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _aggregate(items, counts=None):
+    """
+    입력 항목을 (항목 -> 빈도) 시리즈로 집계 (등장 순서 유지, 결측치 제외)
+
+    Parameters:
+    - items: 항목 시퀀스 (리스트, 시리즈 등)
+    - counts: 항목별 가중치 (None이면 1씩 집계)
+
+    Returns:
+    - 항목을 인덱스로 하는 빈도 시리즈
+    """
+    if counts is None:
+        series = items if isinstance(items, pd.Series) else pd.Series(list(items), dtype=object)
+        return series.value_counts(sort=False, dropna=True).astype('int64')
+
+    weighted = pd.Series(np.asarray(counts, dtype='int64'), index=pd.Index(list(items), dtype=object))
+    weighted = weighted[weighted.index.notna()]
+    return weighted.groupby(level=0, sort=False).sum()
+
+
+class ExactCounter:
+    """해시 기반 정확 빈도 집계 (소규모 데이터용 기본 백엔드)"""
+
+    backend = 'exact'
+
+    def __init__(self, **kwargs):
+        self._counts = {}
+        self.total = 0
+
+    def update(self, items, counts=None):
+        """
+        항목 빈도 누적
+
+        Parameters:
+        - items: 항목 시퀀스
+        - counts: 항목별 가중치 (None이면 1씩 집계)
+        """
+        batch = _aggregate(items, counts)
+        for item, count in batch.items():
+            self._counts[item] = self._counts.get(item, 0) + int(count)
+        self.total += int(batch.sum())
+        return self
+
+    def merge(self, other):
+        """다른 ExactCounter의 집계 결과를 합침"""
+        _check_mergeable(self, other)
+        for item, count in other._counts.items():
+            self._counts[item] = self._counts.get(item, 0) + count
+        self.total += other.total
+        return self
+
+    def most_common(self, n=None):
+        """
+        빈도 상위 항목 반환
+
+        Parameters:
+        - n: 반환할 항목 수 (None이면 전체)
+
+        Returns:
+        - [(항목, 빈도), ...] 형태의 리스트
+        """
+        ranked = sorted(self._counts.items(), key=lambda x: x[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def estimate(self, item):
+        """항목의 빈도 반환"""
+        return self._counts.get(item, 0)
+
+    def error_bound(self):
+        """빈도 추정치의 최대 과대 추정 오차 (정확 집계이므로 0)"""
+        return 0
+
+    def __len__(self):
+        return len(self._counts)
+
+
+class SpaceSavingCounter:
+    """
+    Space-Saving 기반 상위 항목(heavy hitter) 집계
+
+    최대 capacity개의 후보만 유지하며, 각 후보의 빈도는 최대 total / capacity 만큼
+    과대 추정될 수 있습니다(항목별 오차는 errors로 추적).
+    """
+
+    backend = 'space_saving'
+
+    def __init__(self, capacity=1000, **kwargs):
+        if capacity < 1:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+        self.capacity = int(capacity)
+        self._counts = pd.Series(dtype='int64')
+        self._errors = pd.Series(dtype='int64')
+        self.total = 0
+
+    def _floor(self):
+        """요약이 가득 찬 경우 추적되지 않은 항목이 가질 수 있는 최대 빈도"""
+        if len(self._counts) < self.capacity:
+            return 0
+        return int(self._counts.min())
+
+    def _combine(self, counts, errors, other_floor):
+        """두 요약을 합친 후 상위 capacity개 후보만 유지 (mergeable summary 방식)"""
+        own_floor = self._floor()
+        union = self._counts.index.append(counts.index).unique()
+        merged_counts = (self._counts.reindex(union, fill_value=own_floor)
+                         + counts.reindex(union, fill_value=other_floor))
+        merged_errors = (self._errors.reindex(union, fill_value=own_floor)
+                         + errors.reindex(union, fill_value=other_floor))
+
+        kept = merged_counts.sort_values(ascending=False, kind='stable').head(self.capacity)
+        self._counts = kept.astype('int64')
+        self._errors = merged_errors.reindex(kept.index).astype('int64')
+
+    def update(self, items, counts=None):
+        """
+        항목 빈도 누적
+
+        Parameters:
+        - items: 항목 시퀀스
+        - counts: 항목별 가중치 (None이면 1씩 집계)
+        """
+        batch = _aggregate(items, counts)
+        if batch.empty:
+            return self
+        # 배치 자체는 정확 집계이므로 오차 0으로 합침
+        self._combine(batch, pd.Series(0, index=batch.index, dtype='int64'), 0)
+        self.total += int(batch.sum())
+        return self
+
+    def merge(self, other):
+        """다른 SpaceSavingCounter(청크/워커 결과)와 합침"""
+        _check_mergeable(self, other)
+        self._combine(other._counts, other._errors, other._floor())
+        self.total += other.total
+        return self
+
+    def most_common(self, n=None):
+        """
+        빈도 상위 항목 반환 (빈도는 상한 추정치)
+
+        Parameters:
+        - n: 반환할 항목 수 (None이면 전체 후보)
+
+        Returns:
+        - [(항목, 빈도), ...] 형태의 리스트
+        """
+        ranked = self._counts.sort_values(ascending=False, kind='stable')
+        if n is not None:
+            ranked = ranked.head(n)
+        return [(item, int(count)) for item, count in ranked.items()]
+
+    def estimate(self, item):
+        """항목의 빈도 추정치 반환 (추적되지 않은 항목은 최대 가능 빈도)"""
+        if item in self._counts.index:
+            return int(self._counts[item])
+        return self._floor()
+
+    def guaranteed(self, item):
+        """항목의 보장된 최소 빈도 반환"""
+        if item in self._counts.index:
+            return int(self._counts[item] - self._errors[item])
+        return 0
+
+    def error_bound(self):
+        """빈도 추정치의 최대 과대 추정 오차 (total / capacity)"""
+        return self.total / self.capacity
+
+    def __len__(self):
+        return len(self._counts)
+
+
+class CountMinSketch:
+    """
+    Count-Min 스케치 + 상위 후보 목록
+
+    모든 항목의 빈도를 고정 크기 테이블에 근사 집계하고, 상위 capacity개 후보를
+    별도로 유지합니다. 추정치는 확률 1 - e^-depth 로 total * e / width 이내로 과대 추정됩니다.
+    해시는 프로세스 간 동일하므로 워커별 스케치를 그대로 합칠 수 있습니다.
+    """
+
+    backend = 'count_min'
+
+    def __init__(self, width=2048, depth=5, capacity=1000, **kwargs):
+        if width < 1 or depth < 1:
+            raise ValueError(f"width와 depth는 1 이상이어야 합니다: width={width}, depth={depth}")
+        self.width = int(width)
+        self.depth = int(depth)
+        self.capacity = int(capacity)
+        self._table = np.zeros((self.depth, self.width), dtype='int64')
+        self._candidates = pd.Series(dtype='int64')
+        self.total = 0
+
+    def _indices(self, keys):
+        """행별 해시 버킷 인덱스 계산 (depth x len(keys))"""
+        values = np.asarray(pd.Index(keys, dtype=object).astype(str), dtype=object)
+        return np.vstack([
+            pd.util.hash_array(values, hash_key=f'bflowcms{row:08d}') % self.width
+            for row in range(self.depth)
+        ]).astype('int64')
+
+    def _estimate_many(self, keys):
+        """여러 항목의 빈도 추정치 (행별 최소값)"""
+        if len(keys) == 0:
+            return np.zeros(0, dtype='int64')
+        indices = self._indices(keys)
+        rows = np.arange(self.depth)[:, None]
+        return self._table[rows, indices].min(axis=0)
+
+    def _refresh_candidates(self, keys):
+        """기존 후보와 신규 항목의 추정치를 다시 계산하여 상위 capacity개 유지"""
+        union = self._candidates.index.append(pd.Index(keys, dtype=object)).unique()
+        estimates = pd.Series(self._estimate_many(union), index=union, dtype='int64')
+        self._candidates = estimates.sort_values(ascending=False, kind='stable').head(self.capacity)
+
+    def update(self, items, counts=None):
+        """
+        항목 빈도 누적
+
+        Parameters:
+        - items: 항목 시퀀스
+        - counts: 항목별 가중치 (None이면 1씩 집계)
+        """
+        batch = _aggregate(items, counts)
+        if batch.empty:
+            return self
+        indices = self._indices(batch.index)
+        values = batch.to_numpy(dtype='int64')
+        for row in range(self.depth):
+            np.add.at(self._table[row], indices[row], values)
+        self.total += int(values.sum())
+        self._refresh_candidates(batch.index)
+        return self
+
+    def merge(self, other):
+        """같은 크기의 다른 CountMinSketch(청크/워커 결과)와 합침"""
+        _check_mergeable(self, other)
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("크기(width, depth)가 다른 Count-Min 스케치는 합칠 수 없습니다.")
+        self._table += other._table
+        self.total += other.total
+        self._refresh_candidates(other._candidates.index)
+        return self
+
+    def most_common(self, n=None):
+        """
+        빈도 상위 후보 반환 (빈도는 상한 추정치)
+
+        Parameters:
+        - n: 반환할 항목 수 (None이면 전체 후보)
+
+        Returns:
+        - [(항목, 빈도), ...] 형태의 리스트
+        """
+        ranked = self._candidates if n is None else self._candidates.head(n)
+        return [(item, int(count)) for item, count in ranked.items()]
+
+    def estimate(self, item):
+        """항목의 빈도 추정치 반환"""
+        return int(self._estimate_many([item])[0])
+
+    def error_bound(self):
+        """확률 1 - e^-depth 로 보장되는 최대 과대 추정 오차 (total * e / width)"""
+        return self.total * np.e / self.width
+
+    def __len__(self):
+        return len(self._candidates)
+
+
+COUNTER_BACKENDS = {
+    'exact': ExactCounter,
+    'space_saving': SpaceSavingCounter,
+    'count_min': CountMinSketch
+}
+
+
+def _check_mergeable(counter, other):
+    """같은 백엔드끼리만 합칠 수 있는지 확인"""
+    if type(counter) is not type(other):
+        raise TypeError(f"서로 다른 집계 백엔드는 합칠 수 없습니다: {counter.backend} / {getattr(other, 'backend', type(other).__name__)}")
+
+
+def create_counter(backend='exact', capacity=1000, width=2048, depth=5):
+    """
+    설정에 맞는 빈도 집계 백엔드 생성
+
+    Parameters:
+    - backend: 백엔드 이름 (exact, space_saving, count_min)
+    - capacity: 스케치가 유지할 상위 후보 수
+    - width: Count-Min 스케치 너비
+    - depth: Count-Min 스케치 깊이
+
+    Returns:
+    - 빈도 집계 객체
+    """
+    counter_class = COUNTER_BACKENDS.get(backend)
+    if counter_class is None:
+        raise ValueError(f"지원하지 않는 집계 백엔드: {backend}")
+    return counter_class(capacity=capacity, width=width, depth=depth)
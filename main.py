@@ -1,23 +1,98 @@
 # main.py
 import os
+import sys
 import argparse
 import webbrowser
 import threading
 import time
 from pathlib import Path
 from data.analyzer.analyzer import BflowAnalyzer
+from data.data_processor.order_filter import OrderFilter
 from output.dashboard_generator import DashboardGenerator
+from output.formatters.asset_bundler import AssetBundler
+from output.pdf_export import PdfExportService
+from output.writers import available_writers
 from config import Config
 from visualization.insights_formatter import InsightsFormatter
+from data.analyzer.serialization import load_snapshot
+from visualization.chart_generator.cache import ChartCache
+from data.analyzer.run_index import (
+    RunIndex, RANKED_SECTIONS, DEFAULT_COMPARE_SECTIONS, build_run_manifest, compare_runs, format_comparison
+)
 
-def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
+# PDF/HTML 외 출력 형식의 결과 출력 이름
+OUTPUT_LABELS = [
+    ('json', '🧾 JSON 파일:'),
+    ('excel', '📊 Excel 파일:'),
+    ('csv', '🗂️ CSV 폴더: '),
+    ('parquet', '🧱 Parquet:  ')
+]
+
+def parse_formats(value):
+    """
+    --formats 값(쉼표 구분)을 출력 형식 목록으로 변환
+    
+    Parameters:
+    - value: 예) 'html,pdf,json'
+    
+    Returns:
+    - 출력 형식 이름 리스트
+    """
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in available_writers()]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"지원하지 않는 출력 형식: {', '.join(unknown) or value} (사용 가능: {', '.join(available_writers())})"
+        )
+    return names
+
+def batch_output_folders(files, output_folder):
+    """
+    여러 입력 파일의 파일별 결과물 폴더 (<출력 폴더>/<파일 이름>)
+    
+    파일 이름이 같은 입력(a/orders.xlsx, b/orders.xlsx)은 상위 폴더 이름을 붙여(a_orders, b_orders) 구분하고,
+    그래도 겹치면 번호(_2, _3 ...)를 붙여 결과물이 서로 덮어쓰지 않게 합니다.
+    
+    Parameters:
+    - files: 입력 파일 경로 목록
+    - output_folder: 결과물 저장 폴더
+    
+    Returns:
+    - 입력 파일 순서대로의 폴더 경로 문자열 리스트
+    """
+    paths = [Path(file) for file in files]
+    stem_counts = {}
+    for path in paths:
+        stem_counts[path.stem] = stem_counts.get(path.stem, 0) + 1
+
+    folders = []
+    used = set()
+    for path in paths:
+        name = path.stem
+        if stem_counts[name] > 1:
+            parent = path.resolve().parent.name
+            name = f"{parent}_{name}" if parent else name
+        candidate = name
+        suffix = 1
+        while candidate in used:
+            suffix += 1
+            candidate = f"{name}_{suffix}"
+        used.add(candidate)
+        folders.append(str(Path(output_folder) / candidate))
+    return folders
+
+def create_analysis_workflow(file, output_folder='bflow_reports', config=None, keep_data=False, chart_cache=None,
+                             order_filter=None):
     """
     파일에서 분석, 대시보드 생성까지의 전체 워크플로우를 생성
     
     Parameters:
-    - file: 엑셀 파일 경로
+    - file: 주문 데이터 파일 경로 (엑셀, .csv, .parquet 또는 Parquet 데이터셋 폴더)
     - output_folder: 결과물 저장 폴더
     - config: 설정 객체 (None이면 기본 설정 사용)
+    - keep_data: True이면 분석 후에도 원본 데이터프레임을 분석기에 유지
+    - chart_cache: 여러 워크플로우가 공유할 ChartCache (None이면 설정에 따라 출력 폴더에 생성)
+    - order_filter: 파일을 읽을 때 적용할 OrderFilter (기간/채널/카테고리, None이면 전체)
     
     Returns:
     - 분석 워크플로우 구성요소 딕셔너리
@@ -26,12 +101,15 @@ def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
         config = Config()
         config.output_folder = output_folder
 
-    analyzer = BflowAnalyzer(config)
+    analyzer = BflowAnalyzer(config, order_filter)
     analyzer.load_data(file)
     insights = analyzer.analyze_data()
+    if not keep_data:
+        # 이후 단계는 집계 결과만 사용하므로 원본 데이터프레임 해제
+        analyzer.release_data()
 
     formatter = InsightsFormatter(insights)
-    dashboard_gen = DashboardGenerator(insights, formatter, output_folder, config)
+    dashboard_gen = DashboardGenerator(insights, formatter, output_folder, config, chart_cache)
 
     return {
         'analyzer': analyzer,
@@ -42,7 +120,165 @@ def create_analysis_workflow(file, output_folder='bflow_reports', config=None):
         'dashboard_generator': dashboard_gen
     }
 
-def main():
+def create_render_workflow(snapshot_path, output_folder=None, config=None, chart_cache=None):
+    """
+    저장된 분석 결과 스냅샷에서 대시보드 생성 워크플로우를 생성 (엑셀 로드/분석 생략)
+    
+    Parameters:
+    - snapshot_path: 분석 결과 스냅샷 파일 경로 (.insights.npz)
+    - output_folder: 결과물 저장 폴더 (None이면 스냅샷이 있는 폴더)
+    - config: 설정 객체 (None이면 기본 설정 사용)
+    - chart_cache: ChartCache (None이면 설정에 따라 출력 폴더에 생성)
+    
+    Returns:
+    - 렌더링 워크플로우 구성요소 딕셔너리 (스냅샷을 읽을 수 없으면 None)
+    """
+    insights = load_snapshot(snapshot_path)
+    if insights is None:
+        return None
+
+    if output_folder is None:
+        output_folder = str(Path(snapshot_path).parent)
+    if config is None:
+        config = Config()
+        config.output_folder = output_folder
+
+    formatter = InsightsFormatter(insights)
+    dashboard_gen = DashboardGenerator(insights, formatter, output_folder, config, chart_cache)
+
+    return {
+        'insights': insights,
+        'formatter': formatter,
+        'config': config,
+        'dashboard_generator': dashboard_gen
+    }
+
+def render(argv):
+    """
+    render 하위 명령: 분석 결과 스냅샷에서 HTML/PDF만 다시 생성
+    
+    Parameters:
+    - argv: render 뒤의 명령줄 인수 리스트
+    
+    Returns:
+    - 종료 코드
+    """
+    parser = argparse.ArgumentParser(
+        prog='main.py render',
+        description='저장된 분석 결과 스냅샷으로 대시보드 다시 생성 (재분석 없음)',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument('--from-snapshot', required=True, help='분석 결과 스냅샷 파일 경로 (.insights.npz)')
+    parser.add_argument('--output', '-o', help='결과물 저장 폴더 (기본: 스냅샷이 있는 폴더)', default=None)
+    parser.add_argument('--no-browser', action='store_true', help='브라우저 자동 실행 안함')
+    parser.add_argument('--no-pdf', action='store_true', help='PDF 생성 안함')
+    parser.add_argument('--pdf-only', action='store_true', help='PDF만 생성 (브라우저 실행 안함)')
+    parser.add_argument('--pdf-width', type=int, help='PDF 너비 (픽셀) - 모니터 해상도에 맞춤', default=1920,
+                       choices=[1366, 1440, 1920, 2560, 3840])
+    parser.add_argument('--static-charts', action='store_true',
+                       help='차트를 SVG로 미리 렌더링 (JavaScript 없이 WeasyPrint로 PDF 변환)')
+    parser.add_argument('--pdf-engine', choices=DashboardGenerator.PDF_ENGINES, default=None,
+                       help='PDF 변환 엔진 (native: 브라우저 없이 차트/인사이트로 직접 구성, 기본: 설정값 BFLOW_PDF_ENGINE)')
+    parser.add_argument('--formats', type=parse_formats, default=None,
+                       help=f"출력 형식 (쉼표 구분, 같은 분석 결과로 병렬 생성: {','.join(available_writers())}, 기본: html,pdf)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    workflow = create_render_workflow(args.from_snapshot, args.output)
+    if workflow is None:
+        print("스냅샷을 불러오지 못했습니다.")
+        return 1
+    print(f"스냅샷 로드 완료 ({(time.perf_counter() - start) * 1000:.0f}ms): {args.from_snapshot}")
+
+    result = workflow['dashboard_generator'].generate_dashboard(
+        open_browser=not args.no_browser and not args.pdf_only,
+        save_pdf=not args.no_pdf,
+        pdf_width=args.pdf_width,
+        save_insights=False,
+        static_charts=True if args.static_charts else None,
+        pdf_engine=args.pdf_engine,
+        formats=args.formats
+    )
+    if not result:
+        print("대시보드 생성에 실패했습니다.")
+        return 1
+
+    if 'html' in result:
+        print(f"📄 HTML 파일: {result['html']}")
+    if 'pdf' in result:
+        print(f"📋 PDF 파일:  {result['pdf']}")
+    for name, label in OUTPUT_LABELS:
+        if name in result:
+            print(f"{label} {result[name]}")
+    chart_cache = workflow['dashboard_generator'].chart_cache
+    if chart_cache is not None and chart_cache.hits + chart_cache.misses:
+        chart_cache.report()
+    return 0
+
+def compare(argv):
+    """
+    compare 하위 명령: 저장된 실행 기록/스냅샷으로 두 실행의 순위 변화 비교 (원본 데이터를 다시 읽지 않음)
+    
+    Parameters:
+    - argv: compare 뒤의 명령줄 인수 리스트
+    
+    Returns:
+    - 종료 코드
+    """
+    parser = argparse.ArgumentParser(
+        prog='main.py compare',
+        description='저장된 실행 기록으로 두 실행의 채널/색상/베스트셀러 순위 변화 비교 (재분석 없음)',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument('base', nargs='?', default='previous',
+                       help='기준 실행 (run_id, run_id 앞부분, latest, previous 또는 매니페스트 경로)')
+    parser.add_argument('target', nargs='?', default='latest', help='비교 실행 (base와 같은 형식)')
+    parser.add_argument('--output', '-o', help='실행 기록이 있는 결과물 폴더', default='bflow_reports')
+    parser.add_argument('--sections', default=','.join(DEFAULT_COMPARE_SECTIONS),
+                       help=f"비교할 섹션 (쉼표 구분: {','.join(RANKED_SECTIONS)})")
+    parser.add_argument('--top', type=int, default=10, help='섹션별로 비교할 상위 항목 수')
+    parser.add_argument('--list', action='store_true', help='기록된 실행 목록 출력')
+    args = parser.parse_args(argv)
+
+    config = Config()
+    config.output_folder = args.output
+    run_index = RunIndex(config.get_run_index_settings()['folder'])
+
+    if args.list:
+        entries = run_index.entries()
+        if not entries:
+            print(f"기록된 실행이 없습니다: {run_index.folder}")
+            return 1
+        for entry in entries:
+            print(f"{entry['run_id']}  {entry['created_at']}  {entry.get('rows') or 0:>10,}행  {entry.get('source')}")
+        return 0
+
+    try:
+        base = run_index.load(args.base)
+        target = run_index.load(args.target)
+        comparison = compare_runs(
+            base, target, [section.strip() for section in args.sections.split(',') if section.strip()], args.top
+        )
+    except (ValueError, OSError) as e:
+        print(f"실행 비교 실패: {e}")
+        return 1
+
+    if base.get('config_hash') != target.get('config_hash'):
+        print("⚠️ 두 실행의 설정(키워드/속성/카테고리)이 다릅니다. 순위 변화에 설정 변경 영향이 포함될 수 있습니다.")
+    print(format_comparison(comparison))
+    return 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # 스냅샷 재렌더링 하위 명령
+    if argv and argv[0] == 'render':
+        return render(argv[1:])
+    
+    # 실행 비교 하위 명령
+    if argv and argv[0] == 'compare':
+        return compare(argv[1:])
+
     # 명령줄 인수 파싱
     parser = argparse.ArgumentParser(
         description='비플로우 주문 데이터 분석 및 대시보드 생성',
@@ -50,9 +286,18 @@ def main():
     )
 
     # 파일 관련 인수
-    parser.add_argument('file', help='엑셀 파일 경로')
+    parser.add_argument('file', nargs='+',
+                       help='주문 데이터 파일 경로 (엑셀/CSV/Parquet 또는 Parquet 폴더, 여러 개면 파일별 하위 폴더에 저장)')
     parser.add_argument('--output', '-o', help='결과물 저장 폴더', default='bflow_reports')
 
+    # 분석 범위 인수 (파일을 읽는 단계에서 적용)
+    parser.add_argument('--from', dest='date_from', default=None,
+                       help='결제일 시작 (YYYY-MM-DD 또는 30d = 오늘로부터 30일 전)')
+    parser.add_argument('--to', dest='date_to', default=None, help='결제일 종료 (YYYY-MM-DD, 해당 날짜 포함)')
+    parser.add_argument('--channel', default=None, help='판매채널 (쉼표 구분, 예: 쿠팡,무신사)')
+    parser.add_argument('--category', default=None,
+                       help='카테고리 코드(앞부분 일치) 또는 category.csv 이름 (쉼표 구분, 예: 0001,원피스)')
+
     # 출력 관련 인수
     parser.add_argument('--no-browser', action='store_true', help='브라우저 자동 실행 안함')
     parser.add_argument('--no-pdf', action='store_true', help='PDF 생성 안함')
@@ -62,17 +307,35 @@ def main():
     parser.add_argument('--port', type=int, help='대시보드 포트 번호', default=8050)
     parser.add_argument('--pdf-width', type=int, help='PDF 너비 (픽셀) - 모니터 해상도에 맞춤', default=1920, 
                        choices=[1366, 1440, 1920, 2560, 3840])
+    parser.add_argument('--static-charts', action='store_true',
+                       help='차트를 SVG로 미리 렌더링 (JavaScript 없이 WeasyPrint로 PDF 변환)')
+    parser.add_argument('--pdf-engine', choices=DashboardGenerator.PDF_ENGINES, default=None,
+                       help='PDF 변환 엔진 (native: 브라우저 없이 차트/인사이트로 직접 구성, 기본: 설정값 BFLOW_PDF_ENGINE)')
+    parser.add_argument('--formats', type=parse_formats, default=None,
+                       help=f"출력 형식 (쉼표 구분, 같은 분석 결과로 병렬 생성: {','.join(available_writers())}, 기본: html,pdf)")
+    parser.add_argument('--excel-orders', action='store_true',
+                       help='excel 형식에 필터링된 원본 주문 시트 추가 (행 묶음 단위로 스트리밍 기록)')
     
     # Playwright 설치 옵션
     parser.add_argument('--install-browsers', action='store_true', help='Playwright 브라우저 설치')
+    parser.add_argument('--vendor-assets', action='store_true',
+                       help='대시보드 아이콘 폰트 등 vendor 파일 내려받기 (이후 생성되는 HTML/PDF는 외부 요청 없음)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    try:
+        order_filter = OrderFilter.from_args(
+            args.date_from, args.date_to, args.channel, args.category,
+            config=Config() if args.category else None
+        )
+    except ValueError as e:
+        parser.error(str(e))
 
     try:
         # Playwright 브라우저 설치 옵션
         if args.install_browsers:
             print("Playwright 브라우저 설치 중...")
-            workflow = create_analysis_workflow(args.file, args.output)
+            workflow = create_analysis_workflow(args.file[0], args.output)
             dashboard_gen = workflow['dashboard_generator']
             if dashboard_gen.install_playwright_browsers():
                 print("Playwright 브라우저 설치가 완료되었습니다.")
@@ -81,28 +344,100 @@ def main():
                 print("Playwright 브라우저 설치에 실패했습니다.")
                 return 1
 
-        # 워크플로우 실행
-        workflow = create_analysis_workflow(
-            args.file,
-            args.output
-        )
+        # vendor 에셋 내려받기 옵션
+        if args.vendor_assets:
+            if AssetBundler(Config().vendor_folder).download_missing():
+                print("vendor 파일이 준비되었습니다.")
+                return 0
+            print("일부 vendor 파일을 내려받지 못했습니다.")
+            return 1
 
         # 대시보드 생성 옵션 설정
         open_browser = not args.no_browser and not args.pdf_only
-        save_pdf = not args.no_pdf
+        save_pdf = not args.no_pdf and (args.formats is None or 'pdf' in args.formats)
+        excel_orders = args.excel_orders and args.formats is not None and 'excel' in args.formats
+        if args.excel_orders and not excel_orders:
+            print("--excel-orders는 --formats에 excel을 지정한 경우에만 사용됩니다.")
+        # 정제된 주문 데이터프레임이 필요한 출력 (원본 주문 시트, Parquet 내보내기)
+        keep_orders = excel_orders or (args.formats is not None and 'parquet' in args.formats)
 
-        print("대시보드 생성 중...")
-        dashboard_gen = workflow['dashboard_generator']
+        # PDF 변환은 백그라운드에서 진행 (다음 파일 분석과 겹쳐 실행)
+        pdf_service = PdfExportService() if save_pdf else None
 
-        # 대시보드 생성
-        result = dashboard_gen.generate_dashboard(
-            port=args.port,
-            open_browser=open_browser,
-            save_pdf=save_pdf,
-            pdf_width=args.pdf_width
-        )
+        # 차트 캐시와 실행 기록은 출력 폴더 기준 하나를 모든 파일이 공유 (같은 차트는 파일/재실행 간 재사용)
+        shared_config = Config()
+        shared_config.output_folder = args.output
+        chart_cache = ChartCache.from_config(shared_config)
+        run_index = RunIndex.from_config(shared_config)
+        results = []
+        generators = []
+        # 여러 파일이면 파일별 하위 폴더에 저장 (같은 파일 이름은 상위 폴더 이름/번호로 구분)
+        output_folders = [args.output] if len(args.file) == 1 else batch_output_folders(args.file, args.output)
+        try:
+            for file, output_folder in zip(args.file, output_folders):
+
+                # 워크플로우 실행
+                workflow = create_analysis_workflow(
+                    file, output_folder, keep_data=keep_orders, chart_cache=chart_cache, order_filter=order_filter
+                )
+                if not workflow['analyzer'].row_counts.get('filtered'):
+                    scope = f" (분석 범위: {order_filter})" if order_filter.active else ""
+                    print(f"분석할 주문이 없어 대시보드를 만들지 않습니다: {file}{scope}")
+                    continue
+
+                print("대시보드 생성 중...")
+                dashboard_gen = workflow['dashboard_generator']
+
+                # 대시보드 생성 (HTML 저장 후 바로 반환, PDF는 pdf_future로 진행)
+                outputs_start = time.perf_counter()
+                result = dashboard_gen.generate_dashboard(
+                    port=args.port,
+                    open_browser=open_browser,
+                    save_pdf=save_pdf,
+                    pdf_width=args.pdf_width,
+                    pdf_service=pdf_service,
+                    static_charts=True if args.static_charts else None,
+                    pdf_engine=args.pdf_engine,
+                    formats=args.formats,
+                    orders=workflow['analyzer'].df if keep_orders else None,
+                    excel_orders=excel_orders
+                )
+                if keep_orders:
+                    workflow['analyzer'].release_data()
+                if not result:
+                    print(f"대시보드 생성에 실패했습니다: {file}")
+                    return 1
+                results.append(result)
+                generators.append(dashboard_gen)
+                
+                # 실행 기록 (입력 지문, 설정 해시, 행 수, 단계별 시간, 주요 집계)
+                if run_index is not None:
+                    analyzer = workflow['analyzer']
+                    manifest = build_run_manifest(
+                        workflow['insights'], workflow['config'], source=file, row_counts=analyzer.row_counts,
+                        timings=dict(analyzer.timings, outputs=time.perf_counter() - outputs_start), outputs=result,
+                        filters=order_filter.describe()
+                    )
+                    if run_index.record(manifest):
+                        result['run_id'] = manifest['run_id']
+
+            # 종료 전 남은 PDF 변환 대기
+            if pdf_service is not None and pdf_service.pending:
+                print(f"\nPDF 변환 {pdf_service.pending}건 완료 대기 중...")
+            for result in results:
+                if 'pdf_future' in result:
+                    pdf_path = result.pop('pdf_future').result()
+                    if pdf_path:
+                        result['pdf'] = str(pdf_path)
+        finally:
+            if pdf_service is not None:
+                pdf_service.shutdown()
+
+        if not results:
+            print("생성된 대시보드가 없습니다.")
+            return 1
 
-        if result:
+        for result, dashboard_gen in zip(results, generators):
             print("\n" + "="*50)
             print("대시보드 생성 완료!")
             print("="*50)
@@ -112,25 +447,42 @@ def main():
             
             if 'pdf' in result:
                 print(f"📋 PDF 파일:  {result['pdf']}")
-                print(f"   ✅ 화면 너비 {args.pdf_width}px, 페이지 분할 없는 연속 PDF")
-                print("   ✅ 브라우저에서 보는 레이아웃 그대로 유지")
+                if dashboard_gen.pdf_composed:
+                    print("   ✅ 차트와 인사이트로 직접 구성한 A4 페이지 PDF")
+                else:
+                    print(f"   ✅ 화면 너비 {args.pdf_width}px, 페이지 분할 없는 연속 PDF")
+                    print("   ✅ 브라우저에서 보는 레이아웃 그대로 유지")
+            elif save_pdf:
+                print("📋 PDF 파일:  생성 실패")
             
-            print("="*50)
+            for name, label in OUTPUT_LABELS:
+                if name in result:
+                    print(f"{label} {result[name]}")
             
-            # PDF만 생성하는 경우
-            if args.pdf_only:
-                print("PDF 생성이 완료되었습니다.")
-                return 0
+            if 'snapshot' in result:
+                print(f"💾 분석 스냅샷: {result['snapshot']}")
+                print("   (python main.py render --from-snapshot <파일>로 재분석 없이 다시 생성)")
             
-            # 브라우저가 열린 경우
-            if open_browser:
-                print("\n브라우저에서 대시보드를 확인하세요.")
+            if 'run_id' in result:
+                print(f"🗂️ 실행 기록: {result['run_id']}")
+                print("   (python main.py compare [기준] [비교]로 이전 실행과 순위 변화 비교)")
             
-            print("모든 파일이 저장되었습니다.")
-        else:
-            print("대시보드 생성에 실패했습니다.")
-            return 1
-
+            print("="*50)
+        
+        # 차트 캐시 적중률
+        if chart_cache is not None and chart_cache.hits + chart_cache.misses:
+            chart_cache.report()
+        
+        # PDF만 생성하는 경우
+        if args.pdf_only:
+            print("PDF 생성이 완료되었습니다.")
+            return 0
+        
+        # 브라우저가 열린 경우
+        if open_browser:
+            print("\n브라우저에서 대시보드를 확인하세요.")
+        
+        print("모든 파일이 저장되었습니다.")
         print("처리 완료")
         return 0
 
@@ -4,5 +4,11 @@
 """
 from output.base_generator import BaseGenerator
 from output.dashboard_generator import DashboardGenerator
+from output.pdf_export import PdfExportService
+from output.order_export import OrderExporter
+from output.writers import OutputWriter, WriterContext, register_writer, available_writers, run_writers
 
-__all__ = ['BaseGenerator', 'DashboardGenerator']
\ No newline at end of file
+__all__ = [
+    'BaseGenerator', 'DashboardGenerator', 'PdfExportService', 'OrderExporter',
+    'OutputWriter', 'WriterContext', 'register_writer', 'available_writers', 'run_writers'
+]
\ No newline at end of file
@@ -21,10 +21,24 @@ class BaseGenerator:
         self.output_folder = Path(output_folder)
         self.output_folder.mkdir(exist_ok=True)
         
-        # 현재 시간 (파일명용)
+        # 현재 시간 (파일명용, 같은 폴더의 이전 실행 결과물과 겹치지 않게)
         self.now = datetime.now()
-        self.timestamp = self.now.strftime("%Y%m%d_%H%M")
+        self.timestamp = self._unique_timestamp(self.now.strftime("%Y%m%d_%H%M%S"))
         
         # InsightsFormatter 인스턴스 설정
         self.formatter = formatter if formatter is not None else InsightsFormatter(insights)
-        self.summary = self.formatter.summary
\ No newline at end of file
+        self.summary = self.formatter.summary
+    
+    def _unique_timestamp(self, timestamp):
+        """
+        출력 폴더에 같은 시각으로 만든 결과물(<이름>_<시각>.*)이 있으면 _2, _3 ... 을 붙인 시각 문자열 반환
+        
+        같은 초에 같은 폴더로 실행해도 이전 실행의 대시보드/스냅샷을 덮어쓰지 않습니다.
+        """
+        used = {path.name.split('.')[0] for path in self.output_folder.iterdir()}
+        candidate = timestamp
+        suffix = 1
+        while any(name.endswith(f"_{candidate}") for name in used):
+            suffix += 1
+            candidate = f"{timestamp}_{suffix}"
+        return candidate
\ No newline at end of file
@@ -3,20 +3,40 @@
 비플로우 분석 결과를 바탕으로 HTML 대시보드 및 PDF 생성하는 메인 클래스
 """
 import webbrowser
-import asyncio
 import os
+from concurrent.futures import Future
 from pathlib import Path
 from output.base_generator import BaseGenerator
 from config import Config
 from utils import convert_to_serializable
 from output.data_processor.data_processor import DataProcessor
 from output.formatters.template_handler import TemplateHandler
+from output.formatters.asset_bundler import AssetBundler
+from output.pdf_composer import PdfComposer
+from visualization.chart_generator.svg_charts import SvgHorizontalBarChart
+from visualization.chart_generator.cache import ChartCache
+from output.writers import WriterContext, run_writers
 
 
 class DashboardGenerator(BaseGenerator):
     """비플로우 분석 결과를 바탕으로 HTML 대시보드 및 PDF 생성"""
     
-    def __init__(self, insights, formatter=None, output_folder='bflow_reports', config=None):
+    # PDF 변환 엔진 (auto: 차트 모드에 맞는 순서로 시도, native: 브라우저/HTML 없이 직접 구성)
+    PDF_ENGINES = ('auto', 'playwright', 'weasyprint', 'native')
+    
+    # 정적 차트 모드에서 미리 렌더링할 차트 (템플릿 차트 이름 -> 템플릿 변수)
+    STATIC_CHARTS = {
+        'product': 'product_data',
+        'color': 'color_data',
+        'price': 'price_data',
+        'size': 'size_data',
+        'material': 'material_data',
+        'design': 'design_data',
+        'channel': 'channel_data',
+        'bestseller': 'bestseller_data'
+    }
+    
+    def __init__(self, insights, formatter=None, output_folder='bflow_reports', config=None, chart_cache=None):
         """
         대시보드 생성기 초기화
         
@@ -25,6 +45,7 @@ class DashboardGenerator(BaseGenerator):
         - formatter: InsightsFormatter 인스턴스 (None이면 자동 생성)
         - output_folder: 결과물 저장 폴더
         - config: 설정 객체 (None이면 기본 설정 사용)
+        - chart_cache: ChartCache (None이면 설정에 따라 출력 폴더의 chart_cache 사용)
         """
         super().__init__(insights, formatter, output_folder)
         
@@ -40,21 +61,136 @@ class DashboardGenerator(BaseGenerator):
         # 데이터 처리기
         self.data_processor = DataProcessor(insights, self.formatter)
 
-        # 템플릿 핸들러
-        self.template_handler = TemplateHandler(self.template_folder)
+        # 템플릿 핸들러 (vendor 에셋 번들은 출력 폴더의 assets/에 캐시)
+        bundler = None
+        if getattr(self.config, 'bundle_assets', False):
+            bundler = AssetBundler(
+                self.config.vendor_folder,
+                cache_folder=self.output_folder / 'assets',
+                cdn=getattr(self.config, 'cdn_assets', False)
+            )
+        self.template_handler = TemplateHandler(self.template_folder, bundler=bundler)
+        
+        # 정적(SVG) 차트 모드 여부와 차트 렌더링 캐시
+        self.static_charts = getattr(self.config, 'static_charts', False)
+        if chart_cache is None and hasattr(self.config, 'get_chart_cache_settings'):
+            chart_cache = ChartCache.from_config(self.config)
+        self.chart_cache = chart_cache
+        
+        # PDF 변환 엔진과 native 엔진이 사용할 마지막 템플릿 변수
+        self.pdf_engine = getattr(self.config, 'pdf_engine', 'auto')
+        self._template_vars = None
+        
+        # 마지막 PDF를 native 엔진(A4 여러 페이지)으로 구성했는지 여부 (auto에서 대체된 경우 포함)
+        self.pdf_composed = False
+    
+    def prepare_template_variables(self, static_charts=None):
+        """
+        모든 출력 형식이 공유하는 템플릿 변수 준비 (실행 가이드 키워드, 직렬화, 정적 차트 포함)
+        
+        Parameters:
+        - static_charts: 차트를 SVG로 미리 렌더링할지 여부 (None이면 현재 설정 사용)
+        
+        Returns:
+        - 템플릿 변수 딕셔너리
+        """
+        # 템플릿 변수 준비
+        template_vars = self.data_processor.prepare_template_variables()
+        
+        # Guide 객체 가져오기
+        if self.formatter:
+            guide = self.formatter.get_execution_guide()
+        else:
+            guide = None
+        
+        # 속성 키워드 데이터 처리
+        if guide:
+            # 색상 키워드 - 더 많은 색상 제공
+            if 'color_keywords' in guide and guide['color_keywords']:
+                template_vars['color_keywords'] = guide['color_keywords']
+            
+            # 소재 키워드 - 더 많은 소재 제공
+            if 'material_keywords' in guide and guide['material_keywords']:
+                template_vars['material_keywords'] = guide['material_keywords']
+            
+            # 디자인 키워드 - 더 많은 디자인 제공
+            if 'design_keywords' in guide and guide['design_keywords']:
+                template_vars['design_keywords'] = guide['design_keywords']
+            
+            # 스타일 키워드 (핏 & 실루엣) - 추가
+            if 'fit_style_keywords' in guide and guide['fit_style_keywords']:
+                template_vars['style_keywords'] = guide['fit_style_keywords']
+            elif 'auto_style_keywords' in guide and guide['auto_style_keywords']:
+                # 자동 추출 스타일 키워드에서 가져오기
+                auto_style = []
+                for item in guide['auto_style_keywords']:
+                    if isinstance(item, str):
+                        auto_style.append(item)
+                    elif isinstance(item, dict) and 'name' in item:
+                        auto_style.append(item['name'])
+                template_vars['style_keywords'] = auto_style
+        
+        # 직렬화 가능한 형식으로 변환 (차트 데이터만)
+        for key in template_vars:
+            if key in ['product_data', 'color_data', 'price_data', 'channel_data', 
+                    'size_data', 'material_data', 'design_data', 'bestseller_data']:
+                template_vars[key] = convert_to_serializable(template_vars[key])
+        
+        # 정적 차트 모드: 차트 데이터를 SVG로 렌더링해 템플릿에 삽입 (JavaScript 불필요)
+        if static_charts is not None:
+            self.static_charts = static_charts
+        if self.static_charts:
+            template_vars['static_charts'] = self.render_static_charts(template_vars)
+        
+        # native PDF 엔진은 HTML 대신 템플릿 변수로 PDF를 구성
+        self._template_vars = template_vars
+        return template_vars
+    
+    def resolve_formats(self, formats=None, save_pdf=True, save_insights=True):
+        """
+        실행할 출력 형식 목록 결정
+        
+        Parameters:
+        - formats: 출력 형식 이름 목록 (None이면 html + 옵션에 따라 snapshot, pdf)
+        - save_pdf: False이면 pdf 제외
+        - save_insights: True이면 html과 함께 snapshot 저장 (formats에 snapshot을 직접 넣어도 됨)
+        
+        Returns:
+        - 출력 형식 이름 리스트
+        """
+        names = ['html'] if formats is None else list(dict.fromkeys(formats))
+        if save_insights and 'html' in names and 'snapshot' not in names:
+            names.insert(names.index('html') + 1, 'snapshot')
+        if formats is None and save_pdf:
+            names.append('pdf')
+        if not save_pdf and 'pdf' in names:
+            names.remove('pdf')
+        return names
     
-    def generate_dashboard(self, port=None, open_browser=True, save_pdf=True, pdf_width=1920):
+    def generate_dashboard(self, port=None, open_browser=True, save_pdf=True, pdf_width=1920, save_insights=True,
+                           pdf_service=None, static_charts=None, pdf_engine=None, formats=None, orders=None,
+                           excel_orders=False):
         """
-        HTML 대시보드 생성 및 실행
+        HTML 대시보드 등 출력 형식별 결과물 생성 및 실행
+        
+        템플릿 변수는 한 번만 준비하고, 선택한 작성기(output.writers)가 같은 변수로 병렬 실행됩니다.
         
         Parameters:
         - port: 대시보드 실행 포트 (None이면 설정에서 가져옴)
         - open_browser: 브라우저 자동 실행 여부
         - save_pdf: PDF 파일 생성 여부
         - pdf_width: PDF 너비 (픽셀, 기본값: 1920 - Full HD 모니터 기준)
+        - save_insights: 분석 결과 스냅샷을 대시보드 옆에 저장할지 여부 (재분석 없이 다시 렌더링할 때 사용)
+        - pdf_service: PdfExportService (주어지면 PDF 변환을 백그라운드에 등록하고 HTML 저장 직후 반환)
+        - static_charts: 차트를 SVG로 미리 렌더링할지 여부 (None이면 설정값 사용, True이면 PDF는 WeasyPrint 우선)
+        - pdf_engine: PDF 변환 엔진 (PDF_ENGINES 중 하나, None이면 설정값 사용)
+        - formats: 출력 형식 목록 (available_writers() 중, None이면 html과 save_pdf/save_insights에 따른 pdf/snapshot)
+        - orders: 필터링된 주문 데이터프레임 (parquet 형식, excel_orders이면 excel 형식의 원본 주문 시트에 사용)
+        - excel_orders: True이면 excel 형식에 orders를 원본 주문 시트로 추가
         
         Returns:
-        - 생성된 대시보드 파일 경로들의 딕셔너리 {'html': path, 'pdf': path}
+        - 생성된 파일 경로들의 딕셔너리 {'html': path, 'pdf': path, 'snapshot': path, 'json': path, ...}
+          (pdf_service 사용 시 'pdf' 대신 변환 결과를 담는 'pdf_future')
         """
         print("HTML 대시보드 생성 중...")
         
@@ -62,78 +198,41 @@ class DashboardGenerator(BaseGenerator):
             # 포트 설정 (필요한 경우)
             if port is None:
                 port = self.config.dashboard_port
-                
-            # 템플릿 변수 준비
-            template_vars = self.data_processor.prepare_template_variables()
-            
-            # Guide 객체 가져오기
-            if self.formatter:
-                guide = self.formatter.get_execution_guide()
-            else:
-                guide = None
             
-            # 속성 키워드 데이터 처리
-            if guide:
-                # 색상 키워드 - 더 많은 색상 제공
-                if 'color_keywords' in guide and guide['color_keywords']:
-                    template_vars['color_keywords'] = guide['color_keywords']
-                
-                # 소재 키워드 - 더 많은 소재 제공
-                if 'material_keywords' in guide and guide['material_keywords']:
-                    template_vars['material_keywords'] = guide['material_keywords']
-                
-                # 디자인 키워드 - 더 많은 디자인 제공
-                if 'design_keywords' in guide and guide['design_keywords']:
-                    template_vars['design_keywords'] = guide['design_keywords']
-                
-                # 스타일 키워드 (핏 & 실루엣) - 추가
-                if 'fit_style_keywords' in guide and guide['fit_style_keywords']:
-                    template_vars['style_keywords'] = guide['fit_style_keywords']
-                elif 'auto_style_keywords' in guide and guide['auto_style_keywords']:
-                    # 자동 추출 스타일 키워드에서 가져오기
-                    auto_style = []
-                    for item in guide['auto_style_keywords']:
-                        if isinstance(item, str):
-                            auto_style.append(item)
-                        elif isinstance(item, dict) and 'name' in item:
-                            auto_style.append(item['name'])
-                    template_vars['style_keywords'] = auto_style
+            if pdf_engine is not None:
+                self.pdf_engine = pdf_engine
             
-            # 직렬화 가능한 형식으로 변환 (차트 데이터만)
-            for key in template_vars:
-                if key in ['product_data', 'color_data', 'price_data', 'channel_data', 
-                        'size_data', 'material_data', 'design_data', 'bestseller_data']:
-                    template_vars[key] = convert_to_serializable(template_vars[key])
+            # 모든 작성기가 공유하는 템플릿 변수 (한 번만 준비)
+            template_vars = self.prepare_template_variables(static_charts)
             
-            # 템플릿 렌더링
-            output = self.template_handler.render_template('dashboard_template.html', **template_vars)
+            context = WriterContext(
+                template_vars=template_vars,
+                insights=self.insights,
+                output_folder=self.output_folder,
+                timestamp=self.timestamp,
+                generator=self,
+                options={
+                    'pdf_width': pdf_width, 'pdf_service': pdf_service,
+                    'orders': orders, 'excel_orders': excel_orders
+                }
+            )
+            outputs = run_writers(self.resolve_formats(formats, save_pdf, save_insights), context)
             
-            # HTML 파일 저장
-            dashboard_file = self.output_folder / f"dashboard_{self.timestamp}.html"
-            html_path = self.template_handler.save_html(output, dashboard_file)
+            if 'html' in outputs and outputs['html'] is None:
+                return None
             
             result = {}
+            for name, output in outputs.items():
+                if isinstance(output, Future):
+                    result[f"{name}_future"] = output
+                elif output:
+                    result[name] = str(output)
             
-            if html_path:
-                print(f"HTML 대시보드가 생성되었습니다: {html_path}")
-                result['html'] = str(html_path)
-                
-                # PDF 생성
-                if save_pdf:
-                    pdf_path = self.generate_pdf_from_html(html_path, pdf_width)
-                    if pdf_path:
-                        result['pdf'] = str(pdf_path)
-                        print(f"PDF 대시보드가 생성되었습니다: {pdf_path}")
-                        print(f"✅ 화면 너비 {pdf_width}px 그대로 PDF 저장됨")
-                
-                # 브라우저에서 열기
-                if open_browser:
-                    webbrowser.open(f"file://{html_path.resolve()}")
-                
-                return result
-            else:
-                print("대시보드 파일 저장 실패")
-                return None
+            # 브라우저에서 열기
+            if open_browser and outputs.get('html'):
+                webbrowser.open(f"file://{Path(outputs['html']).resolve()}")
+            
+            return result
                 
         except Exception as e:
             print(f"HTML 대시보드 생성 중 오류 발생: {e}")
@@ -141,6 +240,39 @@ class DashboardGenerator(BaseGenerator):
             traceback.print_exc()
             return None
 
+    def render_static_charts(self, template_vars, max_items=10):
+        """
+        대시보드 차트를 정적 SVG 마크업으로 렌더링
+        
+        Parameters:
+        - template_vars: 차트 데이터가 들어 있는 템플릿 변수
+        - max_items: 차트별 최대 항목 수 (createBarChart와 같은 TOP10)
+        
+        Returns:
+        - {차트 이름: SVG 문자열}
+        """
+        renderer = SvgHorizontalBarChart()
+        charts = {}
+        for name, key in self.STATIC_CHARTS.items():
+            data = template_vars.get(key) or []
+            if self.chart_cache is None:
+                charts[name] = renderer.render(data, max_items=max_items)
+                continue
+            # 같은 데이터/색상/크기의 차트는 캐시된 SVG 재사용
+            charts[name] = self.chart_cache.get_or_render(
+                'svg_horizontal_bar', data,
+                lambda data=data: renderer.render(data, max_items=max_items),
+                colors=renderer.colors, size=(renderer.width, max_items)
+            )
+        return charts
+
+    def _report_pdf(self, pdf_path, pdf_width):
+        """PDF 변환 결과 출력"""
+        if pdf_path:
+            print(f"PDF 대시보드가 생성되었습니다: {pdf_path}")
+            if not self.pdf_composed:
+                print(f"✅ 화면 너비 {pdf_width}px 그대로 PDF 저장됨")
+
     def generate_pdf_from_html(self, html_path, pdf_width=1920):
         """
         HTML 파일을 PDF로 변환
@@ -156,6 +288,26 @@ class DashboardGenerator(BaseGenerator):
             # PDF 파일 경로 생성
             pdf_path = html_path.with_suffix('.pdf')
             
+            # 엔진을 지정한 경우 해당 엔진만 사용
+            if self.pdf_engine == 'native':
+                return self._generate_pdf_with_composer(pdf_path)
+            if self.pdf_engine == 'playwright':
+                return self._generate_pdf_with_playwright(html_path, pdf_path, pdf_width)
+            if self.pdf_engine == 'weasyprint':
+                return self._generate_pdf_with_weasyprint(html_path, pdf_path)
+            
+            # 정적 차트 HTML은 JavaScript가 필요 없으므로 브라우저 없이 WeasyPrint로 먼저 변환
+            if self.static_charts:
+                pdf_result = self._generate_pdf_with_weasyprint(html_path, pdf_path)
+                if pdf_result:
+                    return pdf_result
+                print("WeasyPrint PDF 생성 실패, Playwright로 시도...")
+                pdf_result = self._generate_pdf_with_playwright(html_path, pdf_path, pdf_width)
+                if pdf_result:
+                    return pdf_result
+                print("Playwright PDF 생성 실패, 직접 구성(native)으로 시도...")
+                return self._generate_pdf_with_composer(pdf_path)
+            
             # Playwright를 사용한 PDF 생성 시도
             pdf_result = self._generate_pdf_with_playwright(html_path, pdf_path, pdf_width)
             
@@ -164,12 +316,33 @@ class DashboardGenerator(BaseGenerator):
             
             # Playwright 실패 시 WeasyPrint로 대체
             print("Playwright PDF 생성 실패, WeasyPrint로 시도...")
-            return self._generate_pdf_with_weasyprint(html_path, pdf_path)
+            pdf_result = self._generate_pdf_with_weasyprint(html_path, pdf_path)
+            if pdf_result:
+                return pdf_result
+            
+            # 둘 다 없으면 외부 라이브러리 없이 직접 구성
+            print("WeasyPrint PDF 생성 실패, 직접 구성(native)으로 시도...")
+            return self._generate_pdf_with_composer(pdf_path)
             
         except Exception as e:
             print(f"PDF 생성 중 오류 발생: {e}")
             return None
 
+    def _generate_pdf_with_composer(self, pdf_path):
+        """
+        차트 데이터와 인사이트 텍스트로 PDF를 직접 구성 (브라우저/HTML 레이아웃 없음)
+        """
+        if self._template_vars is None:
+            print("PDF 구성에 필요한 템플릿 변수가 없습니다. generate_dashboard()를 먼저 실행하세요.")
+            return None
+        try:
+            pdf_path = PdfComposer(self._template_vars).compose(pdf_path)
+            self.pdf_composed = pdf_path is not None
+            return pdf_path
+        except Exception as e:
+            print(f"PDF 직접 구성 오류: {e}")
+            return None
+
     def _generate_pdf_with_playwright(self, html_path, pdf_path, pdf_width=1920):
         """
         Playwright를 사용하여 화면에 보이는 그대로의 너비로 PDF 생성
@@ -57,7 +57,7 @@ class DataProcessor:
         # (1) 기본 메타 정보
         template_vars['timestamp'] = self.now.strftime('%Y-%m-%d %H:%M')
         template_vars['period'] = f"{self.insights.get('start_date', '알 수 없음')} ~ {self.insights.get('end_date', '알 수 없음')}"
-        template_vars['total_orders'] = len(self.insights.get('df', [])) if 'df' in self.insights else 0
+        template_vars['total_orders'] = self.insights.get('row_count', 0)
         template_vars['current_year'] = self.now.year
 
         # 통일된 타이틀/부제
@@ -100,7 +100,10 @@ class DataProcessor:
         auto_vars = self.auto_keyword_processor.prepare_auto_keywords_variables(self.insights)
         template_vars.update(auto_vars)  # has_auto_keywords, style_keywords, product_keywords, color_groups, auto_insights
 
-        # (7) 요약 인사이트 (리포트) - InsightsFormatter에 위임
+        # (7) 데이터 프로파일 (컬럼별 고유값 수/결측률/상위값 비중)
+        template_vars['data_profile'] = self.insights.get('data_profile', {}).get('columns', [])
+
+        # (8) 요약 인사이트 (리포트) - InsightsFormatter에 위임
         if self.formatter:
             template_vars['summary_insights'] = self.formatter.generate_summary_insights()
         else:
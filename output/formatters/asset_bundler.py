@@ -0,0 +1,313 @@
+# output/formatters/asset_bundler.py
+"""
+대시보드 HTML의 외부 CSS/폰트를 vendor 폴더의 파일로 대체해 HTML 안에 인라인하는 모듈
+
+templates/vendor/assets.json 매니페스트가 CDN 주소를 vendor 파일에 연결합니다.
+- file: vendor 폴더 기준 파일 경로 (CSS가 참조하는 로컬 폰트 파일이 있어야 사용)
+- fallback: file이 없을 때 대신 사용할 파일 (아이콘은 이모지, 폰트는 시스템 글꼴)
+- icons: true이면 HTML에서 실제로 사용한 아이콘(.bi-*) 규칙만 남기고 폰트를 data URI로 인라인
+- download: file이 없을 때 download_missing()(main.py --vendor-assets)으로 받을 {vendor 경로: 주소}
+
+생성된 HTML은 CDN에 요청하지 않습니다. cdn=True(BFLOW_CDN_ASSETS=1)이면 vendor 파일이 없는
+링크만 원래 CDN 링크로 유지합니다.
+"""
+import base64
+import hashlib
+import json
+import re
+import urllib.request
+from pathlib import Path
+
+# <link ...> 태그와 속성
+_LINK_PATTERN = re.compile(r'[ \t]*<link\b[^>]*>[ \t]*\n?', re.IGNORECASE)
+_ATTR_PATTERN = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+
+# CSS 규칙, 아이콘 선택자, 폰트 url()
+_RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+_ICON_SELECTOR_PATTERN = re.compile(r'^\.bi-([\w-]+)::?before$')
+_ICON_CLASS_PATTERN = re.compile(r'\bbi-([a-z0-9][a-z0-9-]*)')
+_CODEPOINT_PATTERN = re.compile(r'content:\s*"\\([0-9a-fA-F]+)"')
+_URL_PATTERN = re.compile(r'url\(\s*["\']?([^"\')]+?)["\']?\s*\)')
+
+_FONT_MIME_TYPES = {'.woff2': 'font/woff2', '.woff': 'font/woff', '.ttf': 'font/ttf'}
+
+
+def minify_css(css):
+    """
+    CSS 최소화 (주석 제거, 공백 축소, /*! 라이선스 주석은 유지)
+
+    Parameters:
+    - css: CSS 문자열
+
+    Returns:
+    - 최소화된 CSS 문자열
+    """
+    css = re.sub(r'/\*(?!!).*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def _subset_font(data, codepoints):
+    """fontTools가 설치되어 있으면 사용한 글리프만 남긴 woff2 폰트 반환 (없으면 원본)"""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+        import io
+    except ImportError:
+        return data
+
+    try:
+        font = TTFont(io.BytesIO(data))
+        options = subset.Options()
+        options.flavor = 'woff2'
+        subsetter = subset.Subsetter(options=options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        output = io.BytesIO()
+        font.flavor = 'woff2'
+        font.save(output)
+        return output.getvalue()
+    except Exception as e:
+        print(f"아이콘 폰트 서브셋 생성 실패, 전체 폰트를 사용합니다: {e}")
+        return data
+
+
+class AssetBundler:
+    """
+    HTML의 외부 스타일시트를 vendor 파일 기반의 인라인 <style> 번들로 교체하는 클래스
+
+    번들은 원본 파일 내용과 사용 아이콘 목록의 sha256 해시로 식별하며, 메모리와
+    cache_folder(<해시>.css)에 캐시되어 같은 입력이면 다시 만들지 않습니다.
+    결과 HTML에는 외부 요청이 없으므로 PDF 변환 시 네트워크 대기 없이 항상 같은 결과를 냅니다.
+    """
+
+    MANIFEST_NAME = 'assets.json'
+
+    def __init__(self, vendor_folder, cache_folder=None, cdn=False):
+        """
+        번들러 초기화
+
+        Parameters:
+        - vendor_folder: 매니페스트와 vendor CSS/폰트 파일이 있는 폴더
+        - cache_folder: 번들 CSS를 저장할 폴더 (None이면 메모리에만 캐시)
+        - cdn: True이면 vendor 파일이 없는 링크를 fallback 대신 CDN 링크로 유지
+        """
+        self.vendor_folder = Path(vendor_folder)
+        self.cache_folder = Path(cache_folder) if cache_folder else None
+        self.cdn = cdn
+        self.manifest = self._load_manifest()
+        self._cache = {}
+        self._notified = set()
+
+    def _load_manifest(self):
+        """vendor 매니페스트 로드 (없거나 읽을 수 없으면 빈 딕셔너리)"""
+        manifest_path = self.vendor_folder / self.MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"에셋 매니페스트를 읽을 수 없습니다 ({manifest_path}): {e}")
+            return {}
+
+    def _resolve(self, href):
+        """
+        CDN 주소에 해당하는 vendor 파일과 아이콘 여부
+
+        Returns:
+        - (파일 경로 또는 None, 아이콘 스타일시트 여부)
+        """
+        entry = self.manifest.get(href)
+        if not entry:
+            return None, False
+        name = entry.get('file')
+        if name and self._is_complete(self.vendor_folder / name):
+            return self.vendor_folder / name, bool(entry.get('icons'))
+        if self.cdn:
+            return None, False
+
+        fallback = entry.get('fallback')
+        if fallback and (self.vendor_folder / fallback).is_file():
+            if entry.get('download') and href not in self._notified:
+                self._notified.add(href)
+                print(f"vendor 파일이 없어 대체 파일({fallback})을 사용합니다. "
+                      f"python main.py --vendor-assets로 내려받을 수 있습니다.")
+            return self.vendor_folder / fallback, bool(entry.get('icons'))
+        return None, False
+
+    @staticmethod
+    def _is_complete(path):
+        """vendor CSS 파일이 있고, 로컬 폰트를 참조하면 그중 하나 이상이 있는지 여부"""
+        if not path.is_file():
+            return False
+        font_paths = []
+        for url in _URL_PATTERN.findall(path.read_text(encoding='utf-8')):
+            if url.startswith(('data:', 'http://', 'https://', '//')):
+                continue
+            font_path = path.parent / url.split('?')[0].split('#')[0]
+            if font_path.suffix.lower() in _FONT_MIME_TYPES:
+                font_paths.append(font_path)
+        return not font_paths or any(font_path.is_file() for font_path in font_paths)
+
+    def download_missing(self, timeout=30):
+        """
+        매니페스트의 download 항목 중 vendor 폴더에 없는 파일 내려받기 (최초 설정용)
+
+        Parameters:
+        - timeout: 파일당 요청 제한 시간(초)
+
+        Returns:
+        - 모든 파일이 준비되었는지 여부
+        """
+        success = True
+        for entry in self.manifest.values():
+            for name, url in (entry.get('download') or {}).items():
+                path = self.vendor_folder / name
+                if path.is_file():
+                    continue
+                try:
+                    print(f"내려받는 중: {url}")
+                    with urllib.request.urlopen(url, timeout=timeout) as response:
+                        data = response.read()
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(data)
+                except Exception as e:
+                    print(f"vendor 파일을 내려받을 수 없습니다 ({url}): {e}")
+                    success = False
+        return success
+
+    def bundle(self, html):
+        """
+        HTML의 외부 스타일시트 링크를 인라인 번들로 교체
+
+        Parameters:
+        - html: 렌더링된 HTML 문자열
+
+        Returns:
+        - vendor 파일로 대체된 링크를 인라인 번들로 바꾼 HTML 문자열
+          (cdn=True이면 vendor 파일이 없는 링크와 그 preconnect 링크는 그대로 유지)
+        """
+        sources = []
+        removed = []
+        hints = []
+        kept_stylesheets = False
+
+        for match in _LINK_PATTERN.finditer(html):
+            attrs = {name.lower(): value for name, value in _ATTR_PATTERN.findall(match.group(0))}
+            href = attrs.get('href', '')
+            rel = attrs.get('rel', '').lower()
+            if not href.startswith(('http://', 'https://', '//')):
+                continue
+            if rel == 'stylesheet':
+                path, icons = self._resolve(href)
+                if path is not None:
+                    sources.append((path, icons))
+                elif self.cdn:
+                    kept_stylesheets = True
+                    continue
+                elif href not in self.manifest:
+                    print(f"vendor 파일이 없는 외부 스타일시트를 제외합니다: {href}")
+                removed.append(match.span())
+            elif rel in ('preconnect', 'dns-prefetch', 'preload'):
+                hints.append(match.span())
+
+        # CDN 링크가 하나라도 남으면 연결 힌트도 유지
+        if not kept_stylesheets:
+            removed = sorted(removed + hints)
+        if not removed:
+            return html
+        first_link = removed[0][0]
+
+        used_icons = frozenset(_ICON_CLASS_PATTERN.findall(html))
+        bundle_hash, css = self._get_bundle(sources, used_icons)
+        style = f'    <style data-bundle="{bundle_hash}">{css}</style>\n' if css else ''
+
+        parts = []
+        position = 0
+        for start, end in removed:
+            parts.append(html[position:start])
+            if start == first_link:
+                parts.append(style)
+            position = end
+        parts.append(html[position:])
+        return ''.join(parts)
+
+    def _get_bundle(self, sources, used_icons):
+        """입력 해시로 캐시된 번들 조회, 없으면 생성 후 캐시 ((해시, CSS) 반환)"""
+        digest = hashlib.sha256()
+        for path, icons in sources:
+            digest.update(path.name.encode('utf-8'))
+            digest.update(path.read_bytes())
+            if icons:
+                digest.update(','.join(sorted(used_icons)).encode('utf-8'))
+        bundle_hash = digest.hexdigest()[:16]
+
+        if bundle_hash in self._cache:
+            return bundle_hash, self._cache[bundle_hash]
+
+        cache_path = self.cache_folder / f"{bundle_hash}.css" if self.cache_folder else None
+        if cache_path is not None and cache_path.exists():
+            css = cache_path.read_text(encoding='utf-8')
+        else:
+            css = ''.join(self._build_source(path, icons, used_icons) for path, icons in sources)
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(css, encoding='utf-8')
+                except Exception as e:
+                    print(f"에셋 번들 캐시 저장 중 오류 발생: {e}")
+
+        self._cache[bundle_hash] = css
+        return bundle_hash, css
+
+    def _build_source(self, path, icons, used_icons):
+        """vendor CSS 파일 하나를 (아이콘 서브셋, 폰트 인라인 후) 최소화"""
+        css = minify_css(path.read_text(encoding='utf-8'))
+        if icons:
+            css = self._subset_icons(css, used_icons)
+        return self._inline_fonts(css, path.parent, icons)
+
+    @staticmethod
+    def _subset_icons(css, used_icons):
+        """사용한 아이콘의 ::before 규칙만 남김 (아이콘이 아닌 규칙은 그대로)"""
+        def keep(match):
+            selectors = [selector.strip() for selector in match.group(1).split(',')]
+            icon_names = [_ICON_SELECTOR_PATTERN.match(selector) for selector in selectors]
+            if not all(icon_names):
+                return match.group(0)
+            kept = [selector for selector, name in zip(selectors, icon_names) if name.group(1) in used_icons]
+            return f"{','.join(kept)}{{{match.group(2)}}}" if kept else ''
+
+        return _RULE_PATTERN.sub(keep, css)
+
+    @staticmethod
+    def _inline_fonts(css, base_folder, subset):
+        """@font-face의 로컬 폰트 url()을 data URI로 교체 (woff2가 있으면 woff 등 나머지 형식은 제외)"""
+        codepoints = [int(value, 16) for value in _CODEPOINT_PATTERN.findall(css)] if subset else None
+
+        def inline(match):
+            url = match.group(1)
+            if url.startswith(('data:', 'http://', 'https://', '//')):
+                return match.group(0)
+            font_path = base_folder / url.split('?')[0].split('#')[0]
+            mime_type = _FONT_MIME_TYPES.get(font_path.suffix.lower())
+            if mime_type is None or not font_path.is_file():
+                return match.group(0)
+            data = font_path.read_bytes()
+            if codepoints and font_path.suffix.lower() == '.woff2':
+                data = _subset_font(data, codepoints)
+            return f'url(data:{mime_type};base64,{base64.b64encode(data).decode("ascii")})'
+
+        def inline_font_face(match):
+            body = match.group(1)
+            sources = re.split(r',(?=url\()', re.search(r'src:([^;}]*)', body).group(1)) if 'src:' in body else []
+            woff2 = [source for source in sources if 'woff2' in source]
+            if woff2:
+                body = body.replace(','.join(sources), woff2[0])
+            return '@font-face{' + _URL_PATTERN.sub(inline, body) + '}'
+
+        return re.sub(r'@font-face\{([^{}]*)\}', inline_font_face, css)
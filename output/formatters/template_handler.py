@@ -10,15 +10,17 @@ class TemplateHandler:
     """
     HTML 템플릿 처리 클래스
     """
-    def __init__(self, template_folder):
+    def __init__(self, template_folder, bundler=None):
         """
         템플릿 처리기 초기화
         
         Parameters:
         - template_folder: 템플릿 파일이 있는 폴더 경로
+        - bundler: AssetBundler (주어지면 렌더링 결과의 외부 CSS/폰트를 인라인 번들로 교체)
         """
         self.template_folder = Path(template_folder)
         self.env = Environment(loader=FileSystemLoader(self.template_folder))
+        self.bundler = bundler
     
     def render_template(self, template_name, **context):
         """
@@ -43,7 +45,12 @@ class TemplateHandler:
                     print(f"[디버깅-Template] 키워드 {i+1}에 카테고리 속성 없음")
         
         template = self.env.get_template(template_name)
-        return template.render(**context)
+        html = template.render(**context)
+        
+        # 외부 스타일시트를 vendor 번들로 인라인 (오프라인/PDF 변환 시 네트워크 요청 없음)
+        if self.bundler is not None:
+            html = self.bundler.bundle(html)
+        return html
     
     def save_html(self, html_content, output_path):
         """
@@ -0,0 +1,213 @@
+# output/order_export.py
+"""
+정제된 주문 데이터를 월별로 분할한 Parquet 파일로 내보내는 모듈 (BI 연동용)
+"""
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.data_processor.order_filter import normalize_category_code
+from data.data_processor.price_distribution import PriceDistribution
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class OrderExporter:
+    """
+    필터링/중복 제거가 끝난 주문 데이터프레임을 파생 컬럼과 함께 Parquet으로 저장하는 클래스
+
+    결제월별 폴더(<폴더>/month=YYYY-MM/part-0.parquet, Hive 분할 형식)에 저장하며,
+    월마다 row_group_rows행씩 파생 컬럼을 계산해 행 그룹 단위로 바로 기록하므로
+    전체 파생 데이터프레임을 한 번에 만들지 않습니다. 폴더에는 파티션/컬럼 정보를 담은 _manifest.json을 함께 저장합니다
+    (밑줄로 시작하므로 pyarrow/Spark 데이터셋 읽기에서는 제외됨).
+
+    파생 컬럼:
+    - 카테고리_코드: 정규화된 카테고리 코드
+    - 카테고리_대분류_코드/카테고리_대분류, 카테고리_중분류_코드/카테고리_중분류: depth 1/2 코드와 이름
+    - 가격대: 대시보드와 같은 가격대 구간 이름
+    - 옵션_색상/옵션_사이즈: 옵션정보에서 파싱한 색상/사이즈 (로드 단계에서 만든 컬럼을 문자열로 저장)
+    """
+
+    MANIFEST_NAME = '_manifest.json'
+    MONTH_COLUMN = 'month'
+
+    # 파생 컬럼 이름
+    CATEGORY_CODE = '카테고리_코드'
+    DEPTH1_CODE = '카테고리_대분류_코드'
+    DEPTH1_NAME = '카테고리_대분류'
+    DEPTH2_CODE = '카테고리_중분류_코드'
+    DEPTH2_NAME = '카테고리_중분류'
+    PRICE_BIN = '가격대'
+
+    def __init__(self, config, compression='zstd', row_group_rows=100000):
+        """
+        Parameters:
+        - config: 설정 객체 (카테고리 이름, 가격대 구간 설정)
+        - compression: Parquet 압축 방식 (zstd, snappy, gzip, none 등)
+        - row_group_rows: 행 그룹 하나의 행 수
+        """
+        self.config = config
+        self.compression = None if str(compression).lower() == 'none' else compression
+        self.row_group_rows = max(int(row_group_rows), 1)
+        self._category_names = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """설정의 압축 방식/행 그룹 크기로 생성"""
+        settings = config.get_parquet_export_settings()
+        return cls(config, settings['compression'], settings['row_group_rows'])
+
+    def _category_name(self, code):
+        """카테고리 이름 조회 (코드당 한 번)"""
+        if code not in self._category_names:
+            self._category_names[code] = self.config.snapshot().get_category_name(code)
+        return self._category_names[code]
+
+    def derive_columns(self, chunk, distribution):
+        """
+        주문 데이터 조각에 파생 컬럼 추가
+
+        Parameters:
+        - chunk: 주문 데이터프레임 조각
+        - distribution: 가격대 구간에 사용할 PriceDistribution
+
+        Returns:
+        - 파생 컬럼이 추가된 새 데이터프레임
+        """
+        derived = {}
+        if '상품 카테고리' in chunk.columns:
+            positions, uniques = pd.factorize(chunk['상품 카테고리'], use_na_sentinel=True)
+            codes = [normalize_category_code(code) for code in uniques]
+            columns = {
+                self.CATEGORY_CODE: codes,
+                self.DEPTH1_CODE: [code[:4] if code and len(code) >= 4 else None for code in codes],
+                self.DEPTH2_CODE: [code[:8] if code and len(code) >= 8 else None for code in codes],
+            }
+            columns[self.DEPTH1_NAME] = [self._category_name(code) if code else None for code in columns[self.DEPTH1_CODE]]
+            columns[self.DEPTH2_NAME] = [self._category_name(code) if code else None for code in columns[self.DEPTH2_CODE]]
+            for name in (self.CATEGORY_CODE, self.DEPTH1_CODE, self.DEPTH1_NAME, self.DEPTH2_CODE, self.DEPTH2_NAME):
+                # 결측(-1)은 마지막(None) 항목을 가리킴
+                values = np.array(columns[name] + [None], dtype=object)
+                derived[name] = values[positions]
+
+        if '상품가격' in chunk.columns:
+            bins = distribution.bin_index(chunk['상품가격'].to_numpy(dtype='float64', na_value=np.nan))
+            labels = np.array(distribution.labels + [None], dtype=object)
+            derived[self.PRICE_BIN] = labels[bins]
+
+        return chunk.assign(**derived)
+
+    @staticmethod
+    def _arrow_type(series):
+        """데이터프레임 컬럼의 Parquet 저장 형식 (숫자/날짜/불리언 외에는 문자열)"""
+        if pd.api.types.is_bool_dtype(series):
+            return pa.bool_()
+        if pd.api.types.is_integer_dtype(series):
+            return pa.int64()
+        if pd.api.types.is_float_dtype(series):
+            return pa.float64()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return pa.timestamp('ms')
+        return pa.string()
+
+    def _to_table(self, chunk, schema):
+        """스키마에 맞춰 Arrow 테이블로 변환 (문자열 컬럼은 값이 숫자여도 문자열로 저장)"""
+        arrays = []
+        for field in schema:
+            values = chunk[field.name]
+            if pa.types.is_string(field.type):
+                values = values.astype('string')
+            array = pa.array(values, from_pandas=True)
+            if array.type != field.type:
+                array = array.cast(field.type, safe=False)
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def export(self, df, output_folder, source=None):
+        """
+        주문 데이터를 월별 Parquet 파일로 저장
+
+        Parameters:
+        - df: 정제된 주문 데이터프레임 (결제일 컬럼 필요)
+        - output_folder: 저장 폴더 (month=YYYY-MM 하위 폴더와 _manifest.json 생성)
+        - source: manifest에 기록할 원본 파일 경로
+
+        Returns:
+        - _manifest.json 경로 (pyarrow가 없거나 저장할 수 없으면 None)
+        """
+        if pa is None:
+            print("pyarrow가 설치되지 않아 Parquet 내보내기를 건너뜁니다. (pip install pyarrow)")
+            return None
+        if df is None or df.empty or '결제일' not in df.columns:
+            print("Parquet으로 내보낼 주문 데이터가 없습니다.")
+            return None
+
+        start = time.perf_counter()
+        output_folder = Path(output_folder)
+        output_folder.mkdir(parents=True, exist_ok=True)
+
+        prices = df['상품가격'].to_numpy(dtype='float64', na_value=np.nan) if '상품가격' in df.columns else None
+        distribution = PriceDistribution.from_settings(self.config.get_price_bin_settings(), prices)
+
+        # 스키마는 원본 컬럼 형식과 파생 컬럼으로 한 번만 결정 (모든 파티션이 같은 스키마)
+        sample = self.derive_columns(df.iloc[:1], distribution)
+        schema = pa.schema([(str(column), self._arrow_type(sample[column])) for column in sample.columns])
+
+        month_codes, months = pd.factorize(df['결제일'].dt.strftime('%Y-%m'), sort=True)
+        partitions = []
+        for index, month in enumerate(months):
+            positions = np.flatnonzero(month_codes == index)
+            partition_folder = output_folder / f"{self.MONTH_COLUMN}={month}"
+            partition_folder.mkdir(exist_ok=True)
+            path = partition_folder / 'part-0.parquet'
+
+            row_groups = 0
+            with pq.ParquetWriter(path, schema, compression=self.compression) as writer:
+                for offset in range(0, len(positions), self.row_group_rows):
+                    chunk = self.derive_columns(df.iloc[positions[offset:offset + self.row_group_rows]], distribution)
+                    writer.write_table(self._to_table(chunk, schema), row_group_size=self.row_group_rows)
+                    row_groups += 1
+
+            dates = df['결제일'].iloc[positions]
+            partitions.append({
+                'month': month,
+                'path': str(path.relative_to(output_folder)),
+                'rows': int(len(positions)),
+                'row_groups': row_groups,
+                'bytes': path.stat().st_size,
+                'min_date': dates.min().isoformat(),
+                'max_date': dates.max().isoformat()
+            })
+
+        manifest = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'source': str(source) if source is not None else None,
+            'rows': sum(partition['rows'] for partition in partitions),
+            'format': 'parquet',
+            'partitioning': {'column': self.MONTH_COLUMN, 'style': 'hive'},
+            'compression': self.compression or 'none',
+            'row_group_rows': self.row_group_rows,
+            'config_hash': self.config.snapshot().content_hash,
+            'price_bins': distribution.labels,
+            'columns': [{'name': field.name, 'type': str(field.type)} for field in schema],
+            'partitions': partitions
+        }
+        manifest_path = output_folder / self.MANIFEST_NAME
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        total_bytes = sum(partition['bytes'] for partition in partitions)
+        print(
+            f"Parquet 내보내기 완료: {manifest['rows']:,}행, {len(partitions)}개월, "
+            f"{total_bytes / 1024:,.1f}KB ({time.perf_counter() - start:.2f}초) - {output_folder}"
+        )
+        return manifest_path
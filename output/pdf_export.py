@@ -0,0 +1,86 @@
+# output/pdf_export.py
+"""
+HTML 대시보드의 PDF 변환을 백그라운드에서 수행하는 모듈
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+
+class PdfExportService:
+    """
+    PDF 변환 작업을 백그라운드 작업 스레드에서 실행하는 서비스
+
+    submit()은 변환 작업을 등록하고 바로 Future를 반환하므로, HTML 저장 직후 다음 보고서의
+    분석을 시작할 수 있습니다. 프로그램 종료 전에는 wait_all()로 남은 변환을 모두 기다립니다.
+    Playwright/WeasyPrint 변환은 브라우저 프로세스를 사용하므로 기본 작업자 수는 1입니다.
+    """
+
+    def __init__(self, max_workers=1):
+        """
+        Parameters:
+        - max_workers: 동시에 실행할 PDF 변환 작업 수
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pdf-export')
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def submit(self, export, html_path, pdf_width=1920, callback=None):
+        """
+        PDF 변환 작업 등록
+
+        Parameters:
+        - export: 변환 함수 (html_path, pdf_width를 받아 PDF 경로 또는 None 반환)
+        - html_path: HTML 파일 경로
+        - pdf_width: PDF 너비 (픽셀)
+        - callback: 완료 시 PDF 경로(실패하면 None)를 받아 호출할 함수
+
+        Returns:
+        - 변환 결과(PDF 경로 또는 None)를 담는 Future
+        """
+        future = self._executor.submit(export, html_path, pdf_width)
+        if callback is not None:
+            future.add_done_callback(lambda done: callback(self._result(done)))
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    @staticmethod
+    def _result(future):
+        """Future 결과 (변환 중 예외가 발생했으면 출력 후 None)"""
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"PDF 변환 작업 중 오류 발생: {e}")
+            return None
+
+    @property
+    def pending(self):
+        """아직 끝나지 않은 변환 작업 수"""
+        with self._lock:
+            return sum(1 for future in self._futures if not future.done())
+
+    def wait_all(self, timeout=None):
+        """
+        등록된 모든 변환 작업이 끝날 때까지 대기
+
+        Parameters:
+        - timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+        - 등록 순서대로의 변환 결과 리스트 (PDF 경로 또는 None, 시간 초과된 작업은 None)
+        """
+        with self._lock:
+            futures = list(self._futures)
+        done, _ = wait_futures(futures, timeout=timeout)
+        return [self._result(future) if future in done else None for future in futures]
+
+    def shutdown(self, wait=True):
+        """작업 스레드 종료 (wait=True이면 남은 변환을 모두 마친 뒤 종료)"""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+        return False
@@ -0,0 +1,251 @@
+# output/pdf_writer.py
+"""
+외부 라이브러리 없이 PDF 파일을 직접 작성하는 간단한 PDF 작성기
+
+텍스트, 사각형, 선만 지원하며 보고서 구성(PdfComposer)에 필요한 기능만 구현합니다.
+- 영문/숫자: PDF 표준 글꼴 Helvetica (글꼴 포함 불필요)
+- 한글 등: Adobe-Korean1 표준 CID 글꼴 HYGoThic-Medium (UniKS-UCS2-H 인코딩, 뷰어의 한글 글꼴로 표시)
+"""
+import zlib
+
+# Helvetica 글리프 너비 (1/1000 em, 0x20~0x7E)
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584
+]
+
+# CID 글꼴의 기본 글리프 너비 (한글/전각 문자)
+_CID_WIDTH = 1000
+
+
+def _hex_color(color):
+    """'#rrggbb' -> (r, g, b) 0~1 실수"""
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def _escape(text):
+    """PDF 리터럴 문자열 이스케이프"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _is_latin(char):
+    return 0x20 <= ord(char) <= 0x7E
+
+
+def _is_printable(char):
+    """표준 글꼴로 표시할 수 있는 문자인지 (영문/숫자 또는 KS X 1001 문자)"""
+    if _is_latin(char) or char in '\t\r\n':
+        return True
+    try:
+        char.encode('euc_kr')
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+class PdfWriter:
+    """
+    페이지 단위로 텍스트/도형을 그려 PDF로 저장하는 작성기
+
+    좌표는 PDF와 달리 페이지 왼쪽 위가 원점이고 아래로 갈수록 y가 커집니다(pt 단위).
+    """
+
+    def __init__(self, width=595.28, height=841.89):
+        """
+        Parameters:
+        - width: 페이지 너비 (pt, 기본 A4)
+        - height: 페이지 높이 (pt, 기본 A4)
+        """
+        self.width = width
+        self.height = height
+        self._pages = []
+        self._ops = None
+
+    def add_page(self):
+        """새 페이지 시작"""
+        self._ops = []
+        self._pages.append(self._ops)
+
+    @property
+    def page_count(self):
+        return len(self._pages)
+
+    # 측정
+    @staticmethod
+    def text_width(text, size, bold=False):
+        """텍스트 너비 (pt)"""
+        widths = _HELVETICA_BOLD_WIDTHS if bold else _HELVETICA_WIDTHS
+        units = sum(widths[ord(char) - 0x20] if _is_latin(char) else _CID_WIDTH for char in text)
+        return units * size / 1000
+
+    def fit_text(self, text, max_width, size, bold=False):
+        """최대 너비를 넘으면 뒤를 잘라 '...' 표시"""
+        if self.text_width(text, size, bold) <= max_width:
+            return text
+        limit = max_width - self.text_width('...', size, bold)
+        width = 0
+        for position, char in enumerate(text):
+            width += self.text_width(char, size, bold)
+            if width > limit:
+                return text[:position].rstrip() + '...'
+        return text
+
+    def wrap_text(self, text, max_width, size, bold=False):
+        """최대 너비에 맞춰 줄바꿈 (공백 기준, 긴 단어는 글자 단위)"""
+        lines = []
+        line = ''
+        for word in text.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if self.text_width(candidate, size, bold) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = ''
+            for char in word:
+                if self.text_width(line + char, size, bold) > max_width and line:
+                    lines.append(line)
+                    line = ''
+                line += char
+        if line:
+            lines.append(line)
+        return lines
+
+    # 그리기
+    def text(self, x, y, text, size=10, color='#1e293b', bold=False, align='left'):
+        """
+        텍스트 그리기
+
+        Parameters:
+        - x, y: 기준 위치 (y는 글자 기준선)
+        - text: 문자열 (글꼴에 없는 문자(이모지 등)는 제외)
+        - size: 글자 크기 (pt)
+        - color: 글자 색상 ('#rrggbb')
+        - bold: 굵게 (한글은 외곽선을 함께 그려 굵게 표시)
+        - align: left, right, center
+        """
+        text = ''.join(' ' if char in '\t\r\n' else char for char in text if _is_printable(char))
+        if not text:
+            return
+        if align != 'left':
+            width = self.text_width(text, size, bold)
+            x -= width if align == 'right' else width / 2
+
+        r, g, b = _hex_color(color)
+        ops = [f"BT {r:.3f} {g:.3f} {b:.3f} rg {r:.3f} {g:.3f} {b:.3f} RG 1 0 0 1 {x:.2f} {self.height - y:.2f} Tm"]
+        for latin, run in self._runs(text):
+            if latin:
+                ops.append(f"/{'F2' if bold else 'F1'} {size:g} Tf 0 Tr ({_escape(run)}) Tj")
+            else:
+                encoded = run.encode('utf-16-be').hex().upper()
+                mode = f"2 Tr {size * 0.03:.2f} w" if bold else "0 Tr"
+                ops.append(f"/F3 {size:g} Tf {mode} <{encoded}> Tj")
+        ops.append("ET")
+        self._ops.append(' '.join(ops))
+
+    @staticmethod
+    def _runs(text):
+        """Helvetica로 쓸 영문 구간과 CID 글꼴로 쓸 구간으로 분리"""
+        runs = []
+        for char in text:
+            latin = _is_latin(char)
+            if runs and runs[-1][0] == latin:
+                runs[-1][1].append(char)
+            else:
+                runs.append((latin, [char]))
+        return [(latin, ''.join(chars)) for latin, chars in runs]
+
+    def rect(self, x, y, width, height, fill='#000000'):
+        """채운 사각형 그리기 (x, y는 왼쪽 위)"""
+        r, g, b = _hex_color(fill)
+        self._ops.append(
+            f"{r:.3f} {g:.3f} {b:.3f} rg {x:.2f} {self.height - y - height:.2f} {width:.2f} {height:.2f} re f"
+        )
+
+    def line(self, x1, y1, x2, y2, color='#e2e8f0', width=0.5):
+        """선 그리기"""
+        r, g, b = _hex_color(color)
+        self._ops.append(
+            f"{r:.3f} {g:.3f} {b:.3f} RG {width:g} w "
+            f"{x1:.2f} {self.height - y1:.2f} m {x2:.2f} {self.height - y2:.2f} l S"
+        )
+
+    # 저장
+    def save(self, path):
+        """
+        PDF 파일로 저장
+
+        Parameters:
+        - path: 저장 경로
+
+        Returns:
+        - 저장된 파일 경로
+        """
+        objects = []
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        catalog = add(None)
+        pages = add(None)
+        fonts = {
+            'F1': add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"),
+            'F2': add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>"),
+        }
+        descriptor = add(
+            b"<< /Type /FontDescriptor /FontName /HYGoThic-Medium /Flags 4 /FontBBox [-6 -145 1003 880] "
+            b"/ItalicAngle 0 /Ascent 880 /Descent -120 /CapHeight 880 /StemV 59 >>"
+        )
+        cid_font = add(
+            b"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /HYGoThic-Medium "
+            b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> "
+            b"/FontDescriptor " + f"{descriptor} 0 R".encode() + b" /DW 1000 >>"
+        )
+        fonts['F3'] = add(
+            b"<< /Type /Font /Subtype /Type0 /BaseFont /HYGoThic-Medium-UniKS-UCS2-H /Encoding /UniKS-UCS2-H "
+            b"/DescendantFonts [" + f"{cid_font} 0 R".encode() + b"] >>"
+        )
+        font_resources = ' '.join(f"/{name} {number} 0 R" for name, number in fonts.items())
+
+        page_numbers = []
+        for ops in self._pages:
+            content = zlib.compress('\n'.join(ops).encode('latin-1'))
+            stream = add(
+                f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode() + content + b"\nendstream"
+            )
+            page_numbers.append(add(
+                f"<< /Type /Page /Parent {pages} 0 R /MediaBox [0 0 {self.width:.2f} {self.height:.2f}] "
+                f"/Resources << /Font << {font_resources} >> >> /Contents {stream} 0 R >>".encode()
+            ))
+
+        objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages} 0 R >>".encode()
+        kids = ' '.join(f"{number} 0 R" for number in page_numbers)
+        objects[pages - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_numbers)} >>".encode()
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+        xref = len(output)
+        output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        output += ''.join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+        output += f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+
+        with open(path, 'wb') as f:
+            f.write(output)
+        return path
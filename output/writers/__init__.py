@@ -0,0 +1,21 @@
+# output/writers/__init__.py
+"""
+출력 형식별 작성기 (HTML, PDF, 스냅샷, JSON, CSV, Excel, Parquet)
+
+모든 작성기는 같은 템플릿 변수(WriterContext)를 입력으로 받고 run_writers()로 병렬 실행됩니다.
+새 형식은 OutputWriter를 상속하고 @register_writer로 등록합니다.
+"""
+from output.writers.base import (
+    OutputWriter, WriterContext, register_writer, get_writer, available_writers, run_writers
+)
+from output.writers.dashboard import HtmlDashboardWriter, InsightsSnapshotWriter, PdfReportWriter
+from output.writers.insights import JsonInsightsWriter
+from output.writers.tables import CsvTablesWriter
+from output.writers.excel import ExcelSummaryWriter
+from output.writers.orders import ParquetOrdersWriter
+
+__all__ = [
+    'OutputWriter', 'WriterContext', 'register_writer', 'get_writer', 'available_writers', 'run_writers',
+    'HtmlDashboardWriter', 'InsightsSnapshotWriter', 'PdfReportWriter',
+    'JsonInsightsWriter', 'CsvTablesWriter', 'ExcelSummaryWriter', 'ParquetOrdersWriter'
+]
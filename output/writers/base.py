@@ -0,0 +1,143 @@
+# output/writers/base.py
+"""
+출력 작성기(writer) 기본 클래스, 등록 테이블, 병렬 실행 함수
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# 표 형식 출력(CSV/Excel)에 사용하는 템플릿 변수 (변수 이름, 표 이름)
+TABLE_VARS = [
+    ('product_data', '상품유형'),
+    ('color_data', '색상'),
+    ('price_data', '가격대'),
+    ('size_data', '사이즈'),
+    ('material_data', '소재'),
+    ('design_data', '디자인'),
+    ('channel_data', '채널'),
+    ('bestseller_data', '베스트셀러'),
+]
+
+# 이름 -> 작성기 클래스
+_WRITERS = {}
+
+
+@dataclass(slots=True)
+class WriterContext:
+    """
+    모든 작성기가 공유하는 입력 (prepare_template_variables()를 한 번만 호출한 결과)
+
+    - template_vars: 준비된 템플릿 변수 (작성기는 읽기만 함)
+    - insights: 분석 결과 (스냅샷 저장용)
+    - output_folder: 결과물 저장 폴더
+    - timestamp: 파일명에 사용할 시각 문자열
+    - generator: DashboardGenerator (템플릿/PDF 변환 기능 사용)
+    - options: 작성기별 옵션 (pdf_width, pdf_service 등)
+    """
+    template_vars: dict
+    insights: object
+    output_folder: Path
+    timestamp: str
+    generator: object = None
+    options: dict = field(default_factory=dict)
+
+    def output_path(self, prefix, suffix):
+        """출력 파일 경로 (<output_folder>/<prefix>_<timestamp><suffix>)"""
+        return Path(self.output_folder) / f"{prefix}_{self.timestamp}{suffix}"
+
+
+class OutputWriter:
+    """
+    출력 작성기 기본 클래스
+
+    - name: 등록 이름 (--formats 값)
+    - requires: 먼저 끝나야 하는 작성기 이름 (그 결과를 write()의 results로 받음)
+    """
+    name = None
+    requires = ()
+
+    def write(self, context, results):
+        """
+        출력 생성 (하위 클래스에서 구현)
+
+        Parameters:
+        - context: WriterContext
+        - results: 먼저 실행된 작성기 결과 {이름: 결과}
+
+        Returns:
+        - 생성된 파일 경로 (또는 PDF 변환 Future, 실패하면 None)
+        """
+        raise NotImplementedError("하위 클래스에서 구현해야 합니다.")
+
+
+def register_writer(writer_class):
+    """작성기 클래스를 이름으로 등록하는 데코레이터"""
+    _WRITERS[writer_class.name] = writer_class
+    return writer_class
+
+
+def get_writer(name):
+    """이름에 해당하는 작성기 객체 반환"""
+    if name not in _WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식: {name} (사용 가능: {', '.join(available_writers())})")
+    return _WRITERS[name]()
+
+
+def available_writers():
+    """등록된 작성기 이름 목록"""
+    return list(_WRITERS)
+
+
+def _run_writer(writer, context, results):
+    try:
+        return writer.write(context, results)
+    except Exception as e:
+        print(f"{writer.name} 출력 생성 중 오류 발생: {e}")
+        return None
+
+
+def run_writers(names, context, max_workers=None):
+    """
+    선택한 작성기를 같은 입력으로 병렬 실행
+
+    requires가 없는 작성기부터 동시에 실행하고, 선행 작성기가 끝난 작성기를 다음 단계에서 실행합니다.
+    선택하지 않은 작성기는 선행 조건에서 제외합니다.
+
+    Parameters:
+    - names: 실행할 작성기 이름 목록
+    - context: WriterContext
+    - max_workers: 동시에 실행할 작성기 수 (None이면 단계별 작성기 수)
+
+    Returns:
+    - {이름: 결과} (선택한 순서대로)
+    """
+    writers = {name: get_writer(name) for name in dict.fromkeys(names)}
+    results = {}
+    pending = list(writers)
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(pending), 1), thread_name_prefix='writer') as executor:
+        while pending:
+            ready = [
+                name for name in pending
+                if all(required in results for required in writers[name].requires if required in writers)
+            ]
+            if not ready:
+                raise ValueError(f"작성기 선행 조건이 순환합니다: {pending}")
+            completed = dict(results)
+            futures = {name: executor.submit(_run_writer, writers[name], context, completed) for name in ready}
+            for name, future in futures.items():
+                results[name] = future.result()
+            pending = [name for name in pending if name not in futures]
+    return {name: results[name] for name in writers}
+
+
+def table_rows(template_vars):
+    """
+    표 형식 출력에 사용할 차트 데이터
+
+    Parameters:
+    - template_vars: 준비된 템플릿 변수
+
+    Returns:
+    - [(표 이름, 행 딕셔너리 리스트)] (TABLE_VARS 순서)
+    """
+    return [(title, list(template_vars.get(key) or [])) for key, title in TABLE_VARS]
@@ -0,0 +1,76 @@
+# output/writers/dashboard.py
+"""
+HTML 대시보드, 분석 결과 스냅샷, PDF 작성기
+"""
+from pathlib import Path
+
+from data.analyzer.serialization import save_snapshot, snapshot_path_for
+from output.writers.base import OutputWriter, register_writer
+
+
+@register_writer
+class HtmlDashboardWriter(OutputWriter):
+    """dashboard_template.html로 HTML 대시보드 생성"""
+    name = 'html'
+
+    def write(self, context, results):
+        template_handler = context.generator.template_handler
+        output = template_handler.render_template('dashboard_template.html', **context.template_vars)
+        html_path = template_handler.save_html(output, context.output_path('dashboard', '.html'))
+        if html_path:
+            print(f"HTML 대시보드가 생성되었습니다: {html_path}")
+        else:
+            print("대시보드 파일 저장 실패")
+        return html_path
+
+
+@register_writer
+class InsightsSnapshotWriter(OutputWriter):
+    """분석 결과 스냅샷 저장 (main.py render --from-snapshot으로 재렌더링)"""
+    name = 'snapshot'
+    requires = ('html',)
+
+    def write(self, context, results):
+        html_path = results.get('html') or context.output_path('dashboard', '.html')
+        snapshot_path = save_snapshot(context.insights, snapshot_path_for(Path(html_path)))
+        if snapshot_path:
+            print(f"분석 결과 스냅샷이 저장되었습니다: {snapshot_path}")
+        return snapshot_path
+
+
+@register_writer
+class PdfReportWriter(OutputWriter):
+    """
+    PDF 보고서 생성
+
+    HTML 대시보드를 변환하며, options의 pdf_service가 있으면 백그라운드 변환 Future를 반환합니다.
+    HTML을 만들지 않는 경우에는 native 엔진으로만 생성할 수 있습니다.
+    """
+    name = 'pdf'
+    requires = ('html',)
+
+    def write(self, context, results):
+        generator = context.generator
+        pdf_width = context.options.get('pdf_width', 1920)
+        html_path = results.get('html')
+
+        if html_path is None:
+            if 'html' in results or generator.pdf_engine != 'native':
+                print("HTML 대시보드가 없어 PDF를 변환할 수 없습니다. (HTML 없이 생성하려면 --pdf-engine native)")
+                return None
+            pdf_path = generator._generate_pdf_with_composer(context.output_path('dashboard', '.pdf'))
+            generator._report_pdf(pdf_path, pdf_width)
+            return pdf_path
+
+        pdf_service = context.options.get('pdf_service')
+        if pdf_service is not None:
+            future = pdf_service.submit(
+                generator.generate_pdf_from_html, html_path, pdf_width,
+                callback=lambda pdf_path: generator._report_pdf(pdf_path, pdf_width)
+            )
+            print(f"PDF 변환이 백그라운드에서 진행됩니다: {html_path.with_suffix('.pdf')}")
+            return future
+
+        pdf_path = generator.generate_pdf_from_html(html_path, pdf_width)
+        generator._report_pdf(pdf_path, pdf_width)
+        return pdf_path
@@ -0,0 +1,165 @@
+# output/writers/excel.py
+"""
+분석 표를 Excel 통합 문서로 저장하는 작성기 (openpyxl 쓰기 전용 스트리밍 모드)
+"""
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font
+
+from output.writers.base import OutputWriter, register_writer
+from visualization.insights_formatter.table_data_formatter import TableDataFormatter
+
+# 요약 시트에 넣을 템플릿 변수 (변수 이름, 항목 이름)
+SUMMARY_FIELDS = [
+    ('period', '분석 기간'),
+    ('total_orders', '총 주문 수'),
+]
+
+# TableDataFormatter 데이터 종류별 시트 이름
+TABLE_SHEETS = {
+    'channels': '채널',
+    'categories': '카테고리',
+    'keywords': '상품 키워드',
+    'prices': '가격대',
+    'bestsellers': '베스트셀러',
+    'colors': '색상',
+    'sizes': '사이즈',
+    'materials': '소재',
+    'designs': '디자인',
+    'auto_keywords': '스타일 키워드',
+}
+
+# 템플릿 변수로 만드는 시트 (변수 이름, 시트 이름)
+TEMPLATE_SHEETS = [
+    ('product_data', '상품유형'),
+    ('keyword_recommendations', '추천 키워드'),
+]
+
+# 원본 주문 시트 이름과 시트당 최대 데이터 행 수 (Excel 한도 1,048,576행 - 머리글)
+ORDERS_SHEET = '주문 데이터'
+MAX_SHEET_ROWS = 1048575
+
+DEFAULT_BATCH_ROWS = 10000
+
+
+def _cell_value(value):
+    """openpyxl에 쓸 수 있는 값으로 변환 (NumPy 타입, 결측값, 중첩 값, 제어 문자)"""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub('', value)
+    if isinstance(value, dict):
+        return str(value)
+    if isinstance(value, (list, tuple, set)):
+        return ', '.join(map(str, value))
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or pd.isna(value):
+        return None
+    return value
+
+
+@register_writer
+class ExcelSummaryWriter(OutputWriter):
+    """
+    summary_<시각>.xlsx 저장
+
+    쓰기 전용(write_only) 통합 문서에 행을 바로 기록하므로 표 크기와 관계없이 메모리 사용량이 일정합니다.
+    시트 구성: 요약 -> TableDataFormatter 데이터 종류별 시트 -> 상품유형/추천 키워드
+    -> (options['excel_orders']이고 options['orders']가 있으면) 필터링된 원본 주문 데이터 (batch_rows행씩 나눠 기록)
+    """
+    name = 'excel'
+
+    def write(self, context, results):
+        generator = context.generator
+        formatter = getattr(generator, 'formatter', None)
+        table_formatter = getattr(formatter, 'table_formatter', None) or TableDataFormatter(context.insights)
+
+        workbook = Workbook(write_only=True)
+        self._write_summary(workbook, context.template_vars)
+        for data_type, title in TABLE_SHEETS.items():
+            self._write_records(workbook, title, table_formatter.format_data(data_type))
+        for key, title in TEMPLATE_SHEETS:
+            self._write_records(workbook, title, context.template_vars.get(key) or [])
+
+        # 주문 데이터프레임은 parquet 형식에도 전달되므로 excel_orders를 지정한 경우에만 시트로 기록
+        orders = context.options.get('orders') if context.options.get('excel_orders') else None
+        if orders is not None:
+            batch_rows = context.options.get('excel_batch_rows') or getattr(
+                getattr(generator, 'config', None), 'excel_batch_rows', DEFAULT_BATCH_ROWS
+            )
+            self._write_orders(workbook, orders, batch_rows)
+
+        excel_path = context.output_path('summary', '.xlsx')
+        workbook.save(excel_path)
+        print(f"Excel 요약 보고서가 저장되었습니다: {excel_path}")
+        return excel_path
+
+    @staticmethod
+    def _header(sheet, columns):
+        """굵은 글씨 머리글 행 추가"""
+        cells = []
+        for column in columns:
+            cell = WriteOnlyCell(sheet, value=str(column))
+            cell.font = Font(bold=True)
+            cells.append(cell)
+        sheet.append(cells)
+
+    def _write_summary(self, workbook, template_vars):
+        sheet = workbook.create_sheet('요약')
+        self._header(sheet, ['항목', '값'])
+        for key, label in SUMMARY_FIELDS:
+            sheet.append([label, _cell_value(template_vars.get(key))])
+        for insight in template_vars.get('summary_insights') or []:
+            sheet.append(['핵심 요약', _cell_value(insight)])
+
+    def _write_records(self, workbook, title, records):
+        """
+        레코드(딕셔너리 또는 값) 리스트를 시트 하나로 기록
+
+        머리글은 레코드에 나오는 키를 처음 나온 순서대로 사용합니다.
+        """
+        sheet = workbook.create_sheet(title)
+        records = [record if isinstance(record, dict) else {'name': record} for record in records]
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        if not columns:
+            sheet.append(['데이터가 없습니다'])
+            return
+        self._header(sheet, columns)
+        for record in records:
+            sheet.append([_cell_value(record.get(column)) for column in columns])
+
+    def _write_orders(self, workbook, orders, batch_rows):
+        """
+        필터링된 원본 주문 데이터를 batch_rows행씩 변환해 기록
+
+        한 번에 한 묶음만 Python 객체로 변환하므로 100만 행 이상도 메모리가 크게 늘지 않으며,
+        시트 행 한도를 넘으면 '주문 데이터 (2)' 같은 다음 시트로 이어서 기록합니다.
+        """
+        columns = [str(column) for column in orders.columns]
+        batch_rows = max(int(batch_rows), 1)
+        sheet = None
+        sheet_rows = MAX_SHEET_ROWS
+        sheet_count = 0
+
+        for start in range(0, len(orders), batch_rows):
+            batch = orders.iloc[start:start + batch_rows]
+            values = batch.astype(object).where(batch.notna(), None).to_numpy().tolist()
+            position = 0
+            while position < len(values):
+                if sheet_rows >= MAX_SHEET_ROWS:
+                    sheet_count += 1
+                    sheet = workbook.create_sheet(ORDERS_SHEET if sheet_count == 1 else f"{ORDERS_SHEET} ({sheet_count})")
+                    self._header(sheet, columns)
+                    sheet_rows = 0
+                chunk = values[position:position + MAX_SHEET_ROWS - sheet_rows]
+                for row in chunk:
+                    sheet.append([_cell_value(value) for value in row])
+                sheet_rows += len(chunk)
+                position += len(chunk)
+
+        if sheet_count == 0:
+            sheet = workbook.create_sheet(ORDERS_SHEET)
+            self._header(sheet, columns)
+        print(f"Excel 주문 데이터 시트 기록 완료: {len(orders):,}행 ({sheet_count or 1}개 시트)")
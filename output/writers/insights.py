@@ -0,0 +1,27 @@
+# output/writers/insights.py
+"""
+템플릿 변수(차트 데이터, 인사이트 텍스트)를 JSON으로 저장하는 작성기
+"""
+import json
+
+from utils import convert_to_serializable
+from output.writers.base import OutputWriter, register_writer
+
+# JSON에 포함하지 않는 템플릿 변수 (렌더링 결과물)
+_EXCLUDED_VARS = ('static_charts',)
+
+
+@register_writer
+class JsonInsightsWriter(OutputWriter):
+    """insights_<시각>.json 저장 (다른 시스템 연동용)"""
+    name = 'json'
+
+    def write(self, context, results):
+        payload = {
+            key: value for key, value in context.template_vars.items() if key not in _EXCLUDED_VARS
+        }
+        json_path = context.output_path('insights', '.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(convert_to_serializable(payload), f, ensure_ascii=False, indent=2, default=str)
+        print(f"JSON 인사이트가 저장되었습니다: {json_path}")
+        return json_path
@@ -0,0 +1,20 @@
+# output/writers/orders.py
+"""
+정제된 주문 데이터를 월별 Parquet 파일로 내보내는 작성기
+"""
+from output.order_export import OrderExporter
+from output.writers.base import OutputWriter, register_writer
+
+
+@register_writer
+class ParquetOrdersWriter(OutputWriter):
+    """orders_<시각>/ 폴더에 월별 Parquet 파일과 _manifest.json 저장 (options['orders'] 필요)"""
+    name = 'parquet'
+
+    def write(self, context, results):
+        orders = context.options.get('orders')
+        if orders is None:
+            print("정제된 주문 데이터가 없어 Parquet 내보내기를 건너뜁니다. (스냅샷 재렌더링에서는 사용할 수 없습니다)")
+            return None
+        exporter = OrderExporter.from_config(context.generator.config)
+        return exporter.export(orders, context.output_path('orders', ''), source=context.insights.get('source'))
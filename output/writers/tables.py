@@ -0,0 +1,21 @@
+# output/writers/tables.py
+"""
+차트 데이터를 표별 CSV 파일로 저장하는 작성기
+"""
+import pandas as pd
+
+from output.writers.base import OutputWriter, register_writer, table_rows
+
+
+@register_writer
+class CsvTablesWriter(OutputWriter):
+    """tables_<시각>/ 폴더에 표마다 CSV 파일 저장 (Excel에서 바로 열리도록 utf-8-sig)"""
+    name = 'csv'
+
+    def write(self, context, results):
+        folder = context.output_path('tables', '')
+        folder.mkdir(parents=True, exist_ok=True)
+        for title, rows in table_rows(context.template_vars):
+            pd.DataFrame(rows).to_csv(folder / f"{title}.csv", index=False, encoding='utf-8-sig')
+        print(f"CSV 표가 저장되었습니다: {folder}")
+        return folder
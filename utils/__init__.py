@@ -3,6 +3,7 @@ from .error_handling import safe_process_data
 from .file_utils import ensure_dir, get_file_extension
 from .text_utils import clean_text, extract_keywords
 from .format_utils import format_number
+from .tokenizer import FashionTokenizer
 
 __all__ = [
     'convert_to_serializable',
@@ -12,5 +13,6 @@ __all__ = [
     'get_file_extension',
     'clean_text',
     'extract_keywords',
-    'format_number'
+    'format_number',
+    'FashionTokenizer'
 ]
@@ -1,12 +1,18 @@
 import re
 
+# 알파벳, 숫자, 한글, 공백 이외의 문자
+_NON_WORD_PATTERN = re.compile(r'[^\w\s가-힣]')
+
 def clean_text(text, stop_words=None):
     """
-    텍스트 정제 (불용어 제거, 특수문자 제거 등)
+    텍스트 정제 (특수문자 제거, 불용어 토큰 제거 등)
+    
+    불용어는 부분 문자열 치환이 아니라 공백 기준 토큰 단위로 제거하므로
+    긴 단어 안의 일부가 잘려 나가지 않습니다.
     
     Parameters:
     - text: 정제할 텍스트
-    - stop_words: 제거할 불용어 리스트
+    - stop_words: 제거할 불용어 집합 (frozenset 권장, 리스트도 가능)
     
     Returns:
     - 정제된 텍스트
@@ -14,21 +20,17 @@ def clean_text(text, stop_words=None):
     if not isinstance(text, str):
         return ""
     
-    # 소문자 변환
-    text = text.lower()
+    # 소문자 변환 후 특수문자 제거 (알파벳, 숫자, 한글, 공백만 남김)
+    text = _NON_WORD_PATTERN.sub(' ', text.lower())
     
-    # 불용어 제거
+    # 공백 기준 토큰 분리 (연속된 공백 제거) 후 불용어 토큰 제외
+    tokens = text.split()
     if stop_words:
-        for word in stop_words:
-            text = text.replace(word.lower(), ' ')
-    
-    # 특수문자 제거 (알파벳, 숫자, 한글, 공백만 남김)
-    text = re.sub(r'[^\w\s가-힣]', ' ', text)
-    
-    # 연속된 공백 제거
-    text = re.sub(r'\s+', ' ', text).strip()
+        if not isinstance(stop_words, (set, frozenset)):
+            stop_words = frozenset(str(word).lower() for word in stop_words)
+        tokens = [token for token in tokens if token not in stop_words]
     
-    return text
+    return ' '.join(tokens)
 
 def extract_keywords(text, min_length=2, max_keywords=10):
     """
@@ -0,0 +1,287 @@
+# utils/tokenizer.py
+import re
+from collections import Counter
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# 토큰 후보 구간 (한글/영문 소문자/숫자 연속 구간)
+RUN_PATTERN = re.compile(r'[가-힣a-z0-9]+')
+
+# 한글 포함 여부 (한글이 없는 영문/숫자 구간은 분할하지 않음)
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+# 트라이 노드에서 단어 끝을 표시하는 키
+_END = ''
+
+
+def normalize_phrases(words):
+    """
+    단어 목록을 토큰 구간 시퀀스 집합으로 정규화
+
+    소문자로 바꾸고 토큰 구간 문자만 남깁니다 ('[브리치]' -> ('브리치',), 'ver.' -> ('ver',)).
+    '1+1', 'limited edition'처럼 여러 구간으로 나뉘는 항목은 구간 시퀀스(('limited', 'edition'))로 남아
+    텍스트에서 연속된 구간과 비교됩니다. 토큰 구간 문자가 없는 항목('%')은 제외합니다.
+
+    Returns:
+    - 구간 튜플의 frozenset
+    """
+    phrases = set()
+    for word in words:
+        runs = tuple(RUN_PATTERN.findall(str(word).lower()))
+        if runs:
+            phrases.add(runs)
+    return frozenset(phrases)
+
+class FashionTokenizer:
+    """
+    패션 사전 기반 상품명 토크나이저 (형태소 분석기 없음)
+
+    패션 키워드/제품 속성/학습 어휘로 만든 트라이에서 최장 일치(longest match)로
+    '오버핏반팔티셔츠' 같은 붙여 쓴 상품명을 '오버핏 / 반팔 / 티셔츠'로 나눕니다.
+    사전에 없는 구간이 사전 단어 바로 앞에 붙어 FASHION_PATTERNS(하나의 정규식으로
+    컴파일)와 일치하면 '썸머자켓'처럼 하나의 토큰으로 합칩니다.
+    불용어/비패션 키워드는 사전에 넣지 않고(긴 단어 안의 '베스트', '오픈' 등으로 분할되지 않도록)
+    텍스트의 구간 시퀀스('limited edition')와 분할이 끝난 토큰 단위로 비교해 제거하므로
+    부분 문자열 치환처럼 긴 단어 안의 일부('col' in 'cold')를 훼손하지 않습니다.
+    토큰은 정수 id로 관리되어 집계(bincount)와 문서-단어 행렬 생성에 바로 사용됩니다.
+    """
+
+    # learn()에서 어휘로 추가할 미등록 구간의 최소 출현 수
+    LEARN_MIN_COUNT = 5
+
+    def __init__(self, keywords=(), patterns=(), vocabulary=(), stop_words=(), min_length=2):
+        """
+        Parameters:
+        - keywords: 사전 단어 목록 (패션 키워드, 제품 속성 등)
+        - patterns: 패션 단어 정규식 목록 (FASHION_PATTERNS) 또는 컴파일된 정규식
+        - vocabulary: 추가 학습 어휘 목록
+        - stop_words: 제거할 단어 목록 (불용어, 비패션 키워드, 여러 단어로 된 항목은 연속 구간으로 비교)
+        - min_length: 토큰 최소 길이 (이보다 짧은 사전 단어/토큰은 제외)
+        """
+        self.min_length = min_length
+        self._trie = {}
+        self._run_cache = {}
+        self.words = set()
+        phrases = normalize_phrases(stop_words)
+        self.stop_words = frozenset(phrase[0] for phrase in phrases if len(phrase) == 1)
+        # 여러 구간으로 된 불용어 (첫 구간 -> 긴 시퀀스부터)
+        self.stop_sequences = {}
+        for phrase in sorted((p for p in phrases if len(p) > 1), key=len, reverse=True):
+            self.stop_sequences.setdefault(phrase[0], []).append(phrase)
+        self.add_words(keywords)
+        self.add_words(vocabulary)
+
+        if isinstance(patterns, re.Pattern):
+            self.pattern = patterns
+        else:
+            patterns = [p for p in patterns if p]
+            self.pattern = re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+
+        # 토큰 <-> id 매핑 (처음 나타난 순서대로 id 부여)
+        self.vocabulary_ = {}
+        self.tokens = []
+
+    @classmethod
+    def from_config(cls, config, vocabulary=()):
+        """
+        설정 스냅샷의 패션 키워드, 제품 속성, 컴파일된 패션 패턴으로 토크나이저 생성
+
+        Parameters:
+        - config: 설정 객체
+        - vocabulary: 추가 학습 어휘 목록
+        """
+        snapshot = config.snapshot()
+        keywords = list(snapshot.fashion_keywords)
+        for values in snapshot.product_attributes.values():
+            keywords.extend(values)
+        stop_words = snapshot.stop_words + snapshot.non_fashion_keywords
+        return cls(keywords, snapshot.fashion_regex, vocabulary, stop_words)
+
+    def add_words(self, words):
+        """사전(트라이)에 단어 추가 (소문자로 정규화, 토큰 구간 문자로만 된 단어만, 불용어 제외)"""
+        for word in words:
+            word = str(word).lower()
+            if len(word) < self.min_length or not RUN_PATTERN.fullmatch(word) or word in self.words:
+                continue
+            if word in self.stop_words:
+                continue
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_END] = True
+            self.words.add(word)
+        # 사전이 바뀌면 구간 분할 캐시 초기화
+        self._run_cache.clear()
+        return self
+
+    def learn(self, texts, min_count=None):
+        """
+        사전에 없는 구간 중 자주 나타나는 구간을 어휘로 학습
+
+        Parameters:
+        - texts: 텍스트 목록 (고유 텍스트 기준으로 집계)
+        - min_count: 어휘로 추가할 최소 출현 수 (None이면 LEARN_MIN_COUNT)
+        """
+        min_count = self.LEARN_MIN_COUNT if min_count is None else min_count
+        counts = pd.Series(texts, dtype=object).dropna().astype(str).value_counts()
+        residuals = Counter()
+        for text, count in counts.items():
+            for run in RUN_PATTERN.findall(text.lower()):
+                if not HANGUL_PATTERN.search(run):
+                    continue
+                for token, known in self._segment_run(run):
+                    if not known and token not in self.stop_words:
+                        residuals[token] += count
+        self.add_words(token for token, count in residuals.items() if count >= min_count)
+        return self
+
+    def _segment_run(self, run):
+        """
+        한 구간을 최장 일치로 분할
+
+        Returns:
+        - [(토큰, 사전 단어 여부), ...]
+        """
+        pieces = []
+        residual_start = 0
+        i = 0
+        length = len(run)
+        while i < length:
+            # 트라이를 따라가며 i에서 시작하는 가장 긴 사전 단어 탐색
+            node = self._trie
+            match_end = -1
+            j = i
+            while j < length:
+                node = node.get(run[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    match_end = j
+            if match_end < 0:
+                i += 1
+                continue
+
+            word = run[i:match_end]
+            if residual_start < i:
+                residual = run[residual_start:i]
+                # 미등록 구간 + 사전 단어가 패션 패턴과 일치하면 하나의 토큰으로 합침
+                if self.pattern is not None and self.pattern.fullmatch(residual + word):
+                    pieces.append((residual + word, True))
+                    residual_start = i = match_end
+                    continue
+                pieces.append((residual, False))
+            pieces.append((word, True))
+            residual_start = i = match_end
+
+        if residual_start < length:
+            pieces.append((run[residual_start:], False))
+        return pieces
+
+    def _run_tokens(self, run):
+        """구간의 토큰 목록 (불용어, 숫자로만 된 토큰, 짧은 토큰 제외, 결과 캐시)"""
+        tokens = self._run_cache.get(run)
+        if tokens is None:
+            if HANGUL_PATTERN.search(run):
+                pieces = [token for token, _ in self._segment_run(run)]
+            else:
+                pieces = [run]
+            stop_words = self.stop_words
+            tokens = [
+                token for token in pieces
+                if len(token) >= self.min_length and not token.isdigit() and token not in stop_words
+            ]
+            self._run_cache[run] = tokens
+        return tokens
+
+    def tokenize(self, text):
+        """
+        텍스트를 토큰 목록으로 분할
+
+        Parameters:
+        - text: 상품명 등 텍스트
+
+        Returns:
+        - 토큰 문자열 리스트
+        """
+        if not isinstance(text, str):
+            return []
+        runs = RUN_PATTERN.findall(text.lower())
+        tokens = []
+        i = 0
+        while i < len(runs):
+            run = runs[i]
+            # 여러 구간으로 된 불용어와 불용어인 구간 전체는 분할 전에 제거
+            matched = next(
+                (len(phrase) for phrase in self.stop_sequences.get(run, ())
+                 if tuple(runs[i:i + len(phrase)]) == phrase),
+                0
+            )
+            if matched:
+                i += matched
+                continue
+            if run not in self.stop_words:
+                tokens.extend(self._run_tokens(run))
+            i += 1
+        return tokens
+
+    def segment(self, text):
+        """토큰을 공백으로 이어 붙인 텍스트 (기존 벡터라이저 입력용)"""
+        return ' '.join(self.tokenize(text))
+
+    def token_id(self, token):
+        """토큰의 id (없으면 새로 부여)"""
+        token_id = self.vocabulary_.get(token)
+        if token_id is None:
+            token_id = self.vocabulary_[token] = len(self.tokens)
+            self.tokens.append(token)
+        return token_id
+
+    def encode(self, texts):
+        """
+        텍스트 목록을 토큰 id 배열로 변환 (고유 텍스트당 한 번만 분할)
+
+        Parameters:
+        - texts: 텍스트 목록 (pd.Series 가능)
+
+        Returns:
+        - (ids, offsets): 모든 문서의 토큰 id를 이어 붙인 배열과 문서별 시작 위치 배열
+          (문서 k의 토큰은 ids[offsets[k]:offsets[k + 1]])
+        """
+        codes, uniques = pd.factorize(pd.Series(texts, dtype=object), use_na_sentinel=True)
+
+        # 고유 텍스트별 토큰 id
+        unique_ids = [
+            np.fromiter((self.token_id(t) for t in self.tokenize(text)), dtype='int64')
+            for text in uniques
+        ]
+        # 결측 텍스트(-1)는 빈 토큰 목록
+        unique_ids.append(np.zeros(0, dtype='int64'))
+        lengths = np.array([len(ids) for ids in unique_ids], dtype='int64')
+        unique_offsets = np.r_[0, np.cumsum(lengths)]
+        flat_unique = np.concatenate(unique_ids)
+
+        # 문서별로 고유 텍스트의 토큰 구간을 펼침
+        doc_codes = np.where(codes < 0, len(uniques), codes)
+        doc_lengths = lengths[doc_codes]
+        offsets = np.r_[0, np.cumsum(doc_lengths)]
+        positions = np.repeat(unique_offsets[doc_codes] - offsets[:-1], doc_lengths) + np.arange(offsets[-1])
+        return flat_unique[positions], offsets
+
+    def count(self, ids):
+        """토큰 id 배열의 토큰별 출현 수 (id 인덱스 배열)"""
+        return np.bincount(ids, minlength=len(self.tokens))
+
+    def to_csr(self, texts):
+        """
+        문서 x 토큰 빈도 희소 행렬 생성
+
+        Returns:
+        - (csr 행렬, 토큰 문자열 배열)
+        """
+        ids, offsets = self.encode(texts)
+        data = np.ones(len(ids), dtype='int64')
+        matrix = sparse.csr_matrix((data, ids, offsets), shape=(len(offsets) - 1, len(self.tokens)))
+        matrix.sum_duplicates()
+        return matrix, np.array(self.tokens, dtype=object)
@@ -4,6 +4,10 @@
 """
 from visualization.chart_generator.factory import ChartFactory
 from visualization.chart_generator.base import BaseChartGenerator
+from visualization.chart_generator.cache import ChartCache
+from visualization.chart_generator.svg_charts import (
+    SvgChartRenderer, SvgHorizontalBarChart, SvgVerticalBarChart, SvgPieChart
+)
 
 # 주요 함수 - 이름을 ChartGenerator로 하여 기존 코드와 호환성 유지
 def ChartGenerator(chart_type, data, colors=None):
@@ -76,10 +80,10 @@ def create_empty_chart(message="데이터가 없습니다"):
     generator = BaseChartGenerator()
     return generator.create_empty_chart(message)
 
-def save_chart_to_file(fig, file_path, format='png', width=800, height=600):
-    """차트를 파일로 저장"""
+def save_chart_to_file(fig, file_path, format='png', width=800, height=600, cache=None):
+    """차트를 파일로 저장 (cache가 주어지면 같은 차트 이미지는 다시 렌더링하지 않음)"""
     generator = BaseChartGenerator()
-    return generator.save_chart_to_file(fig, file_path, format, width, height)
+    return generator.save_chart_to_file(fig, file_path, format, width, height, cache=cache)
 
 # 기존 코드와의 호환성을 위해 ChartGenerator 함수에 유틸리티 메소드도 추가
 ChartGenerator.create_empty_chart = create_empty_chart
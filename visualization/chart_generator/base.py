@@ -93,7 +93,7 @@ class BaseChartGenerator:
         """
         return data is not None and len(data) > 0
 
-    def save_chart_to_file(self, fig, file_path, format='png', width=800, height=600):
+    def save_chart_to_file(self, fig, file_path, format='png', width=800, height=600, cache=None):
         """
         차트를 파일로 저장
         
@@ -103,12 +103,26 @@ class BaseChartGenerator:
         - format: 파일 포맷 (png, jpeg, svg, pdf)
         - width: 이미지 너비
         - height: 이미지 높이
+        - cache: ChartCache (주어지면 그림 내용/형식/크기가 같은 이미지는 캐시에서 재사용)
         
         Returns:
         - 저장된 파일 경로
         """
         try:
-            fig.write_image(file_path, format=format, width=width, height=height)
+            if cache is None:
+                fig.write_image(file_path, format=format, width=width, height=height)
+                return file_path
+            
+            image = cache.get_or_render(
+                'plotly', fig.to_json(),
+                lambda: fig.to_image(format=format, width=width, height=height),
+                size=(width, height), fmt=format
+            )
+            # svg 캐시 항목은 문자열로 반환되므로 바이트로 변환해 기록
+            if isinstance(image, str):
+                image = image.encode('utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(image)
             return file_path
         except Exception as e:
             print(f"차트 저장 중 오류 발생: {e}")
@@ -0,0 +1,224 @@
+# visualization/chart_generator/cache.py
+"""
+차트 데이터 해시를 키로 렌더링 결과(SVG 문자열, PNG/SVG 이미지)를 재사용하는 디스크 캐시
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# 렌더러 출력 형식이 바뀌면 올려서 이전 캐시를 무효화
+CACHE_VERSION = 1
+
+# 텍스트로 저장하는 형식 (나머지는 바이트)
+_TEXT_FORMATS = ('svg', 'html')
+
+
+class ChartCache:
+    """
+    내용 주소 기반(content-addressed) 차트 렌더링 캐시
+
+    키는 차트 유형, 직렬화한 차트 데이터, 색상, 크기, 출력 형식의 sha256 해시이므로
+    재실행이나 배치의 다른 파일에서 같은 차트가 나오면 다시 렌더링하지 않습니다.
+    항목은 cache_folder/<키>.<형식> 파일로 저장되며, 항목 수와 전체 크기 한도를 넘으면
+    가장 오래 사용하지 않은 항목부터 삭제합니다(LRU, 사용 시 파일 수정 시각 갱신).
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    # 폴더별 공유 인스턴스 (배치 실행 중 여러 대시보드가 같은 캐시와 통계를 사용)
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_folder, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        차트 캐시 초기화
+
+        Parameters:
+        - cache_folder: 캐시 파일 저장 폴더
+        - max_entries: 최대 항목 수
+        - max_bytes: 최대 전체 크기 (바이트)
+        """
+        self.cache_folder = Path(cache_folder)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load_index()
+
+    @classmethod
+    def shared(cls, cache_folder, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        """폴더별로 하나만 만드는 공유 캐시 반환"""
+        key = str(Path(cache_folder).resolve())
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(cache_folder, max_entries, max_bytes)
+            return cls._shared[key]
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        설정에서 (폴더별 공유) 차트 캐시 생성
+
+        Returns:
+        - ChartCache 객체 (비활성화된 경우 None)
+        """
+        settings = config.get_chart_cache_settings()
+        if not settings['enabled']:
+            return None
+        return cls.shared(settings['folder'], settings['max_entries'], settings['max_bytes'])
+
+    def _load_index(self):
+        """캐시 폴더의 기존 항목을 사용 시각 순으로 색인"""
+        if not self.cache_folder.exists():
+            return
+        entries = []
+        for path in self.cache_folder.iterdir():
+            if path.is_file() and not path.name.startswith('.'):
+                stat = path.stat()
+                entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def make_key(chart_type, data, colors=None, size=None, fmt='svg'):
+        """
+        차트 캐시 키 생성
+
+        Parameters:
+        - chart_type: 차트/렌더러 유형
+        - data: 차트 데이터 (JSON 직렬화 가능한 값)
+        - colors: 차트 색상
+        - size: 출력 크기 등 렌더링 옵션
+        - fmt: 출력 형식 (svg, png 등)
+
+        Returns:
+        - sha256 16진수 문자열
+        """
+        payload = json.dumps(
+            [CACHE_VERSION, chart_type, data, colors, size, fmt],
+            ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, name):
+        return self.cache_folder / name
+
+    def get(self, key, fmt='svg'):
+        """
+        캐시된 렌더링 결과 조회
+
+        Returns:
+        - SVG 등 텍스트 형식은 문자열, 이미지는 바이트 (없으면 None)
+        """
+        name = f"{key}.{fmt}"
+        with self._lock:
+            if name not in self._index:
+                self.misses += 1
+                return None
+            try:
+                path = self._path(name)
+                content = path.read_text(encoding='utf-8') if fmt in _TEXT_FORMATS else path.read_bytes()
+                os.utime(path)
+            except OSError:
+                self._total_bytes -= self._index.pop(name)
+                self.misses += 1
+                return None
+            self._index.move_to_end(name)
+            self.hits += 1
+            return content
+
+    def put(self, key, content, fmt='svg'):
+        """
+        렌더링 결과 저장 (한도를 넘으면 오래된 항목 삭제)
+
+        Parameters:
+        - key: make_key()로 만든 키
+        - content: 문자열 또는 바이트
+        - fmt: 출력 형식
+        """
+        name = f"{key}.{fmt}"
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        with self._lock:
+            try:
+                self.cache_folder.mkdir(parents=True, exist_ok=True)
+                temp_path = self._path(f".{name}.{threading.get_ident()}.tmp")
+                temp_path.write_bytes(data)
+                os.replace(temp_path, self._path(name))
+            except OSError as e:
+                print(f"차트 캐시 저장 중 오류 발생: {e}")
+                return
+            self._total_bytes += len(data) - self._index.pop(name, 0)
+            self._index[name] = len(data)
+            self._evict()
+
+    def get_or_render(self, chart_type, data, render, colors=None, size=None, fmt='svg'):
+        """
+        캐시에 있으면 재사용하고, 없으면 render()로 만들어 저장
+
+        Parameters:
+        - chart_type, data, colors, size, fmt: make_key()와 같음
+        - render: 인수 없이 렌더링 결과(문자열/바이트)를 반환하는 함수
+
+        Returns:
+        - 렌더링 결과
+        """
+        key = self.make_key(chart_type, data, colors, size, fmt)
+        content = self.get(key, fmt)
+        if content is None:
+            content = render()
+            if content is not None:
+                self.put(key, content, fmt)
+        return content
+
+    def _evict(self):
+        """항목 수/전체 크기 한도를 넘는 동안 가장 오래 사용하지 않은 항목 삭제"""
+        while self._index and (len(self._index) > self.max_entries or self._total_bytes > self.max_bytes):
+            name, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(name).unlink()
+            except OSError:
+                pass
+
+    @property
+    def hit_rate(self):
+        """조회 적중률 (0~1, 조회가 없으면 0)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+        - {'hits', 'misses', 'hit_rate', 'entries', 'bytes', 'evictions'}
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hit_rate,
+                'entries': len(self._index),
+                'bytes': self._total_bytes,
+                'evictions': self.evictions
+            }
+
+    def report(self):
+        """캐시 통계 출력"""
+        stats = self.stats()
+        lookups = stats['hits'] + stats['misses']
+        print(
+            f"차트 캐시: 적중 {stats['hits']}/{lookups} ({stats['hit_rate'] * 100:.1f}%), "
+            f"항목 {stats['entries']}개 ({stats['bytes'] / 1024:,.1f}KB), 삭제 {stats['evictions']}개"
+        )
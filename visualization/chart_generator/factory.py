@@ -4,6 +4,7 @@
 """
 from visualization.chart_generator.bar_charts import HorizontalBarChart, VerticalBarChart
 from visualization.chart_generator.pie_charts import PieChart
+from visualization.chart_generator.svg_charts import SvgHorizontalBarChart, SvgVerticalBarChart, SvgPieChart
 
 class ChartFactory:
     """
@@ -31,3 +32,24 @@ class ChartFactory:
             return PieChart(colors)
         else:
             raise ValueError(f"지원하지 않는 차트 유형: {chart_type}")
+    
+    @staticmethod
+    def get_svg_renderer(chart_type, colors=None):
+        """
+        차트 유형에 따른 정적 SVG 렌더러 반환 (Plotly/브라우저 불필요)
+        
+        Parameters:
+        - chart_type: 차트 유형 (horizontal_bar, vertical_bar, pie)
+        - colors: 차트 색상 (지정하지 않으면 대시보드 기본 색상 사용)
+        
+        Returns:
+        - SVG 렌더러 객체
+        """
+        if chart_type == 'horizontal_bar':
+            return SvgHorizontalBarChart(colors)
+        elif chart_type == 'vertical_bar':
+            return SvgVerticalBarChart(colors)
+        elif chart_type == 'pie':
+            return SvgPieChart(colors)
+        else:
+            raise ValueError(f"지원하지 않는 차트 유형: {chart_type}")
\ No newline at end of file
@@ -0,0 +1,292 @@
+# visualization/chart_generator/svg_charts.py
+"""
+차트 데이터에서 정적 SVG 마크업을 직접 생성하는 렌더러
+
+Plotly/브라우저 없이 문자열만 만들므로 JavaScript를 실행하지 않는 WeasyPrint PDF 변환에서도
+대시보드 차트가 그대로 보입니다. 데이터 형식은 Plotly 차트 생성기와 같은
+딕셔너리 리스트([{'name': ..., 'value': ...}, ...])입니다.
+"""
+import math
+import zlib
+from html import escape
+
+
+def format_number(value):
+    """천 단위 구분 기호가 있는 숫자 문자열 (JS toLocaleString과 같은 표시)"""
+    if isinstance(value, float) and not value.is_integer():
+        return f"{value:,.3f}".rstrip('0').rstrip('.')
+    return f"{int(value):,}"
+
+
+def text_width(text, font_size):
+    """텍스트 표시 너비 추정 (한글/전각 문자 1em, 그 외 0.55em)"""
+    return sum(font_size if ord(char) > 0x2E80 else font_size * 0.55 for char in text)
+
+
+def fit_text(text, max_width, font_size):
+    """최대 너비를 넘으면 뒤를 잘라 '…' 표시"""
+    if text_width(text, font_size) <= max_width:
+        return text
+    ellipsis_width = text_width('…', font_size)
+    width = 0
+    for position, char in enumerate(text):
+        width += text_width(char, font_size)
+        if width + ellipsis_width > max_width:
+            return text[:position] + '…'
+    return text
+
+
+class SvgChartRenderer:
+    """
+    모든 SVG 차트 렌더러의 기본 클래스
+    """
+
+    # 대시보드 막대 색상 (createBarChart와 같은 그라데이션 시작/끝 색상)
+    DEFAULT_COLORS = [
+        ('#2563eb', '#3b82f6'), ('#10b981', '#22c55e'), ('#f59e0b', '#fbbf24'), ('#8b5cf6', '#a78bfa'),
+        ('#ec4899', '#f472b6'), ('#06b6d4', '#22d3ee'), ('#ef4444', '#fb7185'), ('#64748b', '#94a3b8'),
+        ('#6366f1', '#8b5cf6'), ('#f59e0b', '#d97706')
+    ]
+
+    FONT_FAMILY = "'Pretendard', -apple-system, BlinkMacSystemFont, system-ui, sans-serif"
+    TEXT_COLOR = '#475569'
+    MUTED_COLOR = '#64748b'
+    TRACK_COLOR = '#f1f5f9'
+
+    def __init__(self, colors=None, width=1000):
+        """
+        SVG 렌더러 초기화
+
+        Parameters:
+        - colors: 차트 색상 ((시작, 끝) 그라데이션 튜플 또는 단색 문자열 리스트, 지정하지 않으면 기본 색상)
+        - width: SVG viewBox 너비 (표시 크기는 컨테이너 너비에 맞춰 조정)
+        """
+        colors = colors if colors is not None else self.DEFAULT_COLORS
+        self.colors = [color if isinstance(color, tuple) else (color, color) for color in colors]
+        self.width = width
+
+    def render(self, data, title=None, max_items=10):
+        """
+        SVG 마크업 생성
+
+        Parameters:
+        - data: 차트 데이터 (딕셔너리 리스트)
+        - title: 차트 제목 (접근성용 <title>, 화면에는 표시하지 않음)
+        - max_items: 값이 큰 순서로 표시할 최대 항목 수
+
+        Returns:
+        - SVG 문자열
+        """
+        items = self.prepare_items(data, max_items)
+        if not items:
+            return self.render_empty()
+        return self.render_items(items, title)
+
+    def render_items(self, items, title):
+        """정렬된 (이름, 값, 비율) 항목으로 SVG 생성 (하위 클래스에서 구현)"""
+        raise NotImplementedError("하위 클래스에서 구현해야 합니다.")
+
+    @staticmethod
+    def prepare_items(data, max_items):
+        """
+        값 내림차순 상위 항목과 표시 항목 합계 기준 비율
+
+        Returns:
+        - [(이름, 값, 비율), ...]
+        """
+        if not data:
+            return []
+        records = sorted(data, key=lambda d: d.get('value', 0), reverse=True)
+        if max_items is not None:
+            records = records[:max_items]
+        total = sum(d.get('value', 0) for d in records)
+        return [
+            (str(d.get('name', '')), d.get('value', 0), d.get('value', 0) / total * 100 if total else 0.0)
+            for d in records
+        ]
+
+    def render_empty(self, message="데이터가 없습니다", height=60):
+        """빈 차트 SVG"""
+        return self._svg(
+            height,
+            f'<text x="{self.width / 2:g}" y="{height / 2 + 5:g}" text-anchor="middle" '
+            f'fill="{self.MUTED_COLOR}" font-size="14">{escape(message)}</text>'
+        )
+
+    def _gradients(self, count):
+        """항목 수만큼의 색상 그라데이션 정의"""
+        stops = []
+        for index in range(min(count, len(self.colors))):
+            start, end = self.colors[index]
+            stops.append(
+                f'<linearGradient id="{{prefix}}g{index}" x1="0" y1="0" x2="1" y2="1">'
+                f'<stop offset="0" stop-color="{start}"/><stop offset="1" stop-color="{end}"/></linearGradient>'
+            )
+        return f"<defs>{''.join(stops)}</defs>"
+
+    def _fill(self, index):
+        return f'url(#{{prefix}}g{index % len(self.colors)})'
+
+    def _svg(self, height, body, title=None):
+        """viewBox와 공통 글꼴 속성을 가진 <svg> 요소 (그라데이션 id는 내용 해시로 차트마다 고유하게)"""
+        prefix = f"c{zlib.crc32(body.encode('utf-8')):08x}"
+        title_markup = f'<title>{escape(title)}</title>' if title else ''
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.width} {height:g}" '
+            f'width="100%" role="img" font-family="{escape(self.FONT_FAMILY)}" fill="{self.TEXT_COLOR}">'
+            f'{title_markup}{body.replace("{prefix}", prefix)}</svg>'
+        )
+
+
+class SvgHorizontalBarChart(SvgChartRenderer):
+    """
+    수평 막대 SVG 차트 (대시보드 createBarChart와 같은 이름 | 막대 | 값(비율) 배치)
+    """
+
+    ROW_HEIGHT = 36
+    BAR_HEIGHT = 20
+    FONT_SIZE = 13
+    LABEL_RATIO = 0.36
+    VALUE_WIDTH = 150
+
+    def render_items(self, items, title):
+        label_width = self.width * self.LABEL_RATIO
+        bar_x = label_width + 12
+        bar_width = self.width - bar_x - self.VALUE_WIDTH - 12
+        max_value = max(value for _, value, _ in items) or 1
+        height = len(items) * self.ROW_HEIGHT
+
+        rows = [self._gradients(len(items))]
+        for index, (name, value, percent) in enumerate(items):
+            y = index * self.ROW_HEIGHT
+            center = y + self.ROW_HEIGHT / 2
+            label = fit_text(name, label_width, self.FONT_SIZE)
+            fill_width = max(bar_width * value / max_value, 0)
+            rows.append(
+                f'<g><title>{escape(name)}</title>'
+                f'<text x="0" y="{center + 4.5:g}" font-size="{self.FONT_SIZE}" font-weight="500">{escape(label)}</text>'
+                f'<rect x="{bar_x:g}" y="{center - self.BAR_HEIGHT / 2:g}" width="{bar_width:g}" '
+                f'height="{self.BAR_HEIGHT}" rx="{self.BAR_HEIGHT / 2:g}" fill="{self.TRACK_COLOR}"/>'
+                f'<rect x="{bar_x:g}" y="{center - self.BAR_HEIGHT / 2:g}" width="{fill_width:.1f}" '
+                f'height="{self.BAR_HEIGHT}" rx="{self.BAR_HEIGHT / 2:g}" fill="{self._fill(index)}"/>'
+                f'<text x="{self.width}" y="{center + 4.5:g}" text-anchor="end" font-size="{self.FONT_SIZE}" '
+                f'font-weight="600">{format_number(value)} ({percent:.1f}%)</text></g>'
+            )
+        return self._svg(height, ''.join(rows), title)
+
+
+class SvgVerticalBarChart(SvgChartRenderer):
+    """
+    수직 막대 SVG 차트 (막대 위에 값, 아래에 이름)
+    """
+
+    HEIGHT = 320
+    FONT_SIZE = 12
+    LABEL_HEIGHT = 36
+    VALUE_HEIGHT = 24
+
+    def render_items(self, items, title):
+        slot = self.width / len(items)
+        bar_width = slot * 0.6
+        plot_height = self.HEIGHT - self.LABEL_HEIGHT - self.VALUE_HEIGHT
+        baseline = self.VALUE_HEIGHT + plot_height
+        max_value = max(value for _, value, _ in items) or 1
+
+        columns = [self._gradients(len(items))]
+        for index, (name, value, percent) in enumerate(items):
+            x = index * slot + (slot - bar_width) / 2
+            center = index * slot + slot / 2
+            bar_height = plot_height * value / max_value
+            label = fit_text(name, slot - 4, self.FONT_SIZE)
+            columns.append(
+                f'<g><title>{escape(name)}</title>'
+                f'<rect x="{x:.1f}" y="{baseline - bar_height:.1f}" width="{bar_width:.1f}" '
+                f'height="{bar_height:.1f}" rx="4" fill="{self._fill(index)}"/>'
+                f'<text x="{center:.1f}" y="{baseline - bar_height - 6:.1f}" text-anchor="middle" '
+                f'font-size="{self.FONT_SIZE}" font-weight="600">{format_number(value)} ({percent:.1f}%)</text>'
+                f'<text x="{center:.1f}" y="{baseline + 20:.1f}" text-anchor="middle" '
+                f'font-size="{self.FONT_SIZE}">{escape(label)}</text></g>'
+            )
+        columns.append(
+            f'<line x1="0" y1="{baseline:g}" x2="{self.width}" y2="{baseline:g}" stroke="#e2e8f0"/>'
+        )
+        return self._svg(self.HEIGHT, ''.join(columns), title)
+
+
+class SvgPieChart(SvgChartRenderer):
+    """
+    파이(도넛) SVG 차트 (오른쪽에 범례)
+    """
+
+    HEIGHT = 320
+    FONT_SIZE = 13
+
+    def __init__(self, colors=None, width=1000, hole=0.4):
+        """
+        Parameters:
+        - colors: 차트 색상
+        - width: SVG viewBox 너비
+        - hole: 가운데 구멍 비율 (0이면 파이 차트)
+        """
+        super().__init__(colors, width)
+        self.hole = hole
+
+    def render_items(self, items, title):
+        radius = self.HEIGHT / 2 - 10
+        cx = cy = self.HEIGHT / 2
+        inner = radius * self.hole
+        total = sum(value for _, value, _ in items) or 1
+
+        parts = [self._gradients(len(items))]
+        angle = -math.pi / 2
+        for index, (name, value, percent) in enumerate(items):
+            sweep = 2 * math.pi * value / total
+            parts.append(
+                f'<path d="{self._slice_path(cx, cy, radius, inner, angle, sweep)}" fill="{self._fill(index)}" '
+                f'stroke="#fff" stroke-width="2"><title>{escape(name)} {format_number(value)} ({percent:.1f}%)</title></path>'
+            )
+            angle += sweep
+
+        legend_x = self.HEIGHT + 30
+        row_height = min(28, (self.HEIGHT - 20) / len(items))
+        legend_top = (self.HEIGHT - row_height * len(items)) / 2
+        for index, (name, value, percent) in enumerate(items):
+            y = legend_top + index * row_height + row_height / 2
+            label = fit_text(name, self.width - legend_x - 200, self.FONT_SIZE)
+            parts.append(
+                f'<rect x="{legend_x:g}" y="{y - 6:.1f}" width="12" height="12" rx="3" fill="{self._fill(index)}"/>'
+                f'<text x="{legend_x + 20:g}" y="{y + 4.5:.1f}" font-size="{self.FONT_SIZE}">{escape(label)}</text>'
+                f'<text x="{self.width}" y="{y + 4.5:.1f}" text-anchor="end" font-size="{self.FONT_SIZE}" '
+                f'font-weight="600">{format_number(value)} ({percent:.1f}%)</text>'
+            )
+        return self._svg(self.HEIGHT, ''.join(parts), title)
+
+    @staticmethod
+    def _slice_path(cx, cy, radius, inner, start, sweep):
+        """조각 하나의 path 데이터 (전체 원이면 두 개의 반원으로 그림)"""
+        def point(r, a):
+            return f"{cx + r * math.cos(a):.2f} {cy + r * math.sin(a):.2f}"
+
+        if sweep >= 2 * math.pi - 1e-9:
+            # 시작점과 끝점이 같은 호는 그려지지 않으므로 반원 두 개로 원(도넛은 반대 방향 안쪽 원)을 그림
+            middle = start + math.pi
+            path = (
+                f"M {point(radius, start)} A {radius:g} {radius:g} 0 0 1 {point(radius, middle)} "
+                f"A {radius:g} {radius:g} 0 0 1 {point(radius, start)} Z"
+            )
+            if inner > 0:
+                path += (
+                    f" M {point(inner, start)} A {inner:g} {inner:g} 0 0 0 {point(inner, middle)} "
+                    f"A {inner:g} {inner:g} 0 0 0 {point(inner, start)} Z"
+                )
+            return path
+
+        end = start + sweep
+        large = 1 if sweep > math.pi else 0
+
+        if inner <= 0:
+            return f"M {cx:g} {cy:g} L {point(radius, start)} A {radius:g} {radius:g} 0 {large} 1 {point(radius, end)} Z"
+        return (
+            f"M {point(radius, start)} A {radius:g} {radius:g} 0 {large} 1 {point(radius, end)} "
+            f"L {point(inner, end)} A {inner:g} {inner:g} 0 {large} 0 {point(inner, start)} Z"
+        )
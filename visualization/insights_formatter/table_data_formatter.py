@@ -2,72 +2,54 @@
 class TableDataFormatter:
     """
     insights 데이터를 테이블이나 차트에 맞게 포맷팅하는 클래스
+    (순위 항목은 RankedItems.to_records()로 한 번만 변환)
     """
+
+    # 데이터 종류별 (섹션, 하위 키, 항목 수, 레코드 필드, 이름 최대 길이)
+    TABLE_SOURCES = {
+        'keywords': ('product_keywords', 'top_keywords', 10, ('name', 'value'), None),
+        'colors': ('colors', None, None, ('name', 'count', 'value'), None),
+        'prices': ('price_ranges', 'counts', None, ('name', 'value', 'percent', 'range'), None),
+        'channels': ('channels', 'counts', 10, ('name', 'value'), None),
+        'sizes': ('sizes', 'top_items', None, ('name', 'count', 'value'), None),
+        'materials': ('materials', None, None, ('name', 'count', 'value'), None),
+        'designs': ('designs', None, None, ('name', 'count', 'value'), None),
+        'bestsellers': ('bestsellers', 'top_products', None, ('rank', 'name', 'product', 'count', 'value'), 50),
+    }
+
     def __init__(self, insights):
         self.insights = insights
 
+    def _ranked_items(self, section, key=None):
+        """insights에서 순위 항목 조회 (없으면 None)"""
+        items = self.insights.get(section)
+        if key is not None:
+            items = items.get(key) if isinstance(items, dict) else None
+        return items
+
     def format_data(self, data_type):
-        if data_type == 'keywords':
-            if 'product_keywords' not in self.insights or 'top_keywords' not in self.insights['product_keywords']:
-                return []
-            return [{"name": k, "value": v} for k, v in self.insights['product_keywords']['top_keywords'][:10]]
-        elif data_type == 'colors':
-            if 'colors' not in self.insights:
-                return []
-            
-            # colors는 formatted가 있을 수 있음
-            if isinstance(self.insights['colors'], dict) and 'formatted' in self.insights['colors']:
-                return self.insights['colors']['formatted']
-            # 또는 colors 자체가 리스트일 수 있음
-            elif isinstance(self.insights['colors'], list):
-                return self.insights['colors']
-            return []
-        elif data_type == 'prices':
-            if 'price_ranges' not in self.insights or 'price_data' not in self.insights['price_ranges']:
-                return []
-            return self.insights['price_ranges']['price_data']
-        elif data_type == 'channels':
-            if 'channels' not in self.insights or 'channel_data' not in self.insights['channels']:
-                return []
-            return self.insights['channels']['channel_data']
-        elif data_type == 'sizes':
-            if 'sizes' not in self.insights:
-                return []
-            
-            # sizes는 formatted가 있을 수 있음
-            if isinstance(self.insights['sizes'], dict) and 'formatted' in self.insights['sizes']:
-                return self.insights['sizes']['formatted']
-            return []
-        elif data_type == 'materials':
-            if 'materials' not in self.insights:
-                return []
-            
-            # materials는 formatted가 있을 수 있음
-            if isinstance(self.insights['materials'], dict) and 'formatted' in self.insights['materials']:
-                return self.insights['materials']['formatted']
-            # 또는 materials 자체가 리스트일 수 있음
-            elif isinstance(self.insights['materials'], list):
-                return self.insights['materials']
-            return []
-        elif data_type == 'designs':
-            if 'designs' not in self.insights:
-                return []
-            
-            # designs는 formatted가 있을 수 있음
-            if isinstance(self.insights['designs'], dict) and 'formatted' in self.insights['designs']:
-                return self.insights['designs']['formatted']
-            # 또는 designs 자체가 리스트일 수 있음
-            elif isinstance(self.insights['designs'], list):
-                return self.insights['designs']
-            return []
-        elif data_type == 'bestsellers':
-            if 'bestsellers' not in self.insights or 'bestseller_data' not in self.insights['bestsellers']:
-                return []
-            return self.insights['bestsellers']['bestseller_data']
+        if data_type in self.TABLE_SOURCES:
+            section, key, limit, fields, name_length = self.TABLE_SOURCES[data_type]
+            items = self._ranked_items(section, key)
+            if items is None:
+                return []
+            if limit is not None:
+                items = items.head(limit)
+            return items.to_records(fields, name_length=name_length)
+        elif data_type == 'categories':
+            items = self._ranked_items('categories', 'counts')
+            if items is None:
+                return []
+            mapping = self.insights['categories'].get('mapping') or {}
+            return [
+                {'rank': record['rank'], 'code': record['name'], 'name': mapping.get(record['name']),
+                 'value': record['value'], 'percent': record['percent']}
+                for record in items.to_records(('rank', 'name', 'value', 'percent'))
+            ]
         elif data_type == 'auto_keywords':
             if 'auto_keywords' not in self.insights:
                 return []
             if 'style_keywords' in self.insights['auto_keywords']:
                 return [{"name": kw, "value": i+1} for i, kw in enumerate(self.insights['auto_keywords']['style_keywords'][:10])]
             return []
-        return []
\ No newline at end of file
+        return []